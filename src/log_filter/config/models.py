@@ -75,10 +75,10 @@ class FileConfig:
 
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
-        if not self.path.exists():
-            raise ValueError(f"Path does not exist: {self.path}")
-
+        # One stat for the common case; exists() only runs to word the error
         if not self.path.is_dir():
+            if not self.path.exists():
+                raise ValueError(f"Path does not exist: {self.path}")
             raise ValueError(f"Path is not a directory: {self.path}")
 
         if self.max_file_size_mb is not None and self.max_file_size_mb <= 0:
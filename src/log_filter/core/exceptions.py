@@ -43,8 +43,12 @@ class ConfigurationError(LogFilterException):
     """Exception raised for configuration validation errors."""
 
 
-class FileHandlingError(LogFilterException):
-    """Exception raised for file operation errors."""
+class FileHandlingError(LogFilterException, OSError):
+    """Exception raised for file operation errors.
+
+    Also an OSError, so callers can handle it together with the raw
+    operating system errors it usually wraps in a single ``except OSError``.
+    """
 
     def __init__(
         self, message: str, file_path: str | Path = "", cause: Exception | None = None
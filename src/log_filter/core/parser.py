@@ -1,5 +1,7 @@
 """Parser for boolean search expressions."""
 
+from functools import lru_cache
+
 from ..domain.models import ASTNode
 from .exceptions import ParseError
 from .tokenizer import Token, TokenType, tokenize
@@ -194,9 +196,13 @@ class ExpressionParser:
         return " ".join(parts)
 
 
+@lru_cache(maxsize=128)
 def parse(expression: str) -> ASTNode:
     """Parse a boolean expression into an AST.
 
+    Results are cached per expression string; the AST is built from
+    tuples, so the cached tree is safe to share between callers.
+
     Args:
         expression: The boolean expression to parse
 
@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import Any, Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LogRecord:
     """Represents a single multiline log record.
 
@@ -46,6 +46,109 @@ class LogRecord:
         return self.timestamp.time() if self.timestamp else None
 
 
+class LazyLogRecord(LogRecord):
+    """LogRecord that builds ``content`` on first access.
+
+    Records rejected by date/time/level filters never have their content
+    read, so the parser builds these to skip the join for them entirely.
+    The text comes either from a list of lines or, when ``encoding`` is set,
+    from the record's raw bytes, which are decoded once on first access.
+
+    It compares and hashes equal to a LogRecord with the same fields, and
+    ``dataclasses.replace`` works on it, passing the built ``content`` on.
+
+    Attributes:
+        lines: Lines of the record, joined with newlines into ``content``
+        raw: Raw record bytes, or a list of raw lines joined with newlines
+        encoding: Encoding of ``raw``, or None if ``lines`` holds the text
+        errors: Decoding error handling for ``raw``
+    """
+
+    __slots__ = ("lines", "raw", "encoding", "errors", "_content")
+
+    lines: Optional[list[str]]
+    raw: Optional[bytes | list[bytes]]
+    encoding: Optional[str]
+    errors: str
+    _content: str
+
+    def __init__(
+        self,
+        *,
+        first_line: str,
+        source_file: Path,
+        start_line: int,
+        end_line: int,
+        timestamp: Optional[datetime] = None,
+        level: Optional[str] = None,
+        size_bytes: int = 0,
+        lines: Optional[list[str]] = None,
+        raw: Optional[bytes | list[bytes]] = None,
+        encoding: Optional[str] = None,
+        errors: str = "replace",
+        content: Optional[str] = None,
+    ) -> None:
+        if content is not None:
+            object.__setattr__(self, "_content", content)
+        object.__setattr__(self, "lines", lines)
+        object.__setattr__(self, "raw", raw)
+        object.__setattr__(self, "encoding", encoding)
+        object.__setattr__(self, "errors", errors)
+        object.__setattr__(self, "first_line", first_line)
+        object.__setattr__(self, "source_file", source_file)
+        object.__setattr__(self, "start_line", start_line)
+        object.__setattr__(self, "end_line", end_line)
+        object.__setattr__(self, "timestamp", timestamp)
+        object.__setattr__(self, "level", level)
+        object.__setattr__(self, "size_bytes", size_bytes)
+
+    @property
+    def content(self) -> str:
+        """Return the complete record text, built on first access."""
+        try:
+            return self._content
+        except AttributeError:
+            pass
+
+        if self.encoding is not None:
+            raw = self.raw
+            if isinstance(raw, list):
+                raw = b"\n".join(raw)
+            content = (raw or b"").decode(self.encoding, self.errors)
+        else:
+            lines = self.lines or [""]
+            # Most records are a single line; no join needed
+            content = lines[0] if len(lines) == 1 else "\n".join(lines)
+        object.__setattr__(self, "_content", content)
+        return content
+
+    def __eq__(self, other: object) -> bool:
+        """Compare field by field with any LogRecord, lazy or not."""
+        if not isinstance(other, LogRecord):
+            return NotImplemented
+        return _record_fields(self) == _record_fields(other)
+
+    __hash__ = LogRecord.__hash__
+
+    def __reduce__(self) -> tuple:
+        """Pickle as a plain LogRecord with its content materialized."""
+        return (LogRecord, _record_fields(self))
+
+
+def _record_fields(record: LogRecord) -> tuple:
+    """Return the LogRecord field values of a record, in declaration order."""
+    return (
+        record.content,
+        record.first_line,
+        record.source_file,
+        record.start_line,
+        record.end_line,
+        record.timestamp,
+        record.level,
+        record.size_bytes,
+    )
+
+
 @dataclass
 class SearchResult:
     """Result of evaluating a search expression against a log record.
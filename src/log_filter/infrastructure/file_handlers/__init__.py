@@ -9,9 +9,3 @@ __all__ = [
     "LogFileHandler",
     "GzipFileHandler",
 ]
-
-__all__ = [
-    "AbstractFileHandler",
-    "LogFileHandler",
-    "GzipFileHandler",
-]
@@ -9,6 +9,7 @@ file formats (plain text, gzip, etc.). Each handler is responsible for:
 - Cleanup and resource management
 """
 
+import io
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Iterator, Optional
@@ -26,14 +27,19 @@ class AbstractFileHandler(ABC):
     Attributes:
         file_path: Path to the file being handled
         encoding: Character encoding (default: utf-8)
+        content: In-memory file content read instead of file_path, if given
     """
 
-    def __init__(self, file_path: Path, encoding: str = "utf-8") -> None:
+    def __init__(
+        self, file_path: Path, encoding: str = "utf-8", content: Optional[bytes] = None
+    ) -> None:
         """Initialize the file handler.
 
         Args:
             file_path: Path to the file to handle
             encoding: Character encoding for text files
+            content: Raw file content to read from memory instead of file_path.
+                The path is then only used as a label and is not checked.
 
         Raises:
             FileHandlingError: If file_path is not a valid file
@@ -43,6 +49,10 @@ class AbstractFileHandler(ABC):
 
         self.file_path = file_path
         self.encoding = encoding
+        self.content = content
+
+        if content is not None:
+            return
 
         if not self.file_path.exists():
             raise FileHandlingError(f"File not found: {file_path}", file_path=file_path)
@@ -66,6 +76,59 @@ class AbstractFileHandler(ABC):
             FileHandlingError: If reading fails
         """
 
+    def read_bytes(self, chunk_size: int = 1 << 20) -> Iterator[bytes]:
+        """Read the (decompressed) file content as raw byte chunks.
+
+        Lets callers split lines and decode text themselves, avoiding a
+        ``str`` object per line for content that is never looked at.
+
+        Args:
+            chunk_size: Maximum number of bytes per chunk (default: 1 MiB)
+
+        Yields:
+            Chunks of file content; lines may span chunk boundaries
+
+        Raises:
+            FileHandlingError: If reading fails
+        """
+        try:
+            with self._open_binary() as f:
+                read = f.read
+                chunk = read(chunk_size)
+                while chunk:
+                    yield chunk
+                    chunk = read(chunk_size)
+
+        except FileNotFoundError:
+            raise FileHandlingError(
+                f"File not found during read: {self.file_path}", file_path=self.file_path
+            )
+        except PermissionError as e:
+            raise FileHandlingError(
+                f"Permission denied: {self.file_path}", file_path=self.file_path, cause=e
+            )
+        except OSError as e:
+            raise FileHandlingError(
+                f"OS error reading file: {self.file_path}", file_path=self.file_path, cause=e
+            )
+        except EOFError as e:
+            raise FileHandlingError(
+                f"Unexpected end of file: {self.file_path}", file_path=self.file_path, cause=e
+            )
+
+    def _open_binary(self) -> io.BufferedIOBase:
+        """Open the file for binary reading.
+
+        Handlers for compressed formats override this to return a
+        decompressing stream.
+
+        Returns:
+            Binary file object
+        """
+        if self.content is not None:
+            return io.BytesIO(self.content)
+        return open(self.file_path, "rb")
+
     @abstractmethod
     def validate(self) -> tuple[bool, Optional[str]]:
         """Validate that the file can be read.
@@ -85,6 +148,8 @@ class AbstractFileHandler(ABC):
         Returns:
             File size in bytes
         """
+        if self.content is not None:
+            return len(self.content)
         return self.file_path.stat().st_size
 
     def get_size_mb(self) -> float:
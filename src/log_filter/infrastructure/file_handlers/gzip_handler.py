@@ -6,15 +6,23 @@ with automatic decompression and encoding handling.
 """
 
 import gzip
+import io
 import logging
+import os
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Iterator, Optional, TextIO, Union
 
 from log_filter.core.exceptions import FileHandlingError
 from log_filter.infrastructure.file_handlers.base import AbstractFileHandler
 
 logger = logging.getLogger(__name__)
 
+# Every gzip member starts with these two bytes (RFC 1952)
+GZIP_MAGIC = b"\x1f\x8b"
+
+# 10-byte header, 2-byte empty deflate block and 8-byte CRC32/ISIZE trailer
+MIN_GZIP_SIZE = 20
+
 
 class GzipFileHandler(AbstractFileHandler):
     """Handler for gzip-compressed log files.
@@ -30,7 +38,13 @@ class GzipFileHandler(AbstractFileHandler):
 
     FALLBACK_ENCODINGS = ["utf-8", "latin-1", "cp1252"]
 
-    def __init__(self, file_path: Path, encoding: str = "utf-8", errors: str = "replace") -> None:
+    def __init__(
+        self,
+        file_path: Path,
+        encoding: str = "utf-8",
+        errors: str = "replace",
+        content: Optional[bytes] = None,
+    ) -> None:
         """Initialize the gzip file handler.
 
         Args:
@@ -38,10 +52,28 @@ class GzipFileHandler(AbstractFileHandler):
             encoding: Character encoding (default: utf-8)
             errors: How to handle encoding errors (default: replace)
                    Options: 'strict', 'ignore', 'replace'
+            content: Compressed file content to read from memory instead of
+                file_path
         """
-        super().__init__(file_path, encoding)
+        super().__init__(file_path, encoding, content=content)
         self.errors = errors
 
+    def _open_text(self, encoding: str, errors: Optional[str] = None) -> TextIO:
+        """Open the gzip file (or in-memory content) for decompressed text reading.
+
+        Args:
+            encoding: Text encoding
+            errors: How to handle decoding errors
+
+        Returns:
+            Decompressing text file object
+        """
+        return gzip.open(self._gzip_source(), "rt", encoding=encoding, errors=errors)
+
+    def _gzip_source(self) -> Union[Path, io.BytesIO]:
+        """Return the compressed source: the file path, or the in-memory content."""
+        return self.file_path if self.content is None else io.BytesIO(self.content)
+
     def read_lines(self) -> Iterator[str]:
         """Read gzip file line by line with decompression.
 
@@ -52,7 +84,7 @@ class GzipFileHandler(AbstractFileHandler):
             FileHandlingError: If file cannot be read or decompressed
         """
         try:
-            with gzip.open(self.file_path, "rt", encoding=self.encoding, errors=self.errors) as f:
+            with self._open_text(self.encoding, self.errors) as f:
                 for line in f:
                     yield line.rstrip("\n\r")
 
@@ -108,23 +140,48 @@ class GzipFileHandler(AbstractFileHandler):
         Yields:
             Lines from the decompressed file
         """
-        with gzip.open(self.file_path, "rt", encoding=encoding, errors=self.errors) as f:
+        with self._open_text(encoding, self.errors) as f:
             for line in f:
                 yield line.rstrip("\n\r")
 
+    def _open_binary(self) -> io.BufferedIOBase:
+        """Open the gzip file as a decompressing binary stream.
+
+        Returns:
+            Binary file object yielding decompressed bytes
+        """
+        return gzip.open(self._gzip_source(), "rb")
+
     def validate(self) -> tuple[bool, Optional[str]]:
         """Validate that the gzip file can be read.
 
-        Attempts to open the file and read the first line to verify
-        it's a valid gzip file and is readable.
+        Checks the gzip magic bytes and minimum size without decompressing,
+        then reads the first line to verify the file is readable.
 
         Returns:
             Tuple of (is_valid, error_message)
         """
         try:
-            with gzip.open(self.file_path, "rt", encoding=self.encoding, errors=self.errors) as f:
-                # Try to read first line
-                f.readline()
+            raw = open(self.file_path, "rb") if self.content is None else io.BytesIO(self.content)
+            with raw:
+                # Reject bad magic bytes or a file too short to hold a trailer
+                # before setting up decompression
+                magic = raw.read(2)
+                if magic:
+                    if magic != GZIP_MAGIC:
+                        return (False, "Invalid or corrupted gzip file")
+                    size = (
+                        os.fstat(raw.fileno()).st_size
+                        if self.content is None
+                        else len(self.content)
+                    )
+                    if size < MIN_GZIP_SIZE:
+                        return (False, "Unexpected end of file")
+                    raw.seek(0)
+
+                with gzip.open(raw, "rt", encoding=self.encoding, errors=self.errors) as f:
+                    # Try to read first line
+                    f.readline()
             return (True, None)
 
         except PermissionError:
@@ -135,7 +192,7 @@ class GzipFileHandler(AbstractFileHandler):
             # Try fallback encodings
             for fallback_enc in self.FALLBACK_ENCODINGS:
                 try:
-                    with gzip.open(self.file_path, "rt", encoding=fallback_enc) as f:
+                    with self._open_text(fallback_enc) as f:
                         f.readline()
                     return (True, None)
                 except (UnicodeDecodeError, OSError, EOFError) as fallback_error:
@@ -5,9 +5,10 @@ This module provides a handler for reading plain text log files with
 automatic encoding detection and error recovery.
 """
 
+import io
 import logging
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Iterator, Optional, TextIO
 
 from log_filter.core.exceptions import FileHandlingError
 from log_filter.infrastructure.file_handlers.base import AbstractFileHandler
@@ -29,7 +30,13 @@ class LogFileHandler(AbstractFileHandler):
 
     FALLBACK_ENCODINGS = ["utf-8", "latin-1", "cp1252"]
 
-    def __init__(self, file_path: Path, encoding: str = "utf-8", errors: str = "replace") -> None:
+    def __init__(
+        self,
+        file_path: Path,
+        encoding: str = "utf-8",
+        errors: str = "replace",
+        content: Optional[bytes] = None,
+    ) -> None:
         """Initialize the log file handler.
 
         Args:
@@ -37,10 +44,25 @@ class LogFileHandler(AbstractFileHandler):
             encoding: Character encoding (default: utf-8)
             errors: How to handle encoding errors (default: replace)
                    Options: 'strict', 'ignore', 'replace'
+            content: Raw log content to read from memory instead of file_path
         """
-        super().__init__(file_path, encoding)
+        super().__init__(file_path, encoding, content)
         self.errors = errors
 
+    def _open_text(self, encoding: str, errors: Optional[str] = None) -> TextIO:
+        """Open the log (file or in-memory content) for text reading.
+
+        Args:
+            encoding: Encoding to decode with
+            errors: How to handle decoding errors (None = strict)
+
+        Returns:
+            Text file object
+        """
+        if self.content is not None:
+            return io.TextIOWrapper(io.BytesIO(self.content), encoding=encoding, errors=errors)
+        return open(self.file_path, "r", encoding=encoding, errors=errors)
+
     def read_lines(self) -> Iterator[str]:
         """Read log file line by line.
 
@@ -51,7 +73,7 @@ class LogFileHandler(AbstractFileHandler):
             FileHandlingError: If file cannot be read
         """
         try:
-            with open(self.file_path, "r", encoding=self.encoding, errors=self.errors) as f:
+            with self._open_text(self.encoding, self.errors) as f:
                 for line in f:
                     yield line.rstrip("\n\r")
 
@@ -97,7 +119,7 @@ class LogFileHandler(AbstractFileHandler):
         Yields:
             Lines from the file
         """
-        with open(self.file_path, "r", encoding=encoding, errors=self.errors) as f:
+        with self._open_text(encoding, self.errors) as f:
             for line in f:
                 yield line.rstrip("\n\r")
 
@@ -111,7 +133,7 @@ class LogFileHandler(AbstractFileHandler):
             Tuple of (is_valid, error_message)
         """
         try:
-            with open(self.file_path, "r", encoding=self.encoding, errors=self.errors) as f:
+            with self._open_text(self.encoding, self.errors) as f:
                 # Try to read first line
                 f.readline()
             return (True, None)
@@ -122,7 +144,7 @@ class LogFileHandler(AbstractFileHandler):
             # Try fallback encodings
             for fallback_enc in self.FALLBACK_ENCODINGS:
                 try:
-                    with open(self.file_path, "r", encoding=fallback_enc) as f:
+                    with self._open_text(fallback_enc) as f:
                         f.readline()
                     return (True, None)
                 except (UnicodeDecodeError, OSError) as fallback_error:
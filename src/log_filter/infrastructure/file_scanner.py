@@ -8,6 +8,8 @@ loading all file paths into memory.
 
 import fnmatch
 import logging
+import os
+import stat
 from pathlib import Path
 from typing import Iterator, Optional, Set
 
@@ -75,10 +77,11 @@ class FileScanner:
         if not isinstance(root_path, Path):
             root_path = Path(root_path)
 
-        if not root_path.exists():
-            raise FileHandlingError(f"Root path does not exist: {root_path}", file_path=root_path)
-
         if not root_path.is_dir():
+            if not root_path.exists():
+                raise FileHandlingError(
+                    f"Root path does not exist: {root_path}", file_path=root_path
+                )
             raise FileHandlingError(
                 f"Root path is not a directory: {root_path}", file_path=root_path
             )
@@ -107,44 +110,88 @@ class FileScanner:
         # Optimization: Use include_patterns directly in glob for much faster scanning
         if self.include_patterns:
             logger.info("Scanning for files matching patterns: %s", self.include_patterns)
-            seen_paths: Set[Path] = set()
-
-            for pattern in self.include_patterns:
-                # Construct glob pattern with recursion if needed
-                glob_pattern = f"**/{pattern}" if self.recursive else pattern
-
-                for path in self.root_path.glob(glob_pattern):
-                    # Skip directories
-                    if not path.is_file():
-                        continue
-
-                    # Skip duplicates (same file can match multiple patterns)
-                    if path in seen_paths:
-                        continue
-                    seen_paths.add(path)
-
-                    # Create metadata with filtering
-                    metadata = self._create_metadata(path)
-                    yield metadata
+            for path in self._glob_include_patterns():
+                yield self._create_metadata(path)
         else:
             # Fallback: scan all files (slower)
             logger.info("Scanning all files in %s...", self.root_path)
-            glob_pattern = "**/*" if self.recursive else "*"
+            for entry in self._walk_files():
+                yield self._create_entry_metadata(entry)
+
+    def _glob_include_patterns(self) -> Iterator[Path]:
+        """Yield files matching any include pattern, each at most once.
+
+        Yields:
+            Paths of files matching the include patterns
+        """
+        seen_paths: Set[Path] = set()
+
+        for pattern in self.include_patterns:
+            # Construct glob pattern with recursion if needed
+            glob_pattern = f"**/{pattern}" if self.recursive else pattern
 
             for path in self.root_path.glob(glob_pattern):
                 # Skip directories
                 if not path.is_file():
                     continue
 
-                # Create metadata with filtering
-                metadata = self._create_metadata(path)
-                yield metadata
+                # Skip duplicates (same file can match multiple patterns)
+                if path in seen_paths:
+                    continue
+                seen_paths.add(path)
+
+                yield path
+
+    def _walk_files(self) -> Iterator[os.DirEntry]:
+        """Yield every file under the root path using os.scandir.
+
+        Directories are visited depth-first, each directory's files before
+        its subdirectories. Like Path.glob("**/*"), symlinked directories
+        are not followed, so the walk stays inside the root path and cannot
+        loop. Unreadable directories are skipped.
+
+        Yields:
+            Directory entries of regular files (or symlinks to them); their
+            stat results are cached for metadata collection
+        """
+        pending = [str(self.root_path)]
+
+        while pending:
+            directory = pending.pop()
+            subdirs = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_file():
+                                yield entry
+                            elif self.recursive and entry.is_dir(follow_symlinks=False):
+                                subdirs.append(entry.path)
+                        except OSError:
+                            continue
+            except OSError as e:
+                logger.debug("Skipping unreadable directory %s: %s", directory, e)
+                continue
+
+            pending.extend(reversed(subdirs))
+
+    def _create_entry_metadata(self, entry: os.DirEntry) -> FileMetadata:
+        """Create FileMetadata for a scandir entry, reusing its stat result.
+
+        Args:
+            entry: Directory entry of the file
+
+        Returns:
+            FileMetadata with should_skip and skip_reason set
+        """
+        return self._create_metadata(Path(entry.path), entry)
 
-    def _create_metadata(self, path: Path) -> FileMetadata:
+    def _create_metadata(self, path: Path, entry: Optional[os.DirEntry] = None) -> FileMetadata:
         """Create FileMetadata with filtering logic.
 
         Args:
             path: Path to the file
+            entry: Directory entry for path, if it came from os.scandir
 
         Returns:
             FileMetadata with should_skip and skip_reason set
@@ -163,9 +210,10 @@ class FileScanner:
                 skip_reason="extension-not-allowed",
             )
 
-        # Get file size
+        # Get file size; the same stat result answers the regular-file check below
         try:
-            size_bytes = path.stat().st_size
+            file_stat = entry.stat() if entry is not None else path.stat()
+            size_bytes = file_stat.st_size
         except OSError as e:
             return FileMetadata(
                 path=path,
@@ -218,7 +266,7 @@ class FileScanner:
                 )
 
         # Check read access
-        if not path.is_file() or not self._is_readable(path):
+        if not stat.S_ISREG(file_stat.st_mode) or not self._is_readable(path):
             return FileMetadata(
                 path=path,
                 size_bytes=size_bytes,
@@ -6,9 +6,12 @@ to output files. Uses buffering to minimize I/O operations and
 a write lock to ensure thread safety in concurrent environments.
 """
 
+import codecs
+import errno
+import os
 import threading
 from pathlib import Path
-from typing import Optional, TextIO
+from typing import BinaryIO, Optional
 
 from log_filter.core.exceptions import FileHandlingError
 from log_filter.domain.models import LogRecord, SearchResult
@@ -21,7 +24,9 @@ class BufferedLogWriter:
     to improve performance. Thread-safe for use in concurrent processing.
 
     The writer accumulates records in a buffer and flushes to disk
-    either when the buffer is full or when explicitly requested.
+    either when the buffer is full or when explicitly requested. Each
+    flush joins and encodes the buffer once and hands the bytes straight
+    to an unbuffered file, so no text or binary I/O layer copies them again.
 
     Attributes:
         output_path: Path to output file
@@ -79,7 +84,8 @@ class BufferedLogWriter:
 
         self._buffer: list[str] = []
         self._lock = threading.Lock()
-        self._file_handle: Optional[TextIO] = None
+        self._file_handle: Optional[BinaryIO] = None
+        self._encoder: Optional[codecs.IncrementalEncoder] = None
         self._total_written = 0
 
     def __enter__(self) -> "BufferedLogWriter":
@@ -100,7 +106,9 @@ class BufferedLogWriter:
             FileHandlingError: If file cannot be opened
         """
         try:
-            self._file_handle = open(self.output_path, "w", encoding=self.encoding)
+            self._file_handle = open(self.output_path, "wb", buffering=0)
+            # Incremental, so a BOM is emitted once rather than on every flush
+            self._encoder = codecs.getincrementalencoder(self.encoding)()
         except OSError as e:
             raise FileHandlingError(
                 f"Cannot open output file: {self.output_path}", file_path=self.output_path, cause=e
@@ -193,15 +201,25 @@ class BufferedLogWriter:
         if not self._buffer:
             return
 
-        if not self._file_handle:
+        # open() sets both the file and its encoder
+        if not self._file_handle or self._encoder is None:
             raise FileHandlingError(
                 "Cannot flush: output file not open", file_path=self.output_path
             )
 
         try:
             content = "".join(self._buffer)
-            self._file_handle.write(content)
-            self._file_handle.flush()
+            if os.linesep != "\n":
+                # Same translation a text-mode file would apply
+                content = content.replace("\n", os.linesep)
+            data = memoryview(self._encoder.encode(content))
+            while data:
+                written = self._file_handle.write(data)
+                if written is None:
+                    # Unbuffered writes return None instead of blocking on a
+                    # non-blocking descriptor
+                    raise BlockingIOError(errno.EAGAIN, "Output file is not ready for writing")
+                data = data[written:]
             self._total_written += len(self._buffer)
             self._buffer.clear()
         except OSError as e:
@@ -8,9 +8,13 @@ filtering process including scanning, parsing, filtering, and writing.
 import logging
 import os
 import time
+from collections import deque
 from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Optional
 
-from log_filter.config.models import ApplicationConfig, ProcessingConfig
+from log_filter.config.models import ApplicationConfig, ProcessingConfig, SearchConfig
+from log_filter.core.evaluator import ExpressionEvaluator, compile_patterns_from_ast
 from log_filter.core.exceptions import ConfigurationError
 from log_filter.core.parser import parse
 from log_filter.domain.filters import (
@@ -20,78 +24,227 @@ from log_filter.domain.filters import (
     RecordFilter,
     TimeRangeFilter,
 )
-from log_filter.domain.models import ASTNode
+from log_filter.domain.models import ASTNode, FileMetadata
 from log_filter.infrastructure.file_scanner import FileScanner
-from log_filter.processing.record_parser import StreamingRecordParser
+from log_filter.processing.record_parser import StreamingRecordParser, is_ascii_compatible
 from log_filter.statistics.collector import StatisticsCollector
 
 logger = logging.getLogger(__name__)
 
 
-def _process_file_worker(args: tuple) -> tuple:
-    """Top-level worker function for multiprocessing.
+def _and_order_key(node: ASTNode) -> tuple[int, int]:
+    """Estimate how early a child of an AND node should be evaluated.
 
-    This function must be at module level to be picklable.
+    Single terms are cheaper to test than subtrees, and longer literals
+    tend to be rarer, so they are more likely to reject a record on their own.
 
     Args:
-        args: Tuple of (file_meta, ast, config, max_record_size_bytes, include_path)
+        node: Child of an AND node
 
     Returns:
-        Tuple of (file_meta, matches, stats_dict, matched_records, error)
+        Sort key, lower meaning evaluate first
+    """
+    if node[0] == "WORD":
+        return (0, -len(node[1]))
+    return (1, 0)
+
+
+def _order_and_terms(node: ASTNode) -> ASTNode:
+    """Return a copy of the AST with AND children in evaluation order.
+
+    AND short-circuits on its first child, so putting the child most likely
+    to fail first skips the second one on most non-matching records.
+    Children with equal estimates keep their original order.
+
+    Args:
+        node: AST node to reorder
+
+    Returns:
+        AST with the same meaning and reordered AND children
+    """
+    node_type = node[0]
+    if node_type == "WORD":
+        return node
+    children = [_order_and_terms(child) for child in node[1:]]
+    if node_type == "AND" and _and_order_key(children[1]) < _and_order_key(children[0]):
+        children.reverse()
+    return (node_type, *children)
+
+
+def _build_matcher(ast: ASTNode, search: SearchConfig) -> Callable[[str], bool]:
+    """Build a record matcher specialized for the search configuration.
+
+    The search flags are constant for the whole run, so the decision on
+    how to match is made once here instead of on every record. Regex
+    patterns are compiled up front, and substring searches have their AND
+    terms reordered so the likely rarer term is tested first. The evaluator
+    compiles the expression into closures, so no AST is walked per record,
+    and for case-insensitive substring search each record only needs a
+    single ``lower()`` call.
+
+    Args:
+        ast: Parsed search expression AST
+        search: Search configuration
+
+    Returns:
+        Callable returning True if the text matches the expression
+    """
+    if not search.use_regex:
+        # Regex terms keep their order so that invalid patterns fail where
+        # they did before; their length says little about selectivity
+        ast = _order_and_terms(ast)
+
+    compiled_patterns = (
+        compile_patterns_from_ast(ast, ignore_case=search.ignore_case) if search.use_regex else None
+    )
+    evaluator = ExpressionEvaluator(
+        ignore_case=search.ignore_case,
+        use_regex=search.use_regex,
+        word_boundary=search.word_boundary,
+        strip_quotes=search.strip_quotes,
+        compiled_patterns=compiled_patterns,
+    )
+    return evaluator.compile(ast)
+
+
+def _prefetch_file(path: Path) -> None:
+    """Hint the OS to start reading a file into the page cache.
+
+    Issues ``posix_fadvise(POSIX_FADV_WILLNEED)`` so the kernel can read
+    the file ahead asynchronously. This is a best-effort hint: it is a
+    no-op on platforms without ``posix_fadvise`` and errors are ignored.
+
+    Args:
+        path: Path to the file that will be read soon
     """
-    file_meta, ast, config, max_record_size_bytes, include_path = args
+    if not hasattr(os, "posix_fadvise"):
+        return
 
     try:
-        # Create per-process instances
-        from log_filter.core.evaluator import evaluate
-        from log_filter.domain.filters import (
-            AlwaysPassFilter,
-            CompositeFilter,
-            DateRangeFilter,
-            TimeRangeFilter,
-        )
-        from log_filter.infrastructure.file_handler_factory import FileHandlerFactory
-        from log_filter.processing.record_parser import StreamingRecordParser
-        from log_filter.statistics.collector import StatisticsCollector
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
 
-        # Create local stats collector for this process
-        stats_collector = StatisticsCollector()
-        stats_collector.start()
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
 
-        # Create record filter
-        filters: list = []
-        parser = StreamingRecordParser(
-            max_record_size_bytes=max_record_size_bytes,
-            normalize_levels=config.processing.normalize_log_levels,
-        )
 
-        if config.search.date_from or config.search.date_to:
-            date_filter = DateRangeFilter(
+# Per-process search state installed by _init_worker. The AST and
+# configuration are sent to each worker process once instead of with every
+# task, and the matcher, record parser, record filter and handler factory
+# are built once per process instead of once per file.
+_worker_state: dict = {}
+
+
+def _init_worker(
+    ast: ASTNode,
+    config: ApplicationConfig,
+    max_record_size_bytes: Optional[int],
+    include_path: bool,
+) -> None:
+    """Install the search state used by _process_file_worker.
+
+    Used as the ProcessPoolExecutor initializer, and called directly in
+    single-threaded mode.
+
+    Args:
+        ast: Parsed search expression AST
+        config: Application configuration
+        max_record_size_bytes: Maximum record size in bytes (None = unlimited)
+        include_path: Whether to prefix matched records with their file path
+    """
+    from log_filter.infrastructure.file_handler_factory import FileHandlerFactory
+
+    # The parser only caches the last parsed timestamp between records, so
+    # one instance can serve every file this process handles
+    parser = StreamingRecordParser(
+        max_record_size_bytes=max_record_size_bytes,
+        normalize_levels=config.processing.normalize_log_levels,
+    )
+
+    filters: list = []
+    if config.search.date_from or config.search.date_to:
+        filters.append(
+            DateRangeFilter(
                 date_from=config.search.date_from, date_to=config.search.date_to, parser=parser
             )
-            filters.append(date_filter)
-
-        if config.search.time_from or config.search.time_to:
-            time_filter = TimeRangeFilter(
+        )
+    if config.search.time_from or config.search.time_to:
+        filters.append(
+            TimeRangeFilter(
                 time_from=config.search.time_from, time_to=config.search.time_to, parser=parser
             )
-            filters.append(time_filter)
+        )
 
-        record_filter = CompositeFilter(*filters) if filters else AlwaysPassFilter()
+    _worker_state.clear()
+    _worker_state.update(
+        include_path=include_path,
+        # Specialize the matcher once instead of dispatching on search flags per record
+        matcher=_build_matcher(ast, config.search),
+        parser=parser,
+        record_filter=CompositeFilter(*filters) if filters else AlwaysPassFilter(),
+        handler_factory=FileHandlerFactory(),
+    )
+
+
+def _process_file_worker(args: tuple) -> tuple:
+    """Top-level worker function for multiprocessing.
+
+    This function must be at module level to be picklable. The search state
+    must have been installed with _init_worker in the calling process.
+
+    Args:
+        args: Tuple of (file_meta, next_file_meta)
+
+    Returns:
+        Tuple of (file_meta, matches, stats_dict, matched_records, error)
+    """
+    file_meta, next_file_meta = args
+
+    try:
+        include_path = _worker_state["include_path"]
+        matcher = _worker_state["matcher"]
+        parser = _worker_state["parser"]
+        record_filter = _worker_state["record_filter"]
 
         # Create handler and process file
-        handler_factory = FileHandlerFactory()
-        handler = handler_factory.create_handler(file_meta.path)
+        handler = _worker_state["handler_factory"].create_handler(file_meta.path)
+
+        # Overlap disk readahead of the next file with scanning of this one
+        if next_file_meta is not None:
+            _prefetch_file(next_file_meta.path)
 
         matched_records = []
         match_count = 0
+        # Plain local counters; the parent applies them to its collector in one batch
+        records_total = records_skipped = 0
+        bytes_total = lines_total = 0
+
+        # Scan raw bytes and decode only record text that is actually read.
+        # Strict decoding keeps the text path, which retries fallback encodings,
+        # and so do encodings whose bytes cannot be split on ASCII newlines.
+        if handler.errors == "strict" or not is_ascii_compatible(handler.encoding):
+            records = parser.parse_lines(handler.read_lines(), file_meta.path)
+        else:
+            records = parser.parse_bytes(
+                handler.read_bytes(),
+                file_meta.path,
+                encoding=handler.encoding,
+                errors=handler.errors,
+            )
 
-        for record in parser.parse_lines(handler.read_lines()):
-            stats_collector.increment_records_total()
+        for record in records:
+            records_total += 1
+            bytes_total += record.size_bytes
+            lines_total += record.line_count
 
             # Apply date/time filters
             if not record_filter.matches(record):
-                stats_collector.increment_records_skipped()
+                records_skipped += 1
                 continue
 
             # Evaluate expression
@@ -102,15 +255,7 @@ def _process_file_worker(args: tuple) -> tuple:
                 # Prepend normalized level to search text for matching
                 search_text = f"{record.level} {record.content}"
 
-            if evaluate(
-                ast,
-                search_text,
-                config.search.ignore_case,
-                config.search.use_regex,
-                config.search.word_boundary,
-                config.search.strip_quotes,
-            ):
-                stats_collector.increment_records_matched()
+            if matcher(search_text):
                 match_count += 1
 
                 # Store matched record with file path if needed
@@ -120,15 +265,14 @@ def _process_file_worker(args: tuple) -> tuple:
                 else:
                     matched_records.append(record.content)
 
-        # Get stats snapshot
-        stats_collector.stop()
+        # Keys are ProcessingStats field names for StatisticsCollector.apply_batch
         stats_dict = {
             "files_processed": 1,
-            "records_total": stats_collector.stats.records_total,
-            "records_matched": stats_collector.stats.records_matched,
-            "records_skipped": stats_collector.stats.records_skipped,
-            "total_bytes_processed": stats_collector.stats.total_bytes_processed,
-            "total_lines_processed": stats_collector.stats.total_lines_processed,
+            "records_total": records_total,
+            "records_matched": match_count,
+            "records_skipped": records_skipped,
+            "total_bytes_processed": bytes_total,
+            "total_lines_processed": lines_total,
         }
 
         return (file_meta, match_count, stats_dict, matched_records, None)
@@ -310,8 +454,8 @@ class ProcessingPipeline:
             files: List of file metadata
         """
         if self.config.output.dry_run_details:
-            # Just print summary
-            total_size_mb = sum(f.size_mb for f in files)
+            # Just print summary; sizes were already collected by the scanner
+            total_size_mb = sum(f.size_bytes for f in files) / (1024 * 1024)
             logger.info(f"Dry-run: {len(files)} files, {total_size_mb:.2f} MB total")
         else:
             # Print file list
@@ -364,10 +508,13 @@ class ProcessingPipeline:
         )
         include_path = self.config.output.include_file_path
 
-        worker_args = [
-            (file_meta, ast, self.config, max_record_size_bytes, include_path)
-            for file_meta in files
-        ]
+        # Search state goes to each process once; tasks carry only the file and,
+        # when files are processed one after another, the following file, whose
+        # pages can then be prefetched. Pool workers take files concurrently, so
+        # the next file is usually already being read by another worker.
+        init_args = (ast, self.config, max_record_size_bytes, include_path)
+        next_files = [None] * len(files) if use_multiprocessing else files[1:] + [None]
+        worker_args = list(zip(files, next_files))
 
         # Open output writer for collecting results
         output_path = self.config.output.output_file
@@ -376,19 +523,32 @@ class ProcessingPipeline:
         # Track progress
         processed_count = 0
         total_files = len(files)
-        recent_times = []  # Track last 10 file completion times
+        recent_times: deque = deque(maxlen=10)  # Track last 10 file completion times
+
+        # Throttle per-file progress so the coordinator never becomes the bottleneck
+        log_progress = logger.isEnabledFor(logging.INFO)
+        log_every = max(1, total_files // 100)
+        last_log_time = time.monotonic()
 
         if use_multiprocessing:
             # Use ProcessPoolExecutor for true parallelism
-            with ProcessPoolExecutor(max_workers=worker_count) as executor:
+            # Matches are kept per input file so output order does not depend on
+            # which worker finishes first
+            matched_by_file: list = [None] * total_files
+
+            with ProcessPoolExecutor(
+                max_workers=worker_count, initializer=_init_worker, initargs=init_args
+            ) as executor:
                 # Submit all files for processing
                 futures = {
-                    executor.submit(_process_file_worker, args): args[0] for args in worker_args
+                    executor.submit(_process_file_worker, args): index
+                    for index, args in enumerate(worker_args)
                 }
 
                 # Wait for completion and aggregate results
                 for future in as_completed(futures):
-                    file_meta = futures[future]
+                    file_index = futures[future]
+                    file_meta = files[file_index]
                     file_start_time = time.time()
                     processed_count += 1
 
@@ -401,49 +561,41 @@ class ProcessingPipeline:
                         else:
                             # Collect matched records
                             if matched_records:
-                                all_matched_records.extend(matched_records)
+                                matched_by_file[file_index] = matched_records
 
                             # Aggregate stats from worker process
                             if stats_dict:
-                                self.stats.stats.records_total += stats_dict["records_total"]
-                                self.stats.stats.records_matched += stats_dict["records_matched"]
-                                self.stats.stats.records_skipped += stats_dict["records_skipped"]
-                                self.stats.stats.total_bytes_processed += stats_dict[
-                                    "total_bytes_processed"
-                                ]
-                                self.stats.stats.total_lines_processed += stats_dict[
-                                    "total_lines_processed"
-                                ]
-                                if stats_dict["files_processed"] > 0:
-                                    self.stats.increment_files_processed()
+                                self.stats.apply_batch(stats_dict)
 
                         # Track recent file times for moving average
                         recent_times.append(file_duration)
-                        if len(recent_times) > 10:
-                            recent_times.pop(0)
-
-                        # Calculate ETA using moving average
-                        avg_time_per_file = sum(recent_times) / len(recent_times)
-                        remaining = total_files - processed_count
-                        eta_seconds = remaining * avg_time_per_file
-
-                        # Format file size
-                        file_size_str = (
-                            f"{file_meta.size_mb:.1f} MB"
-                            if file_meta.size_mb < 1024
-                            else f"{file_meta.size_mb/1024:.1f} GB"
-                        )
 
-                        # Always show progress
-                        logger.info(
-                            f"[{processed_count}/{total_files}] {file_meta.path.name} ({file_size_str}): "
-                            f"{matches} matches in {file_duration:.1f}s | ETA: {eta_seconds/60:.1f} min"
-                        )
+                        # Show progress every Nth file or at most once per second
+                        now = time.monotonic()
+                        if log_progress and (
+                            processed_count % log_every == 0
+                            or processed_count == total_files
+                            or now - last_log_time > 1.0
+                        ):
+                            last_log_time = now
+                            self._log_file_progress(
+                                file_meta,
+                                processed_count,
+                                total_files,
+                                matches,
+                                file_duration,
+                                recent_times,
+                            )
 
                     except Exception as e:
                         logger.error(f"Error processing {file_meta.path}: {e}", exc_info=True)
+
+            for matched_records in matched_by_file:
+                if matched_records:
+                    all_matched_records.extend(matched_records)
         else:
             # Single-threaded mode (for debugging or small workloads)
+            _init_worker(*init_args)
             for args in worker_args:
                 file_meta = args[0]
                 file_start_time = time.time()
@@ -464,45 +616,27 @@ class ProcessingPipeline:
 
                         # Aggregate stats
                         if stats_dict:
-                            self.stats.stats.records_total += stats_dict["records_total"]
-                            self.stats.stats.records_matched += stats_dict["records_matched"]
-                            self.stats.stats.records_skipped += stats_dict["records_skipped"]
-                            self.stats.stats.total_bytes_processed += stats_dict[
-                                "total_bytes_processed"
-                            ]
-                            self.stats.stats.total_lines_processed += stats_dict[
-                                "total_lines_processed"
-                            ]
-                            if stats_dict["files_processed"] > 0:
-                                self.stats.increment_files_processed()
-                            self.stats.stats.records_skipped += stats_dict["records_skipped"]
-                            self.stats.stats.total_bytes_processed += stats_dict["bytes_processed"]
-                            self.stats.stats.total_lines_processed += stats_dict["lines_processed"]
-                            if stats_dict["files_processed"] > 0:
-                                self.stats.increment_files_processed()
+                            self.stats.apply_batch(stats_dict)
 
                     # Track recent times
                     recent_times.append(file_duration)
-                    if len(recent_times) > 10:
-                        recent_times.pop(0)
-
-                    # Calculate ETA
-                    avg_time_per_file = sum(recent_times) / len(recent_times)
-                    remaining = total_files - processed_count
-                    eta_seconds = remaining * avg_time_per_file
-
-                    # Format file size
-                    file_size_str = (
-                        f"{file_meta.size_mb:.1f} MB"
-                        if file_meta.size_mb < 1024
-                        else f"{file_meta.size_mb/1024:.1f} GB"
-                    )
 
-                    # Show progress
-                    logger.info(
-                        f"[{processed_count}/{total_files}] {file_meta.path.name} ({file_size_str}): "
-                        f"{matches} matches in {file_duration:.1f}s | ETA: {eta_seconds/60:.1f} min"
-                    )
+                    # Show progress every Nth file or at most once per second
+                    now = time.monotonic()
+                    if log_progress and (
+                        processed_count % log_every == 0
+                        or processed_count == total_files
+                        or now - last_log_time > 1.0
+                    ):
+                        last_log_time = now
+                        self._log_file_progress(
+                            file_meta,
+                            processed_count,
+                            total_files,
+                            matches,
+                            file_duration,
+                            recent_times,
+                        )
 
                 except Exception as e:
                     logger.error(f"Error processing {file_meta.path}: {e}", exc_info=True)
@@ -525,6 +659,42 @@ class ProcessingPipeline:
         if self.config.output.show_stats:
             self._print_statistics()
 
+    @staticmethod
+    def _log_file_progress(
+        file_meta: FileMetadata,
+        processed_count: int,
+        total_files: int,
+        matches: int,
+        file_duration: float,
+        recent_times: deque,
+    ) -> None:
+        """Log progress for a completed file with an ETA estimate.
+
+        Args:
+            file_meta: Metadata of the completed file
+            processed_count: Number of files completed so far
+            total_files: Total number of files to process
+            matches: Number of matches found in the file
+            file_duration: Time spent on the file in seconds
+            recent_times: Durations of recently completed files
+        """
+        # Calculate ETA using moving average
+        avg_time_per_file = sum(recent_times) / len(recent_times)
+        remaining = total_files - processed_count
+        eta_seconds = remaining * avg_time_per_file
+
+        # Format file size
+        file_size_str = (
+            f"{file_meta.size_mb:.1f} MB"
+            if file_meta.size_mb < 1024
+            else f"{file_meta.size_mb/1024:.1f} GB"
+        )
+
+        logger.info(
+            f"[{processed_count}/{total_files}] {file_meta.path.name} ({file_size_str}): "
+            f"{matches} matches in {file_duration:.1f}s | ETA: {eta_seconds/60:.1f} min"
+        )
+
     def _print_statistics(self) -> None:
         """Print final statistics."""
         stats = self.stats.get_snapshot()
@@ -8,17 +8,95 @@ efficient processing of large log files.
 
 import logging
 import re
+import sys
 from datetime import date as dt_date
 from datetime import datetime
 from datetime import time as dt_time
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Callable, Iterator, Optional, Union, cast
 
 from log_filter.core.exceptions import RecordSizeExceededError
-from log_filter.domain.models import LogRecord
+from log_filter.domain.models import LazyLogRecord, LogRecord
 
 logger = logging.getLogger(__name__)
 
+# Source path for records parsed without a file path
+_UNKNOWN_SOURCE = Path("unknown")
+
+# Shared instances of common level names; every record with a given level
+# references the same string instead of a fresh copy from the log line
+_LEVEL_INTERN = {
+    s: sys.intern(s)
+    for s in ("ERROR", "WARN", "WARNING", "INFO", "DEBUG", "TRACE", "FATAL", "CRITICAL")
+}
+
+
+@lru_cache(maxsize=1024)
+def _parse_date_str(date_str: str) -> Optional[dt_date]:
+    """Parse a YYYY-MM-DD string, memoized since few distinct dates occur.
+
+    Args:
+        date_str: Date string in YYYY-MM-DD format
+
+    Returns:
+        datetime.date object or None if parsing fails
+    """
+    try:
+        # Fixed-width YYYY-MM-DD is sliced directly; other layouts that
+        # strptime accepts (e.g. unpadded months) still go through it
+        if (
+            len(date_str) == 10
+            and date_str[4] == "-" == date_str[7]
+            and (date_str[0:4] + date_str[5:7] + date_str[8:10]).isdigit()
+        ):
+            return dt_date(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
+        return datetime.strptime(date_str, "%Y-%m-%d").date()
+    except (ValueError, TypeError):
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _parse_time_str(time_str: str) -> Optional[dt_time]:
+    """Parse an HH:MM:SS string, memoized like _parse_date_str.
+
+    Args:
+        time_str: Time string in HH:MM:SS format
+
+    Returns:
+        datetime.time object or None if parsing fails
+    """
+    try:
+        if (
+            len(time_str) == 8
+            and time_str[2] == ":" == time_str[5]
+            and (time_str[0:2] + time_str[3:5] + time_str[6:8]).isdigit()
+        ):
+            return dt_time(int(time_str[0:2]), int(time_str[3:5]), int(time_str[6:8]))
+        return datetime.strptime(time_str, "%H:%M:%S").time()
+    except (ValueError, TypeError):
+        return None
+
+
+@lru_cache(maxsize=32)
+def is_ascii_compatible(encoding: str) -> bool:
+    """Check whether an encoding stores ASCII text as the same bytes.
+
+    Line splitting and record-start detection on raw bytes rely on this;
+    encodings such as UTF-16 put other bytes next to every ASCII character.
+
+    Args:
+        encoding: Codec name
+
+    Returns:
+        True if ASCII characters encode to their own single bytes
+    """
+    sample = "".join(map(chr, range(128)))
+    try:
+        return sample.encode(encoding) == sample.encode("ascii")
+    except (LookupError, UnicodeError):
+        return False
+
 
 class StreamingRecordParser:
     """Memory-bounded parser for multiline log records.
@@ -92,8 +170,13 @@ class StreamingRecordParser:
         self.max_record_size_bytes = max_record_size_bytes
         self.normalize_levels = normalize_levels
 
+        # One-slot timestamp cache: consecutive records often share the same second
+        self._last_date_str: Optional[str] = None
+        self._last_time_str: Optional[str] = None
+        self._last_timestamp: Optional[datetime] = None
+
     def parse_lines(
-        self, lines: Iterator[str], file_path: Optional[str] = None
+        self, lines: Iterator[str], file_path: Union[Path, str, None] = None
     ) -> Iterator[LogRecord]:
         """Parse lines into log records.
 
@@ -102,7 +185,7 @@ class StreamingRecordParser:
 
         Args:
             lines: Iterator of lines from a log file
-            file_path: Optional file path for error messages
+            file_path: Optional source file path (Path objects are used as-is)
 
         Yields:
             LogRecord objects
@@ -110,20 +193,30 @@ class StreamingRecordParser:
         Raises:
             RecordSizeExceededError: If a record exceeds max_record_size_bytes
         """
-        from pathlib import Path
-
         current_lines: list[str] = []
         current_size_bytes = 0
         first_line_info: Optional[tuple[str, str, str]] = None  # (date, time, level)
         start_line = 1
         line_number = 0
-        source_path = Path(file_path) if file_path else Path("unknown")
+        source_path = self._source_path(file_path)
+        # Bind hot attribute lookups to locals once per stream; the default
+        # layout is fixed-width, so it gets a slicing check instead of the regex
+        fast_start = self.record_start_pattern is self.DEFAULT_RECORD_START_PATTERN
+        fast_extract = self._fast_is_record_start
+        match_start = self.record_start_pattern.match
+        max_size = self.max_record_size_bytes
 
         for line in lines:
             line_number += 1
-            match = self.record_start_pattern.match(line)
+            if fast_start:
+                # Continuation lines (stack traces, wrapped text) almost never
+                # have the date separator at offset 4; reject them without a call
+                line_info = fast_extract(line) if line[4:5] == "-" else None
+            else:
+                match = match_start(line)
+                line_info = cast(tuple[str, str, str], match.group(1, 2, 3)) if match else None
 
-            if match:
+            if line_info:
                 # New record starts - yield previous record if exists
                 if current_lines:
                     end_line = line_number - 1
@@ -138,30 +231,28 @@ class StreamingRecordParser:
 
                 # Start new record
                 current_lines = [line]
-                current_size_bytes = len(line.encode("utf-8"))
-                first_line_info = (match.group(1), match.group(2), match.group(3))
+                # ASCII lines are one byte per character; skip the throwaway encode
+                current_size_bytes = len(line) if line.isascii() else len(line.encode("utf-8"))
+                first_line_info = line_info
                 start_line = line_number
 
                 # Check size limit
-                if self.max_record_size_bytes and current_size_bytes > self.max_record_size_bytes:
+                if max_size and current_size_bytes > max_size:
                     raise RecordSizeExceededError(
                         size_kb=current_size_bytes / 1024,
-                        max_size_kb=self.max_record_size_bytes // 1024,
+                        max_size_kb=max_size // 1024,
                     )
             else:
                 # Continuation of current record
                 if current_lines:
                     current_lines.append(line)
-                    current_size_bytes += len(line.encode("utf-8"))
+                    current_size_bytes += len(line) if line.isascii() else len(line.encode("utf-8"))
 
                     # Check size limit
-                    if (
-                        self.max_record_size_bytes
-                        and current_size_bytes > self.max_record_size_bytes
-                    ):
+                    if max_size and current_size_bytes > max_size:
                         raise RecordSizeExceededError(
                             size_kb=current_size_bytes / 1024,
-                            max_size_kb=self.max_record_size_bytes // 1024,
+                            max_size_kb=max_size // 1024,
                         )
 
         # Yield final record if exists
@@ -176,6 +267,213 @@ class StreamingRecordParser:
                 end_line,
             )
 
+    def parse_bytes(
+        self,
+        chunks: Iterator[bytes],
+        file_path: Union[Path, str, None] = None,
+        encoding: str = "utf-8",
+        errors: str = "replace",
+    ) -> Iterator[LogRecord]:
+        """Parse log records from a stream of raw byte chunks.
+
+        Same record semantics as parse_lines, but lines are split directly
+        from the chunks and stay bytes until a record's content is read.
+        Record sizes are the byte lengths, so no per-line encoding or
+        decoding happens in the scan. Lines end at ``\\n``, ``\\r\\n`` or
+        ``\\r``. Only valid for ASCII-compatible encodings (see
+        is_ascii_compatible); others must be decoded and use parse_lines.
+
+        Args:
+            chunks: Iterator of byte chunks, e.g. from a handler's read_bytes()
+            file_path: Optional source file path (Path objects are used as-is)
+            encoding: Encoding used to decode record text
+            errors: How to handle decoding errors
+
+        Yields:
+            LogRecord objects
+
+        Raises:
+            RecordSizeExceededError: If a record exceeds max_record_size_bytes,
+                or a single line outgrows it while still being read
+        """
+        # A record is its first line plus, only once a continuation line
+        # arrives, a list of all its lines; single-line records (the common
+        # case) never allocate the list
+        in_record = False
+        first_line = b""
+        record_lines: Optional[list[bytes]] = None
+        record_size = 0
+        first_line_info: Optional[tuple[str, str, str]] = None  # (date, time, level)
+        start_line = 1
+        line_number = 0
+        source_path = self._source_path(file_path)
+        fast_start = self.record_start_pattern is self.DEFAULT_RECORD_START_PATTERN
+        fast_extract = self._fast_is_record_start_bytes
+        match_start = self.record_start_pattern.match
+        max_size = self.max_record_size_bytes
+
+        def line_counts(head: bytes) -> bool:
+            # Before the first record only a line starting one counts towards
+            # a record; parse_lines drops the others whatever their size
+            if in_record:
+                return True
+            if fast_start:
+                return head[4:5] == b"-" and fast_extract(head) is not None
+            return match_start(head.decode(encoding, errors)) is not None
+
+        for line in self._split_byte_lines(chunks, max_size, line_counts):
+            line_number += 1
+            if fast_start:
+                line_info = fast_extract(line) if line[4:5] == b"-" else None
+            else:
+                match = match_start(line.decode(encoding, errors))
+                line_info = cast(tuple[str, str, str], match.group(1, 2, 3)) if match else None
+
+            if line_info:
+                # New record starts - yield previous record if exists
+                if in_record:
+                    yield self._create_byte_record(
+                        first_line if record_lines is None else record_lines,
+                        record_size,
+                        first_line,
+                        first_line_info,
+                        source_path,
+                        start_line,
+                        line_number - 1,
+                        encoding,
+                        errors,
+                    )
+
+                in_record = True
+                first_line = line
+                record_lines = None
+                record_size = len(line)
+                first_line_info = line_info
+                start_line = line_number
+            elif in_record:
+                # Continuation of current record
+                if record_lines is None:
+                    record_lines = [first_line, line]
+                else:
+                    record_lines.append(line)
+                record_size += len(line)
+            else:
+                continue
+
+            # Check size limit
+            if max_size and record_size > max_size:
+                raise RecordSizeExceededError(
+                    size_kb=record_size / 1024,
+                    max_size_kb=max_size // 1024,
+                )
+
+        # Yield final record if exists
+        if in_record:
+            yield self._create_byte_record(
+                first_line if record_lines is None else record_lines,
+                record_size,
+                first_line,
+                first_line_info,
+                source_path,
+                start_line,
+                line_number,
+                encoding,
+                errors,
+            )
+
+    @staticmethod
+    def _source_path(file_path: Union[Path, str, None]) -> Path:
+        """Return the record source path, reusing Path objects as given.
+
+        Args:
+            file_path: Source file as Path or str, or None if unknown
+
+        Returns:
+            Path for LogRecord.source_file
+        """
+        if isinstance(file_path, Path):
+            return file_path
+        return Path(file_path) if file_path else _UNKNOWN_SOURCE
+
+    @staticmethod
+    def _split_byte_lines(
+        chunks: Iterator[bytes],
+        max_line_bytes: Optional[int] = None,
+        limit_applies: Optional[Callable[[bytes], bool]] = None,
+    ) -> Iterator[bytes]:
+        """Split byte chunks into lines without their line endings.
+
+        Line endings are ``\\n``, ``\\r\\n`` and a bare ``\\r``, the same as
+        the universal newlines of the text path.
+
+        Args:
+            chunks: Iterator of byte chunks
+            max_line_bytes: Size limit for a single line (None = unlimited).
+                A line that outgrows it fails while it is still being read,
+                before its pieces are joined.
+            limit_applies: Called with the first piece of a line that outgrows
+                max_line_bytes; the line only fails if it returns True
+                (None = always)
+
+        Yields:
+            Lines as bytes, with their line endings removed
+
+        Raises:
+            RecordSizeExceededError: If an unfinished line exceeds max_line_bytes
+        """
+        # Pieces of a line that has not ended yet; a line spanning many
+        # chunks is joined once when it ends rather than re-concatenated
+        # with every chunk
+        pending: list[bytes] = []
+        pending_size = 0
+        # A \r at the end of a chunk may be the first half of a \r\n split
+        # across chunks, so it is held back until the next chunk arrives
+        carried_cr = False
+        for chunk in chunks:
+            if carried_cr:
+                chunk = b"\r" + chunk
+                carried_cr = False
+            if b"\r" in chunk:
+                if chunk.endswith(b"\r"):
+                    chunk = chunk[:-1]
+                    carried_cr = True
+                chunk = chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+            if b"\n" not in chunk:
+                if chunk:
+                    pending.append(chunk)
+                    pending_size += len(chunk)
+                    if (
+                        max_line_bytes
+                        and pending_size > max_line_bytes
+                        and (limit_applies is None or limit_applies(pending[0]))
+                    ):
+                        raise RecordSizeExceededError(
+                            size_kb=pending_size / 1024,
+                            max_size_kb=max_line_bytes // 1024,
+                        )
+                continue
+            parts = chunk.split(b"\n")
+            if pending:
+                if (
+                    max_line_bytes
+                    and pending_size + len(parts[0]) > max_line_bytes
+                    and (limit_applies is None or limit_applies(pending[0]))
+                ):
+                    raise RecordSizeExceededError(
+                        size_kb=(pending_size + len(parts[0])) / 1024,
+                        max_size_kb=max_line_bytes // 1024,
+                    )
+                pending.append(parts[0])
+                parts[0] = b"".join(pending)
+                pending = []
+            tail = parts.pop()
+            pending_size = len(tail)
+            if tail:
+                pending.append(tail)
+            yield from parts
+        if pending or carried_cr:
+            yield b"".join(pending)
+
     def _create_record(
         self,
         lines: list[str],
@@ -198,48 +496,132 @@ class StreamingRecordParser:
         Returns:
             LogRecord object
         """
-        from datetime import datetime
-
-        content = "\n".join(lines)
         first_line = lines[0] if lines else ""
+        timestamp, level = self._record_metadata(first_line_info, source_file)
 
-        # Extract metadata from first line if available
-        timestamp = None
-        level = None
+        # Content is joined lazily; filtered-out records never pay for it
+        return LazyLogRecord(
+            lines=lines,
+            first_line=first_line,
+            source_file=source_file,
+            start_line=start_line,
+            end_line=end_line,
+            timestamp=timestamp,
+            level=level,
+            size_bytes=size_bytes,
+        )
 
-        if first_line_info:
-            date_str, time_str, raw_level = first_line_info
-            # Normalize level (e.g., 'E' -> 'ERROR')
-            level = self._normalize_level(raw_level) if raw_level else None
-            # Try to parse the timestamp
-            try:
-                timestamp_str = f"{date_str} {time_str}"
-                # Handle various timestamp formats
-                for fmt in [
-                    "%Y-%m-%d %H:%M:%S.%f%z",
-                    "%Y-%m-%d %H:%M:%S.%f",
-                    "%Y-%m-%d %H:%M:%S",
-                ]:
-                    try:
-                        timestamp = datetime.strptime(timestamp_str.strip(), fmt)
-                        break
-                    except ValueError:
-                        continue
-            except (ValueError, TypeError, AttributeError) as parse_error:
-                # Timestamp parsing is optional; log and continue if it fails
-                logger.debug(
-                    f"Failed to parse timestamp '{date_str} {time_str}' in {source_file}: {parse_error}"
-                )
+    def _create_byte_record(
+        self,
+        raw: Union[bytes, list[bytes]],
+        size_bytes: int,
+        first_line: bytes,
+        first_line_info: Optional[tuple[str, str, str]],
+        source_file: Path,
+        start_line: int,
+        end_line: int,
+        encoding: str,
+        errors: str,
+    ) -> LogRecord:
+        """Create a LogRecord from raw record bytes.
 
-        return LogRecord(
-            content=content,
-            first_line=first_line,
+        Args:
+            raw: Raw bytes of a single-line record, or the raw lines of a
+                multi-line record
+            size_bytes: Total size in bytes
+            first_line: Raw first line of the record
+            first_line_info: Tuple of (date_str, time_str, level) from first line
+            source_file: Path to the source file
+            start_line: Starting line number (1-based)
+            end_line: Ending line number (1-based)
+            encoding: Encoding of the raw bytes
+            errors: How to handle decoding errors
+
+        Returns:
+            LogRecord object whose content is decoded on first access
+        """
+        timestamp, level = self._record_metadata(first_line_info, source_file)
+
+        return LazyLogRecord(
+            lines=None,
+            first_line=first_line.decode(encoding, errors),
             source_file=source_file,
             start_line=start_line,
             end_line=end_line,
             timestamp=timestamp,
             level=level,
             size_bytes=size_bytes,
+            raw=raw,
+            encoding=encoding,
+            errors=errors,
+        )
+
+    def _record_metadata(
+        self, first_line_info: Optional[tuple[str, str, str]], source_file: Path
+    ) -> tuple[Optional[datetime], Optional[str]]:
+        """Build the timestamp and normalized level for a record.
+
+        Args:
+            first_line_info: Tuple of (date_str, time_str, level) from first line
+            source_file: Path to the source file (for log messages)
+
+        Returns:
+            Tuple of (timestamp, level); either may be None
+        """
+        timestamp = None
+        level = None
+
+        if first_line_info:
+            date_str, time_str, raw_level = first_line_info
+            # Normalize level (e.g., 'E' -> 'ERROR')
+            level = self._normalize_level(raw_level) if raw_level else None
+            if date_str == self._last_date_str and time_str == self._last_time_str:
+                timestamp = self._last_timestamp
+            else:
+                try:
+                    timestamp = self._parse_timestamp(date_str, time_str)
+                except (ValueError, TypeError) as parse_error:
+                    # Timestamp parsing is optional; log and continue if it fails
+                    logger.debug(
+                        f"Failed to parse timestamp '{date_str} {time_str}' in {source_file}: {parse_error}"
+                    )
+                self._last_date_str = date_str
+                self._last_time_str = time_str
+                self._last_timestamp = timestamp
+
+        return timestamp, level
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_timestamp(date_str: str, time_str: str) -> datetime:
+        """Build a datetime from fixed-width date and time strings.
+
+        The record start pattern guarantees the ``YYYY-MM-DD`` and
+        ``HH:MM:SS`` layout, so the fields are sliced at known offsets
+        instead of going through ``datetime.strptime``. Results are memoized
+        so timestamps that recur out of order (e.g. interleaved sources) are
+        built once.
+
+        Args:
+            date_str: Date string in YYYY-MM-DD format
+            time_str: Time string in HH:MM:SS format
+
+        Returns:
+            Parsed datetime
+
+        Raises:
+            ValueError: If the strings are not valid date/time values
+        """
+        if len(date_str) != 10 or len(time_str) != 8:
+            raise ValueError("Expected YYYY-MM-DD and HH:MM:SS")
+
+        return datetime(
+            int(date_str[0:4]),
+            int(date_str[5:7]),
+            int(date_str[8:10]),
+            int(time_str[0:2]),
+            int(time_str[3:5]),
+            int(time_str[6:8]),
         )
 
     def _normalize_level(self, level: str) -> str:
@@ -265,10 +647,114 @@ class StreamingRecordParser:
             'WARN'
         """
         if not self.normalize_levels:
-            return level
+            return _LEVEL_INTERN.get(level) or sys.intern(level)
+
+        # Levels are usually already upper-case, so try them as-is first
+        normalized = self.LEVEL_NORMALIZATION.get(level)
+        if normalized is None:
+            normalized = self.LEVEL_NORMALIZATION.get(level.upper())
+            if normalized is None:
+                return sys.intern(level)
+        return normalized
+
+    @staticmethod
+    def _fast_is_record_start(line: str) -> Optional[tuple[str, str, str]]:
+        """Match DEFAULT_RECORD_START_PATTERN by checking fixed positions.
+
+        Equivalent to the default regex for the fixed-width prefix
+        ``YYYY-MM-DD HH:MM:SS.mmm±ZZZZ <LEVEL>`` but avoids the regex engine
+        on every line.
 
-        # Simple dictionary lookup - no custom mappings needed
-        return self.LEVEL_NORMALIZATION.get(level.upper(), level)
+        Args:
+            line: Line to check
+
+        Returns:
+            Tuple of (date, time, level) if line starts a record, None otherwise
+        """
+        n = len(line)
+        if (
+            n < 30
+            or line[4] != "-"
+            or line[7] != "-"
+            or line[10] != " "
+            or line[13] != ":"
+            or line[16] != ":"
+            or line[19] != "."
+            or line[23] not in "+-"
+        ):
+            return None
+        if not (
+            line[0:4].isdecimal()
+            and line[5:7].isdecimal()
+            and line[8:10].isdecimal()
+            and line[11:13].isdecimal()
+            and line[14:16].isdecimal()
+            and line[17:19].isdecimal()
+            and line[20:23].isdecimal()
+            and line[24:28].isdecimal()
+        ):
+            return None
+
+        # \s+ between timezone and level
+        i = 28
+        while i < n and line[i].isspace():
+            i += 1
+        if i == 28:
+            return None
+
+        # [A-Z]+ level
+        start = i
+        while i < n and "A" <= line[i] <= "Z":
+            i += 1
+        if i == start:
+            return None
+
+        return (line[0:10], line[11:19], line[start:i])
+
+    @staticmethod
+    def _fast_is_record_start_bytes(line: bytes) -> Optional[tuple[str, str, str]]:
+        """Byte-string counterpart of _fast_is_record_start.
+
+        Args:
+            line: Raw line to check
+
+        Returns:
+            Tuple of (date, time, level) if line starts a record, None otherwise
+        """
+        n = len(line)
+        if (
+            n < 30
+            or line[4] != 0x2D  # -
+            or line[7] != 0x2D  # -
+            or line[10] != 0x20  # space
+            or line[13] != 0x3A  # :
+            or line[16] != 0x3A  # :
+            or line[19] != 0x2E  # .
+            or line[23] not in b"+-"
+        ):
+            return None
+        # With the 7 separators in place, every other prefix byte is a digit
+        # exactly when deleting digits leaves only the separators
+        if len(line[:28].translate(None, b"0123456789")) != 7:
+            return None
+
+        i = 28
+        while i < n and line[i] in b" \t\n\r\x0b\x0c":
+            i += 1
+        if i == 28:
+            return None
+
+        start = i
+        while i < n and 0x41 <= line[i] <= 0x5A:  # A-Z
+            i += 1
+        if i == start:
+            return None
+
+        return (
+            line[0:10].decode("ascii"),
+            line[11:19].decode("ascii"),
+            line[start:i].decode("ascii"),
+        )
 
     def is_record_start(self, line: str) -> bool:
         """Check if a line is the start of a new record.
@@ -306,8 +792,9 @@ class StreamingRecordParser:
             datetime.date object or None if parsing fails
         """
         try:
-            return datetime.strptime(date_str, "%Y-%m-%d").date()
-        except (ValueError, TypeError):
+            return _parse_date_str(date_str)
+        except TypeError:
+            # Unhashable input cannot be looked up in the cache
             return None
 
     def parse_time(self, time_str: str) -> Optional[dt_time]:
@@ -320,6 +807,7 @@ class StreamingRecordParser:
             datetime.time object or None if parsing fails
         """
         try:
-            return datetime.strptime(time_str, "%H:%M:%S").time()
-        except (ValueError, TypeError):
+            return _parse_time_str(time_str)
+        except TypeError:
+            # Unhashable input cannot be looked up in the cache
             return None
@@ -7,6 +7,7 @@ including reading, parsing, filtering, matching, and writing results.
 
 import logging
 import time
+from typing import Callable, Optional
 
 from log_filter.config.models import ApplicationConfig
 from log_filter.core.evaluator import ExpressionEvaluator, compile_patterns_from_ast
@@ -24,6 +25,9 @@ from log_filter.utils.highlighter import TextHighlighter
 
 logger = logging.getLogger(__name__)
 
+# Records processed between batched updates to the shared statistics collector
+STATS_FLUSH_INTERVAL = 1000
+
 
 class FileWorker:
     """Worker for processing a single log file.
@@ -73,6 +77,49 @@ class FileWorker:
         self.stats_collector = stats_collector
         self.highlighter = TextHighlighter()
 
+        # Evaluator state built by configure(); reused across files
+        self._configured_for: Optional[tuple] = None
+        self._evaluator: Optional[ExpressionEvaluator] = None
+        self._patterns: list[str] = []
+        self._matcher: Optional[Callable[[str], bool]] = None
+
+    def configure(self, ast: ASTNode, config: ApplicationConfig) -> None:
+        """Build the evaluator and highlight patterns for a search.
+
+        The AST and search settings are fixed for a whole run, so regex
+        compilation and evaluator setup happen once here rather than for
+        every file. process_file calls this automatically and only rebuilds
+        when the AST or search settings change.
+
+        Args:
+            ast: Parsed search expression AST
+            config: Application configuration
+        """
+        # Pre-compile regex patterns for performance (if using regex mode)
+        compiled_patterns = None
+        if config.search.use_regex:
+            compiled_patterns = compile_patterns_from_ast(
+                ast, ignore_case=config.search.ignore_case
+            )
+
+        # Create evaluator with config settings and compiled patterns
+        self._evaluator = ExpressionEvaluator(
+            ignore_case=config.search.ignore_case,
+            use_regex=config.search.use_regex,
+            word_boundary=config.search.word_boundary,
+            strip_quotes=config.search.strip_quotes,
+            compiled_patterns=compiled_patterns,
+        )
+
+        # Extract patterns for highlighting if needed
+        self._patterns = (
+            self._evaluator.extract_patterns(ast) if config.output.highlight_matches else []
+        )
+
+        # Matcher with the AST walked once, called per record
+        self._matcher = self._evaluator.compile(ast)
+        self._configured_for = (ast, config.search, config.output.highlight_matches)
+
     def process_file(
         self,
         file_meta: FileMetadata,
@@ -97,24 +144,11 @@ class FileWorker:
         file_path = file_meta.path
         matches_found = 0
 
-        # Pre-compile regex patterns for performance (if using regex mode)
-        compiled_patterns = None
-        if config.search.use_regex:
-            compiled_patterns = compile_patterns_from_ast(
-                ast, ignore_case=config.search.ignore_case
-            )
-
-        # Create evaluator with config settings and compiled patterns
-        evaluator = ExpressionEvaluator(
-            ignore_case=config.search.ignore_case,
-            use_regex=config.search.use_regex,
-            word_boundary=config.search.word_boundary,
-            strip_quotes=config.search.strip_quotes,
-            compiled_patterns=compiled_patterns,
-        )
-
-        # Extract patterns for highlighting if needed
-        patterns = evaluator.extract_patterns(ast) if config.output.highlight_matches else []
+        if self._configured_for != (ast, config.search, config.output.highlight_matches):
+            self.configure(ast, config)
+        matcher = self._matcher
+        assert matcher is not None  # set by configure()
+        patterns = self._patterns
 
         try:
             # Create appropriate handler
@@ -131,63 +165,100 @@ class FileWorker:
             lines = handler.read_lines()
 
             # Parse into log records
-            records = self.record_parser.parse_lines(lines, str(file_path))
+            records = self.record_parser.parse_lines(lines, file_path)
 
             # Process each record with periodic progress updates
             records_processed = 0
             bytes_processed_in_file = 0
-            last_progress_time = time.time()
-
-            for record in records:
-                records_processed += 1
-                bytes_processed_in_file += record.size_bytes
-                self.stats_collector.increment_records_total()
-                self.stats_collector.add_bytes_processed(record.size_bytes)
-                self.stats_collector.add_lines_processed(record.line_count)
-
-                # Log progress every 50,000 records or every 30 seconds
-                current_time = time.time()
-                if (records_processed % 50000 == 0) or (current_time - last_progress_time > 30):
-                    mb_processed = bytes_processed_in_file / (1024 * 1024)
-                    logger.debug(
-                        f"Processing {file_path.name}: {records_processed:,} records, "
-                        f"{mb_processed:.1f} MB processed"
-                    )
-                    last_progress_time = current_time
-
-                # Apply date/time filter
-                if not self.record_filter.matches(record):
-                    self.stats_collector.increment_records_skipped()
-                    continue
-
-                # Evaluate search expression
-                matches = evaluator.evaluate(ast, record.content)
-
-                if matches:
-                    matches_found += 1
-                    self.stats_collector.increment_records_matched()
-
-                    # Apply highlighting if configured
-                    highlighted_content = None
-                    if config.output.highlight_matches and patterns:
-                        highlighted_content = self.highlighter.highlight(
-                            record.content,
-                            patterns,
-                            ignore_case=config.search.ignore_case,
-                            use_regex=config.search.use_regex,
+            last_progress_time = time.monotonic()
+
+            # Counters are accumulated locally and published in batches so the
+            # shared collector's lock is taken once per STATS_FLUSH_INTERVAL records
+            pending_total = pending_skipped = pending_matched = 0
+            pending_bytes = pending_lines = 0
+
+            try:
+                for record in records:
+                    records_processed += 1
+                    bytes_processed_in_file += record.size_bytes
+                    pending_total += 1
+                    pending_bytes += record.size_bytes
+                    pending_lines += record.line_count
+
+                    # Periodic bookkeeping: publish counters and, at most once per
+                    # interval, read the clock for the progress log
+                    if pending_total >= STATS_FLUSH_INTERVAL:
+                        self.stats_collector.apply_batch(
+                            {
+                                "records_total": pending_total,
+                                "records_skipped": pending_skipped,
+                                "records_matched": pending_matched,
+                                "total_bytes_processed": pending_bytes,
+                                "total_lines_processed": pending_lines,
+                            }
+                        )
+                        pending_total = pending_skipped = pending_matched = 0
+                        pending_bytes = pending_lines = 0
+
+                        # Log progress every 50,000 records or every 30 seconds
+                        current_time = time.monotonic()
+                        if (records_processed % 50000 == 0) or (
+                            current_time - last_progress_time > 30
+                        ):
+                            mb_processed = bytes_processed_in_file / (1024 * 1024)
+                            logger.debug(
+                                f"Processing {file_path.name}: {records_processed:,} records, "
+                                f"{mb_processed:.1f} MB processed"
+                            )
+                            last_progress_time = current_time
+
+                    # Apply date/time filter
+                    if not self.record_filter.matches(record):
+                        pending_skipped += 1
+                        continue
+
+                    # Evaluate search expression
+                    matches = matcher(record.content)
+
+                    if matches:
+                        matches_found += 1
+                        pending_matched += 1
+
+                        # Apply highlighting if configured
+                        highlighted_content = None
+                        if config.output.highlight_matches and patterns:
+                            highlighted_content = self.highlighter.highlight(
+                                record.content,
+                                patterns,
+                                ignore_case=config.search.ignore_case,
+                                use_regex=config.search.use_regex,
+                            )
+
+                        # Create search result
+                        result = SearchResult(
+                            record=record,
+                            matched=bool(patterns),
+                            match_positions=[],
+                            highlighted_content=highlighted_content,
                         )
 
-                    # Create search result
-                    result = SearchResult(
-                        record=record,
-                        matched=bool(patterns),
-                        match_positions=[],
-                        highlighted_content=highlighted_content,
-                    )
-
-                    # Write to output
-                    writer.write_result(
-                        result, source_path=file_path, use_highlight=config.output.highlight_matches
+                        # Write to output
+                        writer.write_result(
+                            result,
+                            source_path=file_path,
+                            use_highlight=config.output.highlight_matches,
+                        )
+            finally:
+                # Publish the remainder, including counts gathered before an error
+                if pending_total:
+                    self.stats_collector.apply_batch(
+                        {
+                            "records_total": pending_total,
+                            "records_skipped": pending_skipped,
+                            "records_matched": pending_matched,
+                            "total_bytes_processed": pending_bytes,
+                            "total_lines_processed": pending_lines,
+                        }
                     )
 
             self.stats_collector.increment_files_processed()
@@ -7,11 +7,16 @@ including file counts, record counts, and performance metrics.
 
 import threading
 import time
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from typing import Dict, Optional, cast
 
+# Multiplier converting bytes to megabytes; 2**-20 is exact in floating point,
+# so multiplying by it gives the same result as dividing by 1024 * 1024
+BYTES_TO_MB = 1.0 / (1024 * 1024)
 
-@dataclass
+
+@dataclass(slots=True)
 class ProcessingStats:
     """Statistics for log processing.
 
@@ -25,7 +30,7 @@ class ProcessingStats:
     files_scanned: int = 0
     files_processed: int = 0
     files_skipped: int = 0
-    skip_reasons: Dict[str, int] = field(default_factory=dict)
+    skip_reasons: Dict[str, int] = field(default_factory=Counter)
 
     # Record statistics
     records_total: int = 0
@@ -69,17 +74,34 @@ class ProcessingStats:
         Returns:
             Total MB processed (rounded to 2 decimals)
         """
-        return round(self.total_bytes_processed / (1024 * 1024), 2)
+        return round(self.total_bytes_processed * BYTES_TO_MB, 2)
+
+
+# Counter fields summed across threads when merging per-thread statistics
+_COUNTER_FIELDS = (
+    "files_scanned",
+    "files_processed",
+    "files_skipped",
+    "records_total",
+    "records_matched",
+    "records_skipped",
+    "total_bytes_processed",
+    "total_lines_processed",
+)
 
 
 class StatisticsCollector:
     """Thread-safe collector for processing statistics.
 
-    Provides atomic operations for updating statistics from multiple
-    worker threads. Uses a lock to ensure consistency.
+    Each thread updates its own ProcessingStats without locking; the
+    per-thread counters are summed when statistics are read. Start and end
+    times are single attribute stores and need no lock either. The lock is
+    only taken to register a new thread, to merge and to reset, where the
+    list of per-thread statistics is read or replaced. None of this relies
+    on the GIL, so it also holds on free-threaded builds.
 
     Attributes:
-        stats: Current processing statistics
+        stats: Merged view of the current processing statistics
 
     Example:
         >>> collector = StatisticsCollector()
@@ -92,18 +114,39 @@ class StatisticsCollector:
 
     def __init__(self) -> None:
         """Initialize the statistics collector."""
-        self.stats = ProcessingStats()
         self._lock = threading.Lock()
+        self._local = threading.local()
+        self._thread_stats: list[ProcessingStats] = []
+        self._start_time: Optional[float] = None
+        self._end_time: Optional[float] = None
+
+    @property
+    def stats(self) -> ProcessingStats:
+        """Current statistics merged across all threads."""
+        return self.merge_thread_locals()
+
+    def _local_stats(self) -> ProcessingStats:
+        """Return the calling thread's counters, registering them on first use.
+
+        Returns:
+            ProcessingStats owned by the calling thread
+        """
+        try:
+            return cast(ProcessingStats, self._local.stats)
+        except AttributeError:
+            local_stats = ProcessingStats()
+            with self._lock:
+                self._thread_stats.append(local_stats)
+            self._local.stats = local_stats
+            return local_stats
 
     def start(self) -> None:
         """Mark processing start time."""
-        with self._lock:
-            self.stats.start_time = time.time()
+        self._start_time = time.time()
 
     def stop(self) -> None:
         """Mark processing end time."""
-        with self._lock:
-            self.stats.end_time = time.time()
+        self._end_time = time.time()
 
     def increment_files_scanned(self, count: int = 1) -> None:
         """Increment scanned files count.
@@ -111,8 +154,7 @@ class StatisticsCollector:
         Args:
             count: Number of files to add (default: 1)
         """
-        with self._lock:
-            self.stats.files_scanned += count
+        self._local_stats().files_scanned += count
 
     def increment_files_processed(self, count: int = 1) -> None:
         """Increment processed files count.
@@ -120,8 +162,7 @@ class StatisticsCollector:
         Args:
             count: Number of files to add (default: 1)
         """
-        with self._lock:
-            self.stats.files_processed += count
+        self._local_stats().files_processed += count
 
     def increment_files_skipped(self, reason: str, count: int = 1) -> None:
         """Increment skipped files count with reason.
@@ -130,9 +171,9 @@ class StatisticsCollector:
             reason: Skip reason (e.g., 'size-limit', 'name-filter')
             count: Number of files to add (default: 1)
         """
-        with self._lock:
-            self.stats.files_skipped += count
-            self.stats.skip_reasons[reason] = self.stats.skip_reasons.get(reason, 0) + count
+        local_stats = self._local_stats()
+        local_stats.files_skipped += count
+        local_stats.skip_reasons[reason] += count
 
     def increment_records_total(self, count: int = 1) -> None:
         """Increment total records count.
@@ -140,8 +181,7 @@ class StatisticsCollector:
         Args:
             count: Number of records to add (default: 1)
         """
-        with self._lock:
-            self.stats.records_total += count
+        self._local_stats().records_total += count
 
     def increment_records_matched(self, count: int = 1) -> None:
         """Increment matched records count.
@@ -149,8 +189,7 @@ class StatisticsCollector:
         Args:
             count: Number of records to add (default: 1)
         """
-        with self._lock:
-            self.stats.records_matched += count
+        self._local_stats().records_matched += count
 
     def increment_records_skipped(self, count: int = 1) -> None:
         """Increment skipped records count.
@@ -158,8 +197,7 @@ class StatisticsCollector:
         Args:
             count: Number of records to add (default: 1)
         """
-        with self._lock:
-            self.stats.records_skipped += count
+        self._local_stats().records_skipped += count
 
     def add_bytes_processed(self, bytes_count: int) -> None:
         """Add to total bytes processed.
@@ -167,8 +205,7 @@ class StatisticsCollector:
         Args:
             bytes_count: Number of bytes to add
         """
-        with self._lock:
-            self.stats.total_bytes_processed += bytes_count
+        self._local_stats().total_bytes_processed += bytes_count
 
     def add_lines_processed(self, lines_count: int) -> None:
         """Add to total lines processed.
@@ -176,8 +213,46 @@ class StatisticsCollector:
         Args:
             lines_count: Number of lines to add
         """
+        self._local_stats().total_lines_processed += lines_count
+
+    def apply_batch(self, batch: Dict[str, int]) -> None:
+        """Add several counters at once to the calling thread's statistics.
+
+        Lets workers accumulate per-record counts locally and publish them
+        in bulk instead of updating once per counter per record.
+
+        Args:
+            batch: Mapping of ProcessingStats counter names (e.g. "records_total",
+                "total_bytes_processed") to amounts to add
+
+        Raises:
+            AttributeError: If a key is not a ProcessingStats field
+        """
+        local_stats = self._local_stats()
+        for name, count in batch.items():
+            setattr(local_stats, name, getattr(local_stats, name) + count)
+
+    def merge_thread_locals(self) -> ProcessingStats:
+        """Sum the per-thread counters into a single ProcessingStats.
+
+        Owning threads keep updating their counters while this runs, so the
+        result is a point-in-time view rather than a consistent cut.
+
+        Returns:
+            New ProcessingStats with totals from every thread
+        """
+        merged = ProcessingStats()
         with self._lock:
-            self.stats.total_lines_processed += lines_count
+            merged.start_time = self._start_time
+            merged.end_time = self._end_time
+            thread_stats = list(self._thread_stats)
+
+        skip_reasons = merged.skip_reasons
+        for local_stats in thread_stats:
+            for name in _COUNTER_FIELDS:
+                setattr(merged, name, getattr(merged, name) + getattr(local_stats, name))
+            skip_reasons.update(local_stats.skip_reasons.copy())
+        return merged
 
     def get_snapshot(self) -> ProcessingStats:
         """Get a snapshot of current statistics.
@@ -185,26 +260,15 @@ class StatisticsCollector:
         Returns:
             Copy of current statistics
         """
-        with self._lock:
-            # Create a copy to avoid external modification
-            return ProcessingStats(
-                files_scanned=self.stats.files_scanned,
-                files_processed=self.stats.files_processed,
-                files_skipped=self.stats.files_skipped,
-                skip_reasons=self.stats.skip_reasons.copy(),
-                records_total=self.stats.records_total,
-                records_matched=self.stats.records_matched,
-                records_skipped=self.stats.records_skipped,
-                total_bytes_processed=self.stats.total_bytes_processed,
-                total_lines_processed=self.stats.total_lines_processed,
-                start_time=self.stats.start_time,
-                end_time=self.stats.end_time,
-            )
+        return self.merge_thread_locals()
 
     def reset(self) -> None:
         """Reset all statistics to initial state."""
         with self._lock:
-            self.stats = ProcessingStats()
+            self._local = threading.local()
+            self._thread_stats = []
+            self._start_time = None
+            self._end_time = None
 
     def __repr__(self) -> str:
         """String representation of the collector."""
@@ -5,18 +5,29 @@ This module provides detailed performance metrics collection including
 processing rates, throughput, and per-file performance data.
 """
 
+import heapq
 import time
 from collections import defaultdict
 from dataclasses import dataclass, field
+from operator import attrgetter
 from pathlib import Path
-from threading import Lock
-from typing import Dict, List, Optional
+from threading import local
+from typing import Dict, List, Optional, cast
 
+from log_filter.statistics.collector import BYTES_TO_MB
 
-@dataclass
+# Sort keys for ranking files; attrgetter avoids a Python-level call per file
+_BY_PROCESSING_TIME = attrgetter("processing_time_seconds")
+_BY_FILE_SIZE = attrgetter("file_size_bytes")
+
+
+@dataclass(frozen=True, slots=True)
 class FilePerformance:
     """Performance metrics for a single file.
 
+    The file name and derived rates are computed once on construction,
+    since reports read them repeatedly per row.
+
     Attributes:
         file_path: Path to the file
         file_size_bytes: Size of file in bytes
@@ -25,6 +36,8 @@ class FilePerformance:
         processing_time_seconds: Time spent processing
         throughput_records_per_sec: Processing throughput
         throughput_mb_per_sec: Data throughput
+        match_rate: Percentage of processed records that matched
+        file_name: Final component of file_path, as shown in reports
     """
 
     file_path: str
@@ -32,31 +45,32 @@ class FilePerformance:
     records_processed: int
     records_matched: int
     processing_time_seconds: float
-
-    @property
-    def throughput_records_per_sec(self) -> float:
-        """Calculate records per second throughput."""
-        if self.processing_time_seconds > 0:
-            return self.records_processed / self.processing_time_seconds
-        return 0.0
-
-    @property
-    def throughput_mb_per_sec(self) -> float:
-        """Calculate megabytes per second throughput."""
-        if self.processing_time_seconds > 0:
-            mb = self.file_size_bytes / (1024 * 1024)
-            return mb / self.processing_time_seconds
-        return 0.0
-
-    @property
-    def match_rate(self) -> float:
-        """Calculate match rate as percentage."""
+    throughput_records_per_sec: float = field(init=False, repr=False, compare=False)
+    throughput_mb_per_sec: float = field(init=False, repr=False, compare=False)
+    match_rate: float = field(init=False, repr=False, compare=False)
+    file_name: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Compute throughput and match rate from the recorded values."""
+        seconds = self.processing_time_seconds
+        if seconds > 0:
+            records_per_sec = self.records_processed / seconds
+            mb_per_sec = self.file_size_bytes * BYTES_TO_MB / seconds
+        else:
+            records_per_sec = 0.0
+            mb_per_sec = 0.0
         if self.records_processed > 0:
-            return (self.records_matched / self.records_processed) * 100
-        return 0.0
+            match_rate = (self.records_matched / self.records_processed) * 100
+        else:
+            match_rate = 0.0
 
+        object.__setattr__(self, "throughput_records_per_sec", records_per_sec)
+        object.__setattr__(self, "throughput_mb_per_sec", mb_per_sec)
+        object.__setattr__(self, "match_rate", match_rate)
+        object.__setattr__(self, "file_name", Path(self.file_path).name)
 
-@dataclass
+
+@dataclass(slots=True)
 class PerformanceMetrics:
     """Aggregated performance metrics.
 
@@ -87,7 +101,7 @@ class PerformanceMetrics:
     def avg_mb_per_sec(self) -> float:
         """Calculate average megabytes per second."""
         if self.total_time_seconds > 0:
-            mb = self.total_bytes / (1024 * 1024)
+            mb = self.total_bytes * BYTES_TO_MB
             return mb / self.total_time_seconds
         return 0.0
 
@@ -101,7 +115,7 @@ class PerformanceMetrics:
     @property
     def total_megabytes(self) -> float:
         """Calculate total megabytes processed."""
-        return self.total_bytes / (1024 * 1024)
+        return self.total_bytes * BYTES_TO_MB
 
     def get_slowest_files(self, n: int = 10) -> List[FilePerformance]:
         """Get the n slowest files by processing time.
@@ -112,9 +126,7 @@ class PerformanceMetrics:
         Returns:
             List of slowest file performances
         """
-        return sorted(
-            self.file_performances, key=lambda x: x.processing_time_seconds, reverse=True
-        )[:n]
+        return heapq.nlargest(n, self.file_performances, key=_BY_PROCESSING_TIME)
 
     def get_largest_files(self, n: int = 10) -> List[FilePerformance]:
         """Get the n largest files by size.
@@ -125,7 +137,18 @@ class PerformanceMetrics:
         Returns:
             List of largest file performances
         """
-        return sorted(self.file_performances, key=lambda x: x.file_size_bytes, reverse=True)[:n]
+        return heapq.nlargest(n, self.file_performances, key=_BY_FILE_SIZE)
+
+
+@dataclass(slots=True)
+class _ThreadPerformance:
+    """Files completed by one thread, with running totals over them."""
+
+    file_performances: List[FilePerformance] = field(default_factory=list)
+    worker_times: Dict[str, float] = field(default_factory=lambda: defaultdict(float))
+    total_records: int = 0
+    total_bytes: int = 0
+    total_processing_time: float = 0.0
 
 
 class PerformanceTracker:
@@ -134,6 +157,11 @@ class PerformanceTracker:
     Tracks detailed performance metrics for file processing operations
     including per-file metrics and aggregated statistics.
 
+    Each thread records completed files into its own list and keeps running
+    totals over them; get_metrics() merges the per-thread state. No lock is
+    needed: threads only ever append to or copy the shared registry of
+    per-thread state, and both list operations are atomic.
+
     Example:
         >>> tracker = PerformanceTracker()
         >>> with tracker.track_file(path, size) as timer:
@@ -144,21 +172,32 @@ class PerformanceTracker:
 
     def __init__(self) -> None:
         """Initialize performance tracker."""
-        self._lock = Lock()
-        self._file_performances: List[FilePerformance] = []
-        self._worker_times: Dict[str, float] = defaultdict(float)
+        self._local = local()
+        self._thread_states: List[_ThreadPerformance] = []
         self._start_time: Optional[float] = None
         self._end_time: Optional[float] = None
 
+    def _local_state(self) -> _ThreadPerformance:
+        """Return the calling thread's state, registering it on first use.
+
+        Returns:
+            _ThreadPerformance owned by the calling thread
+        """
+        try:
+            return cast(_ThreadPerformance, self._local.state)
+        except AttributeError:
+            state = _ThreadPerformance()
+            self._thread_states.append(state)
+            self._local.state = state
+            return state
+
     def start(self) -> None:
         """Mark the start of processing."""
-        with self._lock:
-            self._start_time = time.time()
+        self._start_time = time.perf_counter()
 
     def stop(self) -> None:
         """Mark the end of processing."""
-        with self._lock:
-            self._end_time = time.time()
+        self._end_time = time.perf_counter()
 
     def track_file(
         self, file_path: Path, file_size: int, worker_id: Optional[str] = None
@@ -204,36 +243,63 @@ class PerformanceTracker:
             processing_time_seconds=processing_time,
         )
 
-        with self._lock:
-            self._file_performances.append(perf)
-            if worker_id is not None:
-                self._worker_times[worker_id] += processing_time
+        state = self._local_state()
+        state.file_performances.append(perf)
+        state.total_records += records_processed
+        state.total_bytes += file_size
+        state.total_processing_time += processing_time
+        if worker_id is not None:
+            state.worker_times[worker_id] += processing_time
 
-    def get_metrics(self) -> PerformanceMetrics:
+    def get_metrics(self, copy_files: bool = True) -> PerformanceMetrics:
         """Get aggregated performance metrics.
 
+        Totals come from running per-thread counters, so a snapshot costs
+        time proportional to the number of threads, plus the number of
+        files if they are copied. Files are grouped by the thread that
+        recorded them, each group in completion order.
+
+        Args:
+            copy_files: Whether to include per-file data; progress polls that
+                only need totals can pass False to skip copying it
+
         Returns:
             Performance metrics snapshot
         """
-        with self._lock:
-            total_files = len(self._file_performances)
-            total_records = sum(p.records_processed for p in self._file_performances)
-            total_bytes = sum(p.file_size_bytes for p in self._file_performances)
-
-            # Calculate total time
-            if self._start_time and self._end_time:
-                total_time = self._end_time - self._start_time
-            else:
-                total_time = sum(p.processing_time_seconds for p in self._file_performances)
-
-            return PerformanceMetrics(
-                total_files=total_files,
-                total_records=total_records,
-                total_bytes=total_bytes,
-                total_time_seconds=total_time,
-                file_performances=list(self._file_performances),
-                worker_times=dict(self._worker_times),
-            )
+        thread_states = self._thread_states[:]
+        start_time = self._start_time
+        end_time = self._end_time
+
+        total_files = 0
+        total_records = 0
+        total_bytes = 0
+        total_processing_time = 0.0
+        file_performances: List[FilePerformance] = []
+        worker_times: Dict[str, float] = defaultdict(float)
+        for state in thread_states:
+            total_files += len(state.file_performances)
+            total_records += state.total_records
+            total_bytes += state.total_bytes
+            total_processing_time += state.total_processing_time
+            if copy_files:
+                file_performances.extend(state.file_performances.copy())
+            for worker_id, seconds in state.worker_times.copy().items():
+                worker_times[worker_id] += seconds
+
+        # Calculate total time
+        if start_time is not None and end_time is not None:
+            total_time = end_time - start_time
+        else:
+            total_time = total_processing_time
+
+        return PerformanceMetrics(
+            total_files=total_files,
+            total_records=total_records,
+            total_bytes=total_bytes,
+            total_time_seconds=total_time,
+            file_performances=file_performances,
+            worker_times=dict(worker_times),
+        )
 
 
 class FileTimer:
@@ -266,14 +332,14 @@ class FileTimer:
 
     def __enter__(self) -> "FileTimer":
         """Enter context manager and start timing."""
-        self._start_time = time.time()
+        self._start_time = time.perf_counter()
         return self
 
     def __exit__(
         self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: object
     ) -> None:
         """Exit context manager and record metrics."""
-        processing_time = time.time() - self._start_time
+        processing_time = time.perf_counter() - self._start_time
 
         # Only record if processing completed successfully
         if exc_type is None:
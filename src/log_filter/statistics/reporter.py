@@ -5,13 +5,27 @@ This module provides formatted output of processing statistics with
 support for console output, JSON export, and CSV export.
 """
 
+import csv
 import json
+import sys
+from collections import Counter
 from datetime import datetime
+from io import StringIO
 from pathlib import Path
 from typing import Optional, TextIO
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from log_filter.statistics.collector import ProcessingStats
 
+# Rule printed above and below the console report
+_HEADER_RULE = "=" * 70
+
 
 class StatisticsReporter:
     """Reporter for formatting and displaying statistics.
@@ -34,59 +48,59 @@ class StatisticsReporter:
             stats: Statistics to print
             file: Output file (default: sys.stdout)
         """
-        import sys
-
         out = file or sys.stdout
+        # Render into a buffer and write it in one call
+        buf = StringIO()
 
         # Print header
-        print("=" * 70, file=out)
-        print("LOG FILTER PROCESSING STATISTICS", file=out)
-        print("=" * 70, file=out)
-        print(file=out)
+        print(_HEADER_RULE, file=buf)
+        print("LOG FILTER PROCESSING STATISTICS", file=buf)
+        print(_HEADER_RULE, file=buf)
+        print(file=buf)
 
         # Execution metrics
-        print("Execution:", file=out)
-        print(f"  Duration: {stats.duration_seconds:.2f}s", file=out)
+        print("Execution:", file=buf)
+        print(f"  Duration: {stats.duration_seconds:.2f}s", file=buf)
         if stats.duration_seconds > 0:
-            print(f"  Throughput: {stats.records_per_second:.0f} records/sec", file=out)
-        print(file=out)
+            print(f"  Throughput: {stats.records_per_second:.0f} records/sec", file=buf)
+        print(file=buf)
 
         # File statistics
-        print("Files:", file=out)
-        print(f"  Scanned: {stats.files_scanned}", file=out)
-        print(f"  Processed: {stats.files_processed}", file=out)
-        print(f"  Skipped: {stats.files_skipped}", file=out)
+        print("Files:", file=buf)
+        print(f"  Scanned: {stats.files_scanned}", file=buf)
+        print(f"  Processed: {stats.files_processed}", file=buf)
+        print(f"  Skipped: {stats.files_skipped}", file=buf)
 
         if stats.skip_reasons:
-            print("  Skip Reasons:", file=out)
-            for reason, count in sorted(
-                stats.skip_reasons.items(), key=lambda x: x[1], reverse=True
-            ):
-                print(f"    {reason}: {count}", file=out)
-        print(file=out)
+            print("  Skip Reasons:", file=buf)
+            for reason, count in Counter(stats.skip_reasons).most_common():
+                print(f"    {reason}: {count}", file=buf)
+        print(file=buf)
 
         # Record statistics
-        print("Records:", file=out)
-        print(f"  Total: {stats.records_total:,}", file=out)
-        print(f"  Matched: {stats.records_matched:,}", file=out)
-        print(f"  Skipped: {stats.records_skipped:,}", file=out)
+        print("Records:", file=buf)
+        print(f"  Total: {stats.records_total:,}", file=buf)
+        print(f"  Matched: {stats.records_matched:,}", file=buf)
+        print(f"  Skipped: {stats.records_skipped:,}", file=buf)
 
         if stats.records_total > 0:
             match_rate = (stats.records_matched / stats.records_total) * 100
-            print(f"  Match Rate: {match_rate:.2f}%", file=out)
-        print(file=out)
+            print(f"  Match Rate: {match_rate:.2f}%", file=buf)
+        print(file=buf)
 
         # Data volume
-        print("Data Processed:", file=out)
-        print(f"  Volume: {stats.megabytes_processed:.2f} MB", file=out)
-        print(f"  Lines: {stats.total_lines_processed:,}", file=out)
+        print("Data Processed:", file=buf)
+        print(f"  Volume: {stats.megabytes_processed:.2f} MB", file=buf)
+        print(f"  Lines: {stats.total_lines_processed:,}", file=buf)
 
         if stats.records_total > 0:
             avg_lines = stats.total_lines_processed / stats.records_total
             avg_bytes = stats.total_bytes_processed / stats.records_total
-            print(f"  Avg Record Size: {avg_bytes:.0f} bytes, {avg_lines:.1f} lines", file=out)
+            print(f"  Avg Record Size: {avg_bytes:.0f} bytes, {avg_lines:.1f} lines", file=buf)
+
+        print(_HEADER_RULE, file=buf)
 
-        print("=" * 70, file=out)
+        out.write(buf.getvalue())
 
     def export_json(self, stats: ProcessingStats, output_path: Path, pretty: bool = True) -> None:
         """Export statistics to JSON file.
@@ -137,11 +151,21 @@ class StatisticsReporter:
             },
         }
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            if pretty:
-                json.dump(data, f, indent=2)
-            else:
-                json.dump(data, f)
+        # orjson, when installed, serializes straight to bytes and is much
+        # faster than the stdlib encoder, especially when indenting; the
+        # stdlib fallback is configured to write the same bytes
+        if ORJSON_AVAILABLE:
+            content = orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+        else:
+            content = json.dumps(
+                data,
+                indent=2 if pretty else None,
+                separators=None if pretty else (",", ":"),
+                ensure_ascii=False,
+            ).encode("utf-8")
+
+        with open(output_path, "wb") as f:
+            f.write(content)
 
     def export_csv(self, stats: ProcessingStats, output_path: Path) -> None:
         """Export statistics to CSV file.
@@ -150,8 +174,6 @@ class StatisticsReporter:
             stats: Statistics to export
             output_path: Output file path
         """
-        import csv
-
         rows = [
             ["Metric", "Value"],
             ["Timestamp", datetime.now().isoformat()],
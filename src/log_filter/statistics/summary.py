@@ -5,14 +5,23 @@ This module provides comprehensive summary reports combining
 statistics, performance metrics, and processing results.
 """
 
+import sys
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime
+from io import StringIO
 from pathlib import Path
 from typing import List, Optional, TextIO
 
-from log_filter.statistics.collector import ProcessingStats
+from log_filter.statistics.collector import BYTES_TO_MB, ProcessingStats
 from log_filter.statistics.performance import FilePerformance, PerformanceMetrics
 
+# Report rules, built once instead of on every header, section and table
+_HEADER_RULE = "=" * 70
+_SECTION_RULE = "─" * 65
+_TABLE_HEADER_TAIL = f" | {'Size (MB)':>10} | {'Time (s)':>10} | {'Records':>10} | {'Rate':>12}"
+_TABLE_RULE_TAIL = f"-+-{'-' * 10}-+-{'-' * 10}-+-{'-' * 10}-+-{'-' * 12}"
+
 
 @dataclass
 class ProcessingSummary:
@@ -55,121 +64,121 @@ class SummaryReportGenerator:
             file: Output file (default: sys.stdout)
             show_top_files: Number of top files to show
         """
-        import sys
-
         out = file or sys.stdout
+        # Render into a buffer and write it in one call
+        buf = StringIO()
 
         stats = summary.statistics
         perf = summary.performance
 
         # Print header
-        self._print_header(out, "PROCESSING SUMMARY REPORT")
-        print(file=out)
+        self._print_header(buf, "PROCESSING SUMMARY REPORT")
+        print(file=buf)
 
         # Timestamp
-        print(f"Report Generated: {summary.timestamp.strftime('%Y-%m-%d %H:%M:%S')}", file=out)
-        print(file=out)
+        print(f"Report Generated: {summary.timestamp.strftime('%Y-%m-%d %H:%M:%S')}", file=buf)
+        print(file=buf)
 
         # Overall execution
-        self._print_section(out, "EXECUTION")
-        print(f"  Duration: {stats.duration_seconds:.2f}s", file=out)
-        print(f"  Start Time: {stats.start_time}", file=out)
-        print(f"  End Time: {stats.end_time}", file=out)
-        print(file=out)
+        self._print_section(buf, "EXECUTION")
+        print(f"  Duration: {stats.duration_seconds:.2f}s", file=buf)
+        print(f"  Start Time: {stats.start_time}", file=buf)
+        print(f"  End Time: {stats.end_time}", file=buf)
+        print(file=buf)
 
         # Files summary
-        self._print_section(out, "FILES")
-        print(f"  Total Scanned: {stats.files_scanned}", file=out)
+        self._print_section(buf, "FILES")
+        print(f"  Total Scanned: {stats.files_scanned}", file=buf)
         print(
             f"  Processed: {stats.files_processed} ({self._percentage(stats.files_processed, stats.files_scanned)})",
-            file=out,
+            file=buf,
         )
         print(
             f"  Skipped: {stats.files_skipped} ({self._percentage(stats.files_skipped, stats.files_scanned)})",
-            file=out,
+            file=buf,
         )
 
         if stats.skip_reasons:
-            print("  Skip Breakdown:", file=out)
-            for reason, count in sorted(
-                stats.skip_reasons.items(), key=lambda x: x[1], reverse=True
-            ):
-                print(f"    - {reason}: {count}", file=out)
-        print(file=out)
+            print("  Skip Breakdown:", file=buf)
+            for reason, count in Counter(stats.skip_reasons).most_common():
+                print(f"    - {reason}: {count}", file=buf)
+        print(file=buf)
 
         # Records summary
-        self._print_section(out, "RECORDS")
-        print(f"  Total Processed: {stats.records_total:,}", file=out)
+        self._print_section(buf, "RECORDS")
+        print(f"  Total Processed: {stats.records_total:,}", file=buf)
         print(
             f"  Matched: {stats.records_matched:,} ({self._percentage(stats.records_matched, stats.records_total)})",
-            file=out,
+            file=buf,
         )
         print(
             f"  Skipped: {stats.records_skipped:,} ({self._percentage(stats.records_skipped, stats.records_total)})",
-            file=out,
+            file=buf,
         )
-        print(file=out)
+        print(file=buf)
 
         # Data volume
-        self._print_section(out, "DATA VOLUME")
+        self._print_section(buf, "DATA VOLUME")
         print(
             f"  Total Bytes: {stats.total_bytes_processed:,} bytes ({stats.megabytes_processed:.2f} MB)",
-            file=out,
+            file=buf,
         )
-        print(f"  Total Lines: {stats.total_lines_processed:,}", file=out)
+        print(f"  Total Lines: {stats.total_lines_processed:,}", file=buf)
 
         if stats.records_total > 0:
             avg_record_size = stats.total_bytes_processed / stats.records_total
             avg_record_lines = stats.total_lines_processed / stats.records_total
             print(
-                f"  Avg Record: {avg_record_size:.0f} bytes, {avg_record_lines:.1f} lines", file=out
+                f"  Avg Record: {avg_record_size:.0f} bytes, {avg_record_lines:.1f} lines", file=buf
             )
-        print(file=out)
+        print(file=buf)
 
         # Performance metrics
-        self._print_section(out, "PERFORMANCE")
-        print(f"  Throughput: {stats.records_per_second:.0f} records/sec", file=out)
-        print(f"  Bandwidth: {perf.avg_mb_per_sec:.2f} MB/sec", file=out)
-        print(f"  Avg File Time: {perf.avg_file_time_seconds:.3f}s", file=out)
+        self._print_section(buf, "PERFORMANCE")
+        print(f"  Throughput: {stats.records_per_second:.0f} records/sec", file=buf)
+        print(f"  Bandwidth: {perf.avg_mb_per_sec:.2f} MB/sec", file=buf)
+        print(f"  Avg File Time: {perf.avg_file_time_seconds:.3f}s", file=buf)
 
         if perf.worker_times:
-            print(f"  Workers Used: {len(perf.worker_times)}", file=out)
+            print(f"  Workers Used: {len(perf.worker_times)}", file=buf)
             total_worker_time = sum(perf.worker_times.values())
-            print(f"  Total Worker Time: {total_worker_time:.2f}s", file=out)
+            print(f"  Total Worker Time: {total_worker_time:.2f}s", file=buf)
             if perf.total_time_seconds > 0:
                 efficiency = (total_worker_time / perf.total_time_seconds) * 100
-                print(f"  Parallelization Efficiency: {efficiency:.1f}%", file=out)
-        print(file=out)
+                print(f"  Parallelization Efficiency: {efficiency:.1f}%", file=buf)
+        print(file=buf)
 
         # Top files by processing time
         if perf.file_performances and show_top_files > 0:
-            self._print_section(out, f"TOP {show_top_files} SLOWEST FILES")
+            self._print_section(buf, f"TOP {show_top_files} SLOWEST FILES")
             slowest = perf.get_slowest_files(show_top_files)
-            self._print_file_table(out, slowest)
-            print(file=out)
+            self._print_file_table(buf, slowest)
+            print(file=buf)
 
         # Top files by size
         if perf.file_performances and show_top_files > 0:
-            self._print_section(out, f"TOP {show_top_files} LARGEST FILES")
+            self._print_section(buf, f"TOP {show_top_files} LARGEST FILES")
             largest = perf.get_largest_files(show_top_files)
-            self._print_file_table(out, largest)
-            print(file=out)
+            self._print_file_table(buf, largest)
+            print(file=buf)
 
         # Errors and warnings
         if summary.errors:
-            self._print_section(out, f"ERRORS ({len(summary.errors)})")
+            self._print_section(buf, f"ERRORS ({len(summary.errors)})")
             for i, error in enumerate(summary.errors, 1):
-                print(f"  {i}. {error}", file=out)
-            print(file=out)
+                print(f"  {i}. {error}", file=buf)
+            print(file=buf)
 
         if summary.warnings:
-            self._print_section(out, f"WARNINGS ({len(summary.warnings)})")
+            self._print_section(buf, f"WARNINGS ({len(summary.warnings)})")
             for i, warning in enumerate(summary.warnings, 1):
-                print(f"  {i}. {warning}", file=out)
-            print(file=out)
+                print(f"  {i}. {warning}", file=buf)
+            print(file=buf)
 
         # Footer
-        self._print_header(out, "END OF REPORT")
+        self._print_header(buf, "END OF REPORT")
+
+        out.write(buf.getvalue())
 
     def generate_markdown_report(
         self, summary: ProcessingSummary, output_path: Path, show_top_files: int = 10
@@ -184,86 +193,93 @@ class SummaryReportGenerator:
         stats = summary.statistics
         perf = summary.performance
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            # Header
-            f.write("# Log Processing Summary Report\n\n")
-            f.write(f"**Generated:** {summary.timestamp.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        # Render into a buffer and write the file in one call
+        f = StringIO()
 
-            # Execution
-            f.write("## Execution\n\n")
-            f.write(f"- **Duration:** {stats.duration_seconds:.2f}s\n")
-            f.write(f"- **Start Time:** {stats.start_time}\n")
-            f.write(f"- **End Time:** {stats.end_time}\n\n")
+        # Header
+        f.write("# Log Processing Summary Report\n\n")
+        f.write(f"**Generated:** {summary.timestamp.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+
+        # Execution
+        f.write("## Execution\n\n")
+        f.write(f"- **Duration:** {stats.duration_seconds:.2f}s\n")
+        f.write(f"- **Start Time:** {stats.start_time}\n")
+        f.write(f"- **End Time:** {stats.end_time}\n\n")
+
+        # Files
+        f.write("## Files\n\n")
+        f.write(f"- **Scanned:** {stats.files_scanned}\n")
+        f.write(
+            f"- **Processed:** {stats.files_processed} ({self._percentage(stats.files_processed, stats.files_scanned)})\n"
+        )
+        f.write(
+            f"- **Skipped:** {stats.files_skipped} ({self._percentage(stats.files_skipped, stats.files_scanned)})\n\n"
+        )
 
-            # Files
-            f.write("## Files\n\n")
-            f.write(f"- **Scanned:** {stats.files_scanned}\n")
-            f.write(
-                f"- **Processed:** {stats.files_processed} ({self._percentage(stats.files_processed, stats.files_scanned)})\n"
-            )
-            f.write(
-                f"- **Skipped:** {stats.files_skipped} ({self._percentage(stats.files_skipped, stats.files_scanned)})\n\n"
-            )
+        if stats.skip_reasons:
+            f.write("### Skip Reasons\n\n")
+            for reason, count in Counter(stats.skip_reasons).most_common():
+                f.write(f"- {reason}: {count}\n")
+            f.write("\n")
+
+        # Records
+        f.write("## Records\n\n")
+        f.write(f"- **Total:** {stats.records_total:,}\n")
+        f.write(
+            f"- **Matched:** {stats.records_matched:,} ({self._percentage(stats.records_matched, stats.records_total)})\n"
+        )
+        f.write(f"- **Skipped:** {stats.records_skipped:,}\n\n")
+
+        # Performance
+        f.write("## Performance\n\n")
+        f.write(f"- **Throughput:** {stats.records_per_second:.0f} records/sec\n")
+        f.write(f"- **Bandwidth:** {perf.avg_mb_per_sec:.2f} MB/sec\n")
+        f.write(f"- **Avg File Time:** {perf.avg_file_time_seconds:.3f}s\n\n")
 
-            if stats.skip_reasons:
-                f.write("### Skip Reasons\n\n")
-                for reason, count in sorted(
-                    stats.skip_reasons.items(), key=lambda x: x[1], reverse=True
-                ):
-                    f.write(f"- {reason}: {count}\n")
-                f.write("\n")
-
-            # Records
-            f.write("## Records\n\n")
-            f.write(f"- **Total:** {stats.records_total:,}\n")
+        # Top files
+        if perf.file_performances and show_top_files > 0:
+            f.write(f"## Top {show_top_files} Slowest Files\n\n")
+            f.write("| File | Size (MB) | Time (s) | Records | Throughput |\n")
+            f.write("|------|-----------|----------|---------|------------|\n")
             f.write(
-                f"- **Matched:** {stats.records_matched:,} ({self._percentage(stats.records_matched, stats.records_total)})\n"
+                "".join(
+                    [
+                        f"| {fp.file_name} | {fp.file_size_bytes * BYTES_TO_MB:.2f} | {fp.processing_time_seconds:.3f} | {fp.records_processed:,} | {fp.throughput_records_per_sec:.0f} rec/s |\n"
+                        for fp in perf.get_slowest_files(show_top_files)
+                    ]
+                )
             )
-            f.write(f"- **Skipped:** {stats.records_skipped:,}\n\n")
-
-            # Performance
-            f.write("## Performance\n\n")
-            f.write(f"- **Throughput:** {stats.records_per_second:.0f} records/sec\n")
-            f.write(f"- **Bandwidth:** {perf.avg_mb_per_sec:.2f} MB/sec\n")
-            f.write(f"- **Avg File Time:** {perf.avg_file_time_seconds:.3f}s\n\n")
-
-            # Top files
-            if perf.file_performances and show_top_files > 0:
-                f.write(f"## Top {show_top_files} Slowest Files\n\n")
-                f.write("| File | Size (MB) | Time (s) | Records | Throughput |\n")
-                f.write("|------|-----------|----------|---------|------------|\n")
-                for fp in perf.get_slowest_files(show_top_files):
-                    size_mb = fp.file_size_bytes / (1024 * 1024)
-                    f.write(
-                        f"| {Path(fp.file_path).name} | {size_mb:.2f} | {fp.processing_time_seconds:.3f} | {fp.records_processed:,} | {fp.throughput_records_per_sec:.0f} rec/s |\n"
-                    )
-                f.write("\n")
-
-            # Errors
-            if summary.errors:
-                f.write(f"## Errors ({len(summary.errors)})\n\n")
-                for i, error in enumerate(summary.errors, 1):
-                    f.write(f"{i}. {error}\n")
-                f.write("\n")
-
-            # Warnings
-            if summary.warnings:
-                f.write(f"## Warnings ({len(summary.warnings)})\n\n")
-                for i, warning in enumerate(summary.warnings, 1):
-                    f.write(f"{i}. {warning}\n")
-                f.write("\n")
+            f.write("\n")
+
+        # Errors
+        if summary.errors:
+            f.write(f"## Errors ({len(summary.errors)})\n\n")
+            for i, error in enumerate(summary.errors, 1):
+                f.write(f"{i}. {error}\n")
+            f.write("\n")
+
+        # Warnings
+        if summary.warnings:
+            f.write(f"## Warnings ({len(summary.warnings)})\n\n")
+            for i, warning in enumerate(summary.warnings, 1):
+                f.write(f"{i}. {warning}\n")
+            f.write("\n")
+
+        with open(output_path, "w", encoding="utf-8") as out:
+            out.write(f.getvalue())
 
     @staticmethod
     def _print_header(file: TextIO, title: str) -> None:
         """Print a section header."""
-        print("=" * 70, file=file)
+        print(_HEADER_RULE, file=file)
         print(title.center(70), file=file)
-        print("=" * 70, file=file)
+        print(_HEADER_RULE, file=file)
 
     @staticmethod
     def _print_section(file: TextIO, title: str) -> None:
         """Print a section title."""
-        print(f"─── {title} {'─' * (65 - len(title))}", file=file)
+        # Slicing the rule pads titles to a fixed width (no padding past 65)
+        print(f"─── {title} {_SECTION_RULE[len(title):]}", file=file)
 
     @staticmethod
     def _percentage(part: int, total: int) -> str:
@@ -280,31 +296,24 @@ class SummaryReportGenerator:
             return
 
         # Calculate column widths
-        max_name_width = min(40, max(len(Path(p.file_path).name) for p in performances))
+        names = [p.file_name for p in performances]
+        max_name_width = min(40, max(map(len, names)))
 
         # Header
-        print(
-            f"  {'File':<{max_name_width}} | {'Size (MB)':>10} | {'Time (s)':>10} | {'Records':>10} | {'Rate':>12}",
-            file=file,
-        )
-        print(
-            f"  {'-' * max_name_width}-+-{'-' * 10}-+-{'-' * 10}-+-{'-' * 10}-+-{'-' * 12}",
-            file=file,
-        )
+        print(f"  {'File':<{max_name_width}}{_TABLE_HEADER_TAIL}", file=file)
+        print(f"  {'-' * max_name_width}{_TABLE_RULE_TAIL}", file=file)
 
         # Rows
-        for perf in performances:
-            name = Path(perf.file_path).name
+        rows = []
+        for perf, name in zip(performances, names):
             if len(name) > max_name_width:
                 name = "..." + name[-(max_name_width - 3) :]
 
-            size_mb = perf.file_size_bytes / (1024 * 1024)
-
-            print(
+            rows.append(
                 f"  {name:<{max_name_width}} | "
-                f"{size_mb:>10.2f} | "
+                f"{perf.file_size_bytes * BYTES_TO_MB:>10.2f} | "
                 f"{perf.processing_time_seconds:>10.3f} | "
                 f"{perf.records_processed:>10,} | "
-                f"{perf.throughput_records_per_sec:>10.0f} r/s",
-                file=file,
+                f"{perf.throughput_records_per_sec:>10.0f} r/s"
             )
+        print("\n".join(rows), file=file)
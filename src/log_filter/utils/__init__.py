@@ -1,7 +1,8 @@
 """Utility functions and helpers."""
 
-from .highlighter import TextHighlighter, highlight_text
+from .highlighter import TextHighlighter, highlight_text, highlight_text_many
 from .logging import (
+    BufferedFileHandler,
     LoggerAdapter,
     configure_component_logging,
     configure_logging,
@@ -15,9 +16,11 @@ __all__ = [
     "configure_component_logging",
     "get_logger",
     "LoggerAdapter",
+    "BufferedFileHandler",
     "create_file_logger",
     "ProgressTracker",
     "ProgressCounter",
     "TextHighlighter",
     "highlight_text",
+    "highlight_text_many",
 ]
@@ -6,7 +6,14 @@ in text using configurable markers.
 """
 
 import re
-from typing import List, Pattern
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Pattern, Tuple
+
+# Backreference by group number (\1 or \g<1>), which combining patterns would renumber
+_NUMBERED_BACKREFERENCE = re.compile(r"\\[1-9]|\\g<\d")
+
+# Unbound Match.span, mapped over finditer() to get the spans to highlight
+_MATCH_SPAN = re.Match.span
 
 
 class TextHighlighter:
@@ -42,6 +49,14 @@ class TextHighlighter:
         """
         self.start_marker = start_marker
         self.end_marker = end_marker
+        # Compiled patterns keyed by (pattern(s), ignore_case); None marks an
+        # invalid regex so it is not recompiled on every call
+        self._compiled: Dict[Tuple[object, bool], Optional[Pattern[str]]] = {}
+        # Regexes to apply for a list of regex patterns, keyed the same way
+        self._regex_sets: Dict[Tuple[Tuple[str, ...], bool], Tuple[Pattern[str], ...]] = {}
+        # Lower-cased substring patterns for the case-insensitive prefilter;
+        # None if a pattern is not ASCII
+        self._ascii_needles: Dict[Tuple[str, ...], Optional[Tuple[str, ...]]] = {}
 
     def highlight(
         self, text: str, patterns: List[str], ignore_case: bool = False, use_regex: bool = False
@@ -58,84 +73,269 @@ class TextHighlighter:
             Text with patterns wrapped in markers
 
         Note:
-            - Patterns are highlighted in order provided
-            - Already-highlighted text is not re-highlighted
-            - Empty patterns are skipped
+            - Substring patterns are found in a single left-to-right pass;
+              where several start at the same position the longest wins,
+              and overlapping occurrences are not highlighted twice
+            - Regex patterns are likewise combined into one pass; where
+              several match at the same position the earliest listed wins
+            - Invalid regex patterns and empty patterns are skipped
         """
         if not patterns or not text:
             return text
 
-        result = text
+        active = tuple([pattern for pattern in patterns if pattern])
+        if not active:
+            return text
+
+        if not use_regex:
+            return self._highlight_substrings(text, active, ignore_case)
+        return self._highlight_regexes(text, self._get_regex_set(active, ignore_case))
 
-        for pattern in patterns:
-            if not pattern:
-                continue
+    def highlight_many(
+        self,
+        texts: Iterable[str],
+        patterns: List[str],
+        ignore_case: bool = False,
+        use_regex: bool = False,
+    ) -> Iterator[str]:
+        """Highlight the same patterns in each of several texts.
 
-            if use_regex:
-                result = self._highlight_regex(result, pattern, ignore_case)
-            else:
-                result = self._highlight_substring(result, pattern, ignore_case)
+        Pattern filtering and the lookup of compiled patterns happen once
+        for the whole batch rather than once per text.
 
-        return result
+        Args:
+            texts: Texts to highlight
+            patterns: List of patterns to find and highlight
+            ignore_case: Whether to perform case-insensitive matching
+            use_regex: Whether patterns are regular expressions
 
-    def _highlight_substring(self, text: str, pattern: str, ignore_case: bool) -> str:
-        """Highlight a substring pattern.
+        Yields:
+            Each text with patterns wrapped in markers, in input order
+        """
+        active = tuple([pattern for pattern in patterns if pattern]) if patterns else ()
+        if not active:
+            yield from texts
+            return
+
+        if not use_regex:
+            highlight_substrings = self._highlight_substrings
+            for text in texts:
+                yield highlight_substrings(text, active, ignore_case) if text else text
+            return
+
+        regexes = self._get_regex_set(active, ignore_case)
+        highlight_regexes = self._highlight_regexes
+        for text in texts:
+            yield highlight_regexes(text, regexes) if text else text
+
+    def _get_regex_set(
+        self, patterns: Tuple[str, ...], ignore_case: bool
+    ) -> Tuple[Pattern[str], ...]:
+        """Return the cached regexes that highlight a list of regex patterns.
 
         Args:
-            text: The text to highlight
-            pattern: The substring pattern to find
+            patterns: Non-empty regex patterns
             ignore_case: Whether to perform case-insensitive matching
 
         Returns:
-            Text with pattern highlighted
+            Compiled regexes to apply in order
         """
-        if not pattern:
+        key = (patterns, ignore_case)
+        try:
+            return self._regex_sets[key]
+        except KeyError:
+            regexes = self._regex_sets[key] = self._combine_regexes(patterns, ignore_case)
+            return regexes
+
+    def _highlight_regexes(self, text: str, regexes: Tuple[Pattern[str], ...]) -> str:
+        """Highlight the matches of compiled regexes in one pass.
+
+        Args:
+            text: The text to highlight
+            regexes: Compiled regexes from _get_regex_set
+
+        Returns:
+            Text with matches highlighted
+        """
+        if len(regexes) == 1:
+            return self._splice(text, map(_MATCH_SPAN, regexes[0].finditer(text)))
+        if not regexes:
             return text
+        return self._splice(text, _alternation_spans(text, regexes))
 
-        # Build replacement with markers
-        replacement = f"{self.start_marker}\\g<0>{self.end_marker}"
+    def _highlight_substrings(self, text: str, patterns: Tuple[str, ...], ignore_case: bool) -> str:
+        """Highlight several substring patterns in one pass.
 
-        # Escape special regex characters in pattern
-        escaped_pattern = re.escape(pattern)
+        The patterns are combined into a single alternation, longest first,
+        so the text is scanned once regardless of how many patterns there
+        are, and markers inserted for one pattern are never matched by
+        another.
 
-        # Create regex with appropriate flags
-        flags = re.IGNORECASE if ignore_case else 0
+        Args:
+            text: The text to highlight
+            patterns: Non-empty substring patterns to find
+            ignore_case: Whether to perform case-insensitive matching
 
-        # Replace all occurrences
+        Returns:
+            Text with patterns highlighted
+        """
+        # Most texts contain none of the patterns; a plain containment check
+        # rules them out much more cheaply than running the regex
+        if not ignore_case:
+            if len(patterns) == 1:
+                # A single case-sensitive literal needs no regex at all
+                pattern = patterns[0]
+                return text.replace(pattern, f"{self.start_marker}{pattern}{self.end_marker}")
+            if not any(pattern in text for pattern in patterns):
+                return text
+        elif text.isascii():
+            needles = self._lowered_ascii_patterns(patterns)
+            # Lower-casing matches IGNORECASE exactly only for ASCII on both
+            # sides; then plain str.find on the lowered text does the search
+            if needles is not None:
+                spans = _literal_spans(text.lower(), needles)
+                return self._splice(text, spans) if spans else text
+
+        key = (patterns, ignore_case)
         try:
-            result = re.sub(escaped_pattern, replacement, text, flags=flags)
-            return result
-        except re.error:
-            # If regex fails, return original text
+            compiled = self._compiled[key]
+        except KeyError:
+            # Longest first, so the longest pattern wins at any given position;
+            # the single capturing group makes split() keep the matches
+            ordered = sorted(dict.fromkeys(patterns), key=len, reverse=True)
+            combined = "(" + "|".join(re.escape(pattern) for pattern in ordered) + ")"
+            compiled = self._compiled[key] = self._compile(combined, ignore_case)
+
+        if compiled is None:
+            return text
+
+        # split() alternates unmatched text and matches, all built in C, so
+        # only the matches need wrapping
+        parts = compiled.split(text)
+        if len(parts) == 1:
             return text
+        start_marker = self.start_marker
+        end_marker = self.end_marker
+        parts[1::2] = [start_marker + match + end_marker for match in parts[1::2]]
+        return "".join(parts)
 
-    def _highlight_regex(self, text: str, pattern: str, ignore_case: bool) -> str:
-        """Highlight a regex pattern.
+    def _lowered_ascii_patterns(self, patterns: Tuple[str, ...]) -> Optional[Tuple[str, ...]]:
+        """Return the patterns lower-cased, if they are all ASCII.
+
+        Args:
+            patterns: Substring patterns
+
+        Returns:
+            Distinct lower-cased patterns, longest first, or None if any
+            pattern is not ASCII
+        """
+        try:
+            return self._ascii_needles[patterns]
+        except KeyError:
+            needles = None
+            if all(pattern.isascii() for pattern in patterns):
+                lowered = dict.fromkeys(pattern.lower() for pattern in patterns)
+                needles = tuple(sorted(lowered, key=len, reverse=True))
+            self._ascii_needles[patterns] = needles
+            return needles
+
+    def _splice(self, text: str, spans: Iterable[Tuple[int, int]]) -> str:
+        """Wrap the given spans of text in markers.
+
+        Building the result from slices avoids the replacement template
+        expansion that ``Pattern.sub`` does for every match.
 
         Args:
             text: The text to highlight
-            pattern: The regex pattern to find
+            spans: Non-overlapping (start, end) spans in ascending order
+
+        Returns:
+            Text with each span wrapped in markers
+        """
+        start_marker = self.start_marker
+        end_marker = self.end_marker
+        parts = []
+        last = 0
+        for start, end in spans:
+            parts.append(text[last:start])
+            parts.append(start_marker)
+            parts.append(text[start:end])
+            parts.append(end_marker)
+            last = end
+        parts.append(text[last:])
+        return "".join(parts)
+
+    def _combine_regexes(
+        self, patterns: Tuple[str, ...], ignore_case: bool
+    ) -> Tuple[Pattern[str], ...]:
+        """Build the regexes that highlight a list of regex patterns.
+
+        Valid patterns are joined into one alternation so the text is
+        scanned once. Numbered backreferences would point at the wrong
+        group once patterns are combined, so if any pattern uses one, or the
+        combination does not compile (e.g. a group name is reused), each
+        pattern is kept separately and their matches are merged as an
+        alternation would choose them.
+
+        Args:
+            patterns: Non-empty regex patterns
             ignore_case: Whether to perform case-insensitive matching
 
         Returns:
-            Text with pattern highlighted
+            Compiled regexes in order of priority; empty if none is valid
         """
-        if not pattern:
-            return text
+        compiled: Dict[str, Pattern[str]] = {}
+        for pattern in dict.fromkeys(patterns):
+            regex = self._get_compiled(pattern, ignore_case)
+            if regex is not None:
+                compiled[pattern] = regex
+        if len(compiled) > 1 and not any(_NUMBERED_BACKREFERENCE.search(p) for p in compiled):
+            combined = self._compile(
+                "|".join(f"(?:{pattern})" for pattern in compiled), ignore_case
+            )
+            if combined is not None:
+                return (combined,)
+        return tuple(compiled.values())
+
+    def _get_compiled(self, pattern: str, ignore_case: bool) -> Optional[Pattern[str]]:
+        """Return a cached compiled regex for a single pattern.
 
-        # Build replacement with markers
-        replacement = f"{self.start_marker}\\g<0>{self.end_marker}"
+        Args:
+            pattern: The regex pattern
+            ignore_case: Whether to perform case-insensitive matching
 
+        Returns:
+            Compiled pattern, or None if the regex is invalid
+        """
+        key = (pattern, ignore_case)
+        try:
+            return self._compiled[key]
+        except KeyError:
+            compiled = self._compiled[key] = self._compile(pattern, ignore_case)
+            return compiled
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _compile(pattern: str, ignore_case: bool) -> Optional[Pattern[str]]:
+        """Compile a pattern for highlighting.
+
+        Shared by all highlighters, so separate instances (one per worker,
+        or per marker pair in highlight_text) compile each pattern once.
+        Unlike re's own cache this also remembers invalid patterns.
+
+        Args:
+            pattern: Regex source to compile
+            ignore_case: Whether to compile with IGNORECASE
+
+        Returns:
+            Compiled pattern, or None if the regex is invalid
+        """
         # Create regex with appropriate flags
         flags = re.IGNORECASE if ignore_case else 0
-
-        # Replace all occurrences
         try:
-            result = re.sub(pattern, replacement, text, flags=flags)
-            return result
+            return re.compile(pattern, flags)
         except re.error:
-            # If regex fails, return original text
-            return text
+            return None
 
     def highlight_with_compiled_pattern(self, text: str, compiled_pattern: Pattern[str]) -> str:
         """Highlight using a pre-compiled regex pattern.
@@ -147,16 +347,104 @@ class TextHighlighter:
         Returns:
             Text with pattern highlighted
         """
-        replacement = f"{self.start_marker}\\g<0>{self.end_marker}"
-
         try:
-            result = compiled_pattern.sub(replacement, text)
-            return result
+            return self._splice(text, map(_MATCH_SPAN, compiled_pattern.finditer(text)))
         except Exception:
             # If highlighting fails, return original text
             return text
 
 
+def _alternation_spans(text: str, regexes: Tuple[Pattern[str], ...]) -> List[Tuple[int, int]]:
+    """Find match spans of several regexes as if they were one alternation.
+
+    Scanning left to right, the earliest-starting match wins, ties going
+    to the regex listed first, and scanning resumes where it ends. All
+    regexes search the original text, so markers are never matched and
+    nothing is highlighted twice. Empty matches are ignored.
+
+    Args:
+        text: Text to search
+        regexes: Compiled regexes in order of priority
+
+    Returns:
+        Non-overlapping (start, end) spans in ascending order
+    """
+    pending = [regex.search(text) for regex in regexes]
+    spans: List[Tuple[int, int]] = []
+    pos = 0
+    size = len(text)
+    while True:
+        best = None
+        for index, match in enumerate(pending):
+            # Re-search regexes whose next match starts inside the last span
+            # or is empty, which would otherwise be found again and again
+            while match is not None and (match.start() < pos or match.end() == match.start()):
+                start = max(pos, match.start() + (match.end() == match.start()))
+                # search() clamps a start past the end, so stop explicitly
+                match = pending[index] = (
+                    regexes[index].search(text, start) if start <= size else None
+                )
+            if match is not None and (best is None or match.start() < best.start()):
+                best = match
+        if best is None:
+            return spans
+        spans.append(best.span())
+        pos = best.end()
+
+
+def _literal_spans(text: str, needles: Tuple[str, ...]) -> List[Tuple[int, int]]:
+    """Find where literal needles occur, the way an alternation of them would.
+
+    Scanning left to right, the first needle (in the given order) found at a
+    position wins and the scan resumes after it, matching ``re`` semantics
+    for an alternation of the needles in that order.
+
+    Args:
+        text: Text to search
+        needles: Non-empty needles in order of preference
+
+    Returns:
+        Non-overlapping (start, end) spans in ascending order
+    """
+    find = text.find
+    if len(needles) == 1:
+        needle = needles[0]
+        size = len(needle)
+        spans = []
+        index = find(needle)
+        while index >= 0:
+            spans.append((index, index + size))
+            index = find(needle, index + size)
+        return spans
+
+    # Every occurrence of every needle, including overlapping ones, since an
+    # occurrence may only become the winner once an earlier one is skipped
+    candidates = []
+    for rank, needle in enumerate(needles):
+        size = len(needle)
+        index = find(needle)
+        while index >= 0:
+            candidates.append((index, rank, index + size))
+            index = find(needle, index + 1)
+    if not candidates:
+        return []
+    candidates.sort()
+
+    spans = []
+    last_end = 0
+    for start, _, end in candidates:
+        if start >= last_end:
+            spans.append((start, end))
+            last_end = end
+    return spans
+
+
+@lru_cache(maxsize=8)
+def _shared_highlighter(start_marker: str, end_marker: str) -> TextHighlighter:
+    """Return a TextHighlighter per marker pair, so its pattern cache is reused."""
+    return TextHighlighter(start_marker, end_marker)
+
+
 def highlight_text(
     text: str,
     patterns: List[str],
@@ -182,5 +470,34 @@ def highlight_text(
         >>> highlight_text("Error occurred", ["Error"], ignore_case=True)
         '<<<Error>>> occurred'
     """
-    highlighter = TextHighlighter(start_marker, end_marker)
+    highlighter = _shared_highlighter(start_marker, end_marker)
     return highlighter.highlight(text, patterns, ignore_case, use_regex)
+
+
+def highlight_text_many(
+    texts: Iterable[str],
+    patterns: List[str],
+    ignore_case: bool = False,
+    use_regex: bool = False,
+    start_marker: str = TextHighlighter.DEFAULT_START_MARKER,
+    end_marker: str = TextHighlighter.DEFAULT_END_MARKER,
+) -> Iterator[str]:
+    """Convenience function to highlight several texts with the same patterns.
+
+    Args:
+        texts: Texts to highlight
+        patterns: List of patterns to find and highlight
+        ignore_case: Whether to perform case-insensitive matching
+        use_regex: Whether patterns are regular expressions
+        start_marker: Text to insert before matches
+        end_marker: Text to insert after matches
+
+    Returns:
+        Iterator over the texts with patterns wrapped in markers
+
+    Example:
+        >>> list(highlight_text_many(["Error here", "no match"], ["Error"]))
+        ['<<<Error>>> here', 'no match']
+    """
+    highlighter = _shared_highlighter(start_marker, end_marker)
+    return highlighter.highlight_many(texts, patterns, ignore_case, use_regex)
@@ -6,14 +6,29 @@ for multiple handlers, log levels, and structured output formats.
 """
 
 import logging
+import os
 import sys
+import time
+import weakref
 from pathlib import Path
-from typing import Any, MutableMapping, Optional
+from typing import Any, Dict, Mapping, MutableMapping, Optional
 
-# Default log format with timestamp, level, component, and message
-DEFAULT_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)-25s | %(message)s"
+# Default log format with timestamp, level, component, message and adapter context
+DEFAULT_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)-25s | %(message)s%(context)s"
 DEFAULT_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# Accepted log level names, in upper and lower case
+_LEVEL_NAMES = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_LEVEL_MAP: Dict[str, int] = {name: getattr(logging, name) for name in _LEVEL_NAMES}
+_LEVEL_MAP.update({name.lower(): value for name, value in _LEVEL_MAP.items()})
+
+# File handler buffering: write buffer size, and how many records (or
+# seconds) may sit in it before a flush (records at WARNING and above are
+# flushed immediately)
+FILE_BUFFER_SIZE = 64 * 1024
+FILE_FLUSH_INTERVAL = 1000
+FILE_FLUSH_SECONDS = 1.0
+
 
 def configure_logging(
     level: str = "INFO",
@@ -31,7 +46,8 @@ def configure_logging(
         log_file: Optional file path for file logging
         file_level: Log level for file handler (defaults to level)
         console_level: Log level for console handler (defaults to level)
-        format_string: Custom log format string
+        format_string: Custom log format string; LoggerAdapter context is
+            appended to %(message)s unless it contains %(context)s
         date_format: Custom date format string
         log_to_console: Whether to log to console
 
@@ -47,14 +63,17 @@ def configure_logging(
     file_log_level = _parse_level(file_level or level)
     console_log_level = _parse_level(console_level or level)
 
-    # Use custom format or default
+    # Use custom format or default; adapter context follows the message
+    # unless the custom format places %(context)s itself
     fmt = format_string or DEFAULT_FORMAT
+    if "%(context)s" not in fmt:
+        fmt = fmt.replace("%(message)s", "%(message)s%(context)s")
     date_fmt = date_format or DEFAULT_DATE_FORMAT
     formatter = logging.Formatter(fmt, date_fmt)
+    context_filter = _ContextFilter()
 
     # Get root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(logging.DEBUG)  # Set to DEBUG to allow handlers to filter
 
     # Remove existing handlers
     root_logger.handlers.clear()
@@ -64,16 +83,23 @@ def configure_logging(
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(console_log_level)
         console_handler.setFormatter(formatter)
+        console_handler.addFilter(context_filter)
         root_logger.addHandler(console_handler)
 
     # Add file handler if specified
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        file_handler = BufferedFileHandler(log_file, encoding="utf-8")
         file_handler.setLevel(file_log_level)
         file_handler.setFormatter(formatter)
+        file_handler.addFilter(context_filter)
         root_logger.addHandler(file_handler)
 
+    # Let the root logger pass only what some handler will emit, so records
+    # below every handler's level are rejected before a LogRecord is built
+    handler_levels = [handler.level for handler in root_logger.handlers]
+    root_logger.setLevel(min(handler_levels) if handler_levels else default_level)
+
     # Set default level for log_filter package
     logging.getLogger("log_filter").setLevel(default_level)
 
@@ -122,26 +148,165 @@ def _parse_level(level: str) -> int:
     Raises:
         ValueError: If level is invalid
     """
-    level_map = {
-        "DEBUG": logging.DEBUG,
-        "INFO": logging.INFO,
-        "WARNING": logging.WARNING,
-        "ERROR": logging.ERROR,
-        "CRITICAL": logging.CRITICAL,
-    }
-
-    level_upper = level.upper()
-    if level_upper not in level_map:
-        raise ValueError(
-            f"Invalid log level: {level}. " f"Must be one of: {', '.join(level_map.keys())}"
+    parsed = _LEVEL_MAP.get(level)
+    if parsed is None:
+        parsed = _LEVEL_MAP.get(level.upper())
+        if parsed is None:
+            raise ValueError(
+                f"Invalid log level: {level}. " f"Must be one of: {', '.join(_LEVEL_NAMES)}"
+            )
+    return parsed
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that flushes in batches rather than after every record.
+
+    ``logging.FileHandler`` flushes after each record, costing a write call
+    per log line. This handler lets records accumulate in a larger write
+    buffer and flushes every ``flush_interval`` records, when a record
+    arrives ``flush_seconds`` after the last flush, or at once for records
+    at ``flush_level`` or above so warnings and errors reach the file even
+    if the process dies. Remaining records are flushed when the handler is
+    closed, which ``logging.shutdown`` does at exit.
+
+    The buffer is flushed before the process forks, so children do not
+    inherit and write out the parent's pending records. Forked children
+    (such as process pool workers) may exit without ``logging.shutdown``,
+    so in them the handler flushes after every record.
+
+    Example:
+        >>> handler = BufferedFileHandler(Path("app.log"), encoding="utf-8")
+        >>> logging.getLogger().addHandler(handler)
+    """
+
+    def __init__(
+        self,
+        filename: Path,
+        mode: str = "a",
+        encoding: Optional[str] = None,
+        flush_interval: int = FILE_FLUSH_INTERVAL,
+        flush_level: int = logging.WARNING,
+        buffer_size: int = FILE_BUFFER_SIZE,
+        flush_seconds: float = FILE_FLUSH_SECONDS,
+    ) -> None:
+        """Initialize the handler.
+
+        Args:
+            filename: Log file path
+            mode: File open mode
+            encoding: File encoding
+            flush_interval: Records written between flushes
+            flush_level: Records at this level or above are flushed immediately
+            buffer_size: Size of the file write buffer in bytes
+            flush_seconds: Records arriving this long after the last flush
+                are flushed immediately
+        """
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self.buffer_size = buffer_size
+        self.flush_seconds = flush_seconds
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+        self._defer_flush = False
+        super().__init__(filename, mode=mode, encoding=encoding)
+        _buffered_handlers.add(self)
+
+    def _open(self) -> Any:
+        """Open the log file with the configured buffer size."""
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
         )
 
-    return level_map[level_upper]
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record, flushing only when the batch is full, old or severe.
+
+        Opening and writing are left to ``FileHandler.emit``; this only
+        decides whether the flush it ends with actually happens.
+
+        Args:
+            record: Log record to write
+        """
+        self._unflushed += 1
+        self._defer_flush = (
+            record.levelno < self.flush_level
+            and self._unflushed < self.flush_interval
+            and time.monotonic() - self._last_flush < self.flush_seconds
+        )
+        try:
+            super().emit(record)
+        finally:
+            self._defer_flush = False
+
+    def flush(self) -> None:
+        """Flush the stream unless called from emit() with the batch still open."""
+        # emit() runs under the handler lock, so holding it here means other
+        # threads never see the deferral meant for an emit in progress
+        self.acquire()
+        try:
+            if self._defer_flush:
+                return
+            super().flush()
+            self._unflushed = 0
+            self._last_flush = time.monotonic()
+        finally:
+            self.release()
+
+
+# Live BufferedFileHandlers, flushed around fork() (see the class docstring)
+_buffered_handlers: "weakref.WeakSet[BufferedFileHandler]" = weakref.WeakSet()
+
+
+def _flush_buffered_handlers() -> None:
+    """Flush every buffered file handler before the process forks."""
+    for handler in list(_buffered_handlers):
+        handler.flush()
+
+
+def _unbuffer_handlers_in_child() -> None:
+    """Make buffered file handlers flush every record in a forked child."""
+    for handler in list(_buffered_handlers):
+        handler.flush_interval = 1
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(before=_flush_buffered_handlers, after_in_child=_unbuffer_handlers_in_child)
+
+
+class _ContextFilter(logging.Filter):
+    """Give records logged outside a LoggerAdapter an empty ``context`` field.
+
+    Keeps ``%(context)s`` in the format string valid for every record.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Add an empty context to the record if it has none.
+
+        Args:
+            record: Log record being handled
+
+        Returns:
+            Always True; the record is never dropped
+        """
+        if not hasattr(record, "context"):
+            record.context = ""
+        return True
 
 
 class LoggerAdapter(logging.LoggerAdapter):
     """Adapter for adding contextual information to log messages.
 
+    The context is rendered once when the adapter is created and attached
+    to each record as the ``context`` field instead of being appended to
+    the message. Handlers set up by ``configure_logging`` print it through
+    ``%(context)s`` in their format. Other handlers, such as one added by
+    ``logging.basicConfig`` or pytest's ``caplog``, show only the message
+    unless their format includes ``%(context)s``; the context is always
+    available as ``record.context``.
+
     Example:
         >>> logger = get_logger(__name__)
         >>> adapter = LoggerAdapter(logger, {"file": "data.log"})
@@ -149,6 +314,19 @@ class LoggerAdapter(logging.LoggerAdapter):
         # Outputs: ... | INFO | ... | Processing started | file=data.log
     """
 
+    def __init__(self, logger: logging.Logger, extra: Optional[Mapping[str, Any]] = None) -> None:
+        """Initialize the adapter and render its context.
+
+        Args:
+            logger: Logger to delegate to
+            extra: Context key/value pairs appended to each message
+        """
+        super().__init__(logger, extra)
+        context = ""
+        if extra:
+            context = " | " + " | ".join(f"{k}={v}" for k, v in extra.items())
+        self._record_extra = {"context": context}
+
     def process(
         self, msg: str, kwargs: MutableMapping[str, Any]
     ) -> tuple[str, MutableMapping[str, Any]]:
@@ -161,10 +339,11 @@ class LoggerAdapter(logging.LoggerAdapter):
         Returns:
             Tuple of (message, kwargs)
         """
-        # Add context from extra dict to message
-        if self.extra:
-            context_parts = [f"{k}={v}" for k, v in self.extra.items()]
-            msg = f"{msg} | {' | '.join(context_parts)}"
+        caller_extra = kwargs.get("extra")
+        if caller_extra:
+            kwargs["extra"] = {**caller_extra, **self._record_extra}
+        else:
+            kwargs["extra"] = self._record_extra
 
         return msg, kwargs
 
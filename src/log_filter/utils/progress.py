@@ -5,8 +5,8 @@ This module provides real-time progress bars and status updates
 using tqdm for visual feedback during long-running operations.
 """
 
-from pathlib import Path
-from typing import Iterator, Optional, TypeVar
+import os
+from typing import Dict, Iterator, Optional, TypeVar
 
 from tqdm import tqdm
 
@@ -14,6 +14,11 @@ from log_filter.domain.models import FileMetadata, LogRecord
 
 T = TypeVar("T")
 
+# Records counted between record bar updates; a power of two so the check
+# in track_records is a single bitwise AND
+_RECORD_UPDATE_BATCH = 1 << 14
+_RECORD_UPDATE_MASK = _RECORD_UPDATE_BATCH - 1
+
 
 class ProgressTracker:
     """Progress tracking wrapper using tqdm.
@@ -27,15 +32,41 @@ class ProgressTracker:
         ...     process(file)
     """
 
-    def __init__(self, enable: bool = True, desc_width: int = 25):
+    def __init__(
+        self,
+        enable: bool = True,
+        desc_width: int = 25,
+        record_mininterval: float = 0.25,
+        record_miniters: int = 10000,
+    ):
         """Initialize progress tracker.
 
         Args:
             enable: Whether to show progress bars
             desc_width: Width of description column
+            record_mininterval: Minimum seconds between record bar refreshes
+            record_miniters: Minimum records between record bar refresh checks
         """
         self.enable = enable
         self.desc_width = desc_width
+        self.record_mininterval = record_mininterval
+        self.record_miniters = record_miniters
+        self._padded_descs: Dict[tuple[str, int], str] = {}
+
+    def _pad_desc(self, desc: str) -> str:
+        """Return the description padded to the column width.
+
+        Args:
+            desc: Progress bar description
+
+        Returns:
+            Description left-justified to ``desc_width``
+        """
+        key = (desc, self.desc_width)
+        padded = self._padded_descs.get(key)
+        if padded is None:
+            padded = self._padded_descs[key] = desc.ljust(self.desc_width)
+        return padded
 
     def track_files(
         self,
@@ -60,15 +91,16 @@ class ProgressTracker:
         with tqdm(
             iterable=files,
             total=total,
-            desc=desc.ljust(self.desc_width),
+            desc=self._pad_desc(desc),
             unit="file",
             unit_scale=False,
             colour="green",
             leave=True,
         ) as pbar:
+            set_postfix_str = pbar.set_postfix_str
             for file_meta in pbar:
                 # Update status with current file
-                pbar.set_postfix_str(f"{Path(file_meta.path).name[:30]}", refresh=False)
+                set_postfix_str(os.path.basename(file_meta.path)[:30], refresh=False)
                 yield file_meta
 
     def track_records(
@@ -86,21 +118,38 @@ class ProgressTracker:
 
         Yields:
             Records from the input iterator
+
+        Note:
+            Records are counted here and handed to the bar in batches, so
+            the bar does no work per record; it advances every
+            16384 records and catches up when iteration ends.
         """
         if not self.enable:
             yield from records
             return
 
         with tqdm(
-            iterable=records,
             total=total,
-            desc=desc.ljust(self.desc_width),
+            desc=self._pad_desc(desc),
             unit="rec",
             unit_scale=True,
             colour="blue",
             leave=True,
+            # Records arrive far faster than the bar can usefully redraw, so
+            # only look at the clock every record_miniters records
+            mininterval=self.record_mininterval,
+            miniters=self.record_miniters,
+            smoothing=0.05,
         ) as pbar:
-            yield from pbar
+            count = 0
+            try:
+                for record in records:
+                    count += 1
+                    if not count & _RECORD_UPDATE_MASK:
+                        pbar.update(_RECORD_UPDATE_BATCH)
+                    yield record
+            finally:
+                pbar.update(count & _RECORD_UPDATE_MASK)
 
     def track_generic(
         self,
@@ -127,7 +176,7 @@ class ProgressTracker:
         with tqdm(
             iterable=items,
             total=total,
-            desc=desc.ljust(self.desc_width),
+            desc=self._pad_desc(desc),
             unit=unit,
             unit_scale=False,
             leave=True,
@@ -148,7 +197,7 @@ class ProgressTracker:
             Progress counter for manual updates
         """
         return ProgressCounter(
-            enable=self.enable, total=total, desc=desc.ljust(self.desc_width), unit=unit
+            enable=self.enable, total=total, desc=self._pad_desc(desc), unit=unit
         )
 
 
@@ -178,7 +227,11 @@ class ProgressCounter:
         self._pbar: Optional[tqdm] = None
         self._total = total
         self._desc = desc
+        self._desc_width = len(desc)
         self._unit = unit
+        # Last values passed to the bar, so unchanged updates are skipped
+        self._last_desc: Optional[str] = None
+        self._last_postfix: Optional[str] = None
 
     def __enter__(self) -> "ProgressCounter":
         """Enter context manager."""
@@ -210,7 +263,8 @@ class ProgressCounter:
         Args:
             s: Status string to display
         """
-        if self._pbar is not None:
+        if self._pbar is not None and s != self._last_postfix:
+            self._last_postfix = s
             self._pbar.set_postfix_str(s, refresh=False)
 
     def set_description(self, desc: str) -> None:
@@ -219,5 +273,6 @@ class ProgressCounter:
         Args:
             desc: New description
         """
-        if self._pbar is not None:
-            self._pbar.set_description(desc.ljust(len(self._desc)))
+        if self._pbar is not None and desc != self._last_desc:
+            self._last_desc = desc
+            self._pbar.set_description(desc.ljust(self._desc_width), refresh=False)
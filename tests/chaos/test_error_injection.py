@@ -5,8 +5,8 @@ These tests simulate various failure scenarios to ensure graceful degradation.
 
 import gzip
 import os
+import signal
 from pathlib import Path
-from unittest.mock import Mock, mock_open, patch
 
 import pytest
 
@@ -26,6 +26,7 @@ from log_filter.infrastructure.file_handlers.gzip_handler import GzipFileHandler
 from log_filter.infrastructure.file_handlers.log_handler import LogFileHandler
 from log_filter.infrastructure.file_scanner import FileScanner
 from log_filter.infrastructure.file_writer import BufferedLogWriter
+from log_filter.processing import pipeline as pipeline_module
 from log_filter.processing.pipeline import ProcessingPipeline
 from log_filter.processing.worker import FileWorker
 
@@ -42,7 +43,7 @@ class TestFileSystemErrors:
             handler = LogFileHandler(missing_file)
             assert False, "Should not reach here"
 
-    def test_permission_denied_read(self, tmp_path):
+    def test_permission_denied_read(self, restrict_permissions, tmp_path):
         """Test handling permission denied on read."""
         # Skip on Windows - chmod doesn't work reliably
         if os.name == "nt":
@@ -52,17 +53,12 @@ class TestFileSystemErrors:
         log_file.write_text("test")
 
         # Make file unreadable
-        os.chmod(log_file, 0o000)
-
-        try:
+        with restrict_permissions(log_file, 0o000):
             handler = LogFileHandler(log_file)
             with pytest.raises(FileHandlingError):
                 list(handler.read_lines())
-        finally:
-            # Restore permissions for cleanup
-            os.chmod(log_file, 0o666)
 
-    def test_permission_denied_write(self, tmp_path):
+    def test_permission_denied_write(self, restrict_permissions, tmp_path):
         """Test handling permission denied on write."""
         # Skip on Windows - chmod doesn't prevent writes reliably
         if os.name == "nt":
@@ -73,9 +69,7 @@ class TestFileSystemErrors:
         output_file = output_dir / "output.log"
 
         # Make directory read-only
-        os.chmod(output_dir, 0o444)
-
-        try:
+        with restrict_permissions(output_dir, 0o444):
             from src.log_filter.domain.models import LogRecord
 
             writer = BufferedLogWriter(output_file, buffer_size=1024)
@@ -86,12 +80,9 @@ class TestFileSystemErrors:
                 start_line=1,
                 end_line=1,
             )
-            with pytest.raises((FileHandlingError, PermissionError, OSError)):
+            with pytest.raises(OSError):
                 writer.write_record(record, Path("test.log"))
                 writer.flush()
-        finally:
-            # Restore permissions
-            os.chmod(output_dir, 0o777)
 
     def test_corrupted_gzip_file(self, tmp_path):
         """Test handling corrupted gzip file."""
@@ -123,24 +114,20 @@ class TestFileSystemErrors:
         with pytest.raises(FileHandlingError):
             list(handler.read_lines())
 
-    def test_invalid_encoding(self, tmp_path):
+    def test_invalid_encoding(self):
         """Test handling files with invalid encoding."""
-        invalid_file = tmp_path / "invalid.log"
-        # Write invalid UTF-8 bytes
-        invalid_file.write_bytes(b"Valid text\n\xff\xfe\xff\xfe\nMore text\n")
-
-        handler = LogFileHandler(invalid_file)
+        # Invalid UTF-8 bytes
+        handler = LogFileHandler(
+            Path("invalid.log"), content=b"Valid text\n\xff\xfe\xff\xfe\nMore text\n"
+        )
         # Should handle encoding errors gracefully
         lines = list(handler.read_lines())
         # Should get some lines (may replace invalid chars)
         assert len(lines) > 0
 
-    def test_empty_file(self, tmp_path):
+    def test_empty_file(self):
         """Test handling empty files."""
-        empty_file = tmp_path / "empty.log"
-        empty_file.touch()
-
-        handler = LogFileHandler(empty_file)
+        handler = LogFileHandler(Path("empty.log"), content=b"")
         lines = list(handler.read_lines())
         assert len(lines) == 0
 
@@ -174,20 +161,16 @@ class TestFileSystemErrors:
 class TestRecordSizeErrors:
     """Test handling of oversized records."""
 
-    def test_record_exceeds_size_limit(self, tmp_path):
+    def test_record_exceeds_size_limit(self, make_config, tmp_path):
         """Test handling records exceeding size limit."""
         log_file = tmp_path / "large.log"
         # Create a very long line (10MB)
-        long_line = "ERROR " + "x" * (10 * 1024 * 1024) + "\n"
-        log_file.write_text(long_line)
-
-        output = tmp_path / "output.log"
+        with open(log_file, "wb") as f:
+            f.write(b"ERROR ")
+            f.write(b"x" * (10 * 1024 * 1024))
+            f.write(b"\n")
 
-        config = ApplicationConfig(
-            search=SearchConfig(expression="ERROR"),
-            files=FileConfig(path=tmp_path),
-            output=OutputConfig(output_file=output, show_progress=False, show_stats=False),
-        )
+        config = make_config()
 
         # System should process extremely large lines
         # (no size limit in current implementation)
@@ -232,7 +215,7 @@ class TestConfigurationErrors:
         with pytest.raises(ConfigurationError):
             pipeline.run()
 
-    def test_output_file_in_readonly_directory(self, tmp_path):
+    def test_output_file_in_readonly_directory(self, restrict_permissions, tmp_path):
         """Test handling output file in read-only directory."""
         # Skip on Windows - chmod doesn't prevent file creation reliably
         if os.name == "nt":
@@ -245,9 +228,7 @@ class TestConfigurationErrors:
         readonly_dir.mkdir()
         output = readonly_dir / "output.log"
 
-        os.chmod(readonly_dir, 0o444)
-
-        try:
+        with restrict_permissions(readonly_dir, 0o444):
             config = ApplicationConfig(
                 search=SearchConfig(expression="ERROR"),
                 files=FileConfig(path=tmp_path, file_masks=["test.log"]),
@@ -255,29 +236,17 @@ class TestConfigurationErrors:
             )
 
             pipeline = ProcessingPipeline(config)
-            with pytest.raises((FileHandlingError, PermissionError, OSError)):
+            with pytest.raises(OSError):
                 pipeline.run()
-        finally:
-            os.chmod(readonly_dir, 0o777)
 
 
 class TestResourceExhaustion:
     """Test handling of resource exhaustion scenarios."""
 
-    def test_many_small_files(self, tmp_path):
+    def test_many_small_files(self, many_small_logs, make_config):
         """Test handling many small files."""
-        # Create 100 small files (reduced from 1000 for speed)
-        for i in range(100):
-            log_file = tmp_path / f"app_{i:04d}.log"
-            log_file.write_text(f"2025-01-08 12:00:00 ERROR Test {i}\n")
-
-        output = tmp_path / "output.log"
-
-        config = ApplicationConfig(
-            search=SearchConfig(expression="ERROR"),
-            files=FileConfig(path=tmp_path, extensions=(".log",)),
-            output=OutputConfig(output_file=output, show_progress=False, show_stats=False),
-        )
+        # 100 small files (reduced from 1000 for speed), shared across the session
+        config = make_config(path=many_small_logs, extensions=(".log",))
 
         # Should complete without issues
         pipeline = ProcessingPipeline(config)
@@ -288,39 +257,30 @@ class TestResourceExhaustion:
         # Records matched depends on parsing - may be 0 if single-line records not parsed
         assert stats.files_processed > 0
 
-    @patch("builtins.open")
-    def test_file_descriptor_exhaustion(self, mock_open_func, tmp_path):
+    def test_file_descriptor_exhaustion(self, monkeypatch, tmp_path):
         """Test handling file descriptor exhaustion."""
-        # Simulate "too many open files" error
-        mock_open_func.side_effect = OSError("Too many open files")
-
         log_file = tmp_path / "test.log"
         log_file.write_text("test")
 
+        def exhausted_open(*args, **kwargs):
+            raise OSError("Too many open files")
+
+        # Simulate "too many open files" only inside the log handler module
+        monkeypatch.setattr(
+            "log_filter.infrastructure.file_handlers.log_handler.open",
+            exhausted_open,
+            raising=False,
+        )
+
         handler = LogFileHandler(log_file)
         # System correctly raises FileHandlingError for OS errors
         with pytest.raises(FileHandlingError):
             list(handler.read_lines())
 
-    def test_deep_directory_tree(self, tmp_path):
+    def test_deep_directory_tree(self, deep_log_tree, make_config):
         """Test handling very deep directory structures."""
-        # Create deep directory tree (10 levels to avoid Windows path limits)
-        current_dir = tmp_path
-        for i in range(10):
-            current_dir = current_dir / f"lvl{i}"
-            current_dir.mkdir()
-
-        # Create log file at bottom
-        log_file = current_dir / "deep.log"
-        log_file.write_text("2025-01-08 ERROR Deep test\n")
-
-        output = tmp_path / "output.log"
-
-        config = ApplicationConfig(
-            search=SearchConfig(expression="ERROR"),
-            files=FileConfig(path=tmp_path, extensions=(".log",)),
-            output=OutputConfig(output_file=output, show_progress=False, show_stats=False),
-        )
+        # 10 levels deep to avoid Windows path limits, shared across the session
+        config = make_config(path=deep_log_tree, extensions=(".log",))
 
         # Should handle deep paths without crashing
         pipeline = ProcessingPipeline(config)
@@ -333,19 +293,12 @@ class TestResourceExhaustion:
 class TestConcurrentErrors:
     """Test error handling in concurrent scenarios."""
 
-    def test_concurrent_file_access(self, tmp_path):
+    def test_concurrent_file_access(self, make_config, tmp_path):
         """Test handling concurrent access to files."""
         log_file = tmp_path / "shared.log"
         log_file.write_text("2025-01-08 ERROR Test\n" * 100)
 
-        output = tmp_path / "output.log"
-
-        config = ApplicationConfig(
-            search=SearchConfig(expression="ERROR"),
-            files=FileConfig(path=tmp_path),
-            output=OutputConfig(output_file=output, show_progress=False, show_stats=False),
-            processing=ProcessingConfig(worker_count=4),
-        )
+        config = make_config(processing=ProcessingConfig(worker_count=4))
 
         # Should handle gracefully without crashes
         pipeline = ProcessingPipeline(config)
@@ -376,26 +329,20 @@ class TestConcurrentErrors:
             try:
                 pipeline = ProcessingPipeline(config)
                 pipeline.run()
-            except (FileHandlingError, OSError):
+            except OSError:
                 pass  # Expected on some platforms
 
 
 class TestMalformedData:
     """Test handling of malformed data."""
 
-    def test_binary_file_as_log(self, tmp_path):
+    def test_binary_file_as_log(self, make_config, tmp_path):
         """Test handling binary file treated as text log."""
         binary_file = tmp_path / "binary.log"
         # Write binary data
         binary_file.write_bytes(bytes(range(256)) * 100)
 
-        output = tmp_path / "output.log"
-
-        config = ApplicationConfig(
-            search=SearchConfig(expression="ERROR"),
-            files=FileConfig(path=tmp_path),
-            output=OutputConfig(output_file=output, show_progress=False, show_stats=False),
-        )
+        config = make_config()
 
         # Should handle gracefully (may skip or process with encoding fallback)
         pipeline = ProcessingPipeline(config)
@@ -404,31 +351,24 @@ class TestMalformedData:
         # Should not crash
         assert True
 
-    def test_null_bytes_in_log(self, tmp_path):
+    def test_null_bytes_in_log(self):
         """Test handling null bytes in log files."""
-        log_file = tmp_path / "nulls.log"
-        log_file.write_bytes(b"Line 1\nLine with\x00null\nLine 3\n")
-
-        handler = LogFileHandler(log_file)
+        handler = LogFileHandler(Path("nulls.log"), content=b"Line 1\nLine with\x00null\nLine 3\n")
         lines = list(handler.read_lines())
 
         # Should handle null bytes (may strip or replace them)
         assert len(lines) > 0
 
-    def test_extremely_long_line(self, tmp_path):
+    def test_extremely_long_line(self, make_config, tmp_path):
         """Test handling extremely long lines."""
         log_file = tmp_path / "longline.log"
         # Create 1MB line (reduced from 10MB for speed)
-        long_line = "ERROR " + "x" * (1024 * 1024) + "\n"
-        log_file.write_text(long_line)
-
-        output = tmp_path / "output.log"
+        with open(log_file, "wb") as f:
+            f.write(b"ERROR ")
+            f.write(b"x" * (1024 * 1024))
+            f.write(b"\n")
 
-        config = ApplicationConfig(
-            search=SearchConfig(expression="ERROR"),
-            files=FileConfig(path=tmp_path, extensions=(".log",)),
-            output=OutputConfig(output_file=output, show_progress=False, show_stats=False),
-        )
+        config = make_config(extensions=(".log",))
 
         # System processes long lines (no size limit)
         pipeline = ProcessingPipeline(config)
@@ -454,38 +394,38 @@ class TestMalformedData:
 class TestInterruptedOperations:
     """Test handling of interrupted operations."""
 
-    def test_keyboard_interrupt_during_processing(self, tmp_path):
-        """Test handling keyboard interrupt during processing."""
+    def test_keyboard_interrupt_during_processing(self, make_config, monkeypatch, tmp_path):
+        """Test a real SIGINT mid-run propagates out of the pipeline."""
+        if signal.getsignal(signal.SIGINT) is not signal.default_int_handler:
+            pytest.skip("SIGINT is not handled by Python's default KeyboardInterrupt handler")
+
         # Create many files
         for i in range(10):
             log_file = tmp_path / f"app_{i}.log"
             log_file.write_text(f"2025-01-08 ERROR Test {i}\n" * 10)
 
-        output = tmp_path / "output.log"
-
-        config = ApplicationConfig(
-            search=SearchConfig(expression="ERROR"),
-            files=FileConfig(path=tmp_path, extensions=(".log",)),
-            output=OutputConfig(output_file=output, show_progress=False, show_stats=False),
-        )
+        # A single worker keeps processing in this (main) thread, where signals are handled
+        config = make_config(extensions=(".log",), processing=ProcessingConfig(worker_count=1))
 
-        # Mock worker to raise KeyboardInterrupt
-        from src.log_filter.processing.worker import FileWorker
+        # Deliver SIGINT once the third file is about to be read
+        files_started = []
+        original_prefetch = pipeline_module._prefetch_file
 
-        original_process = FileWorker.process_file
+        def interrupting_prefetch(path):
+            files_started.append(path)
+            if len(files_started) == 3:
+                signal.raise_signal(signal.SIGINT)
+            original_prefetch(path)
 
-        def interrupt_process(*args, **kwargs):
-            raise KeyboardInterrupt()
+        monkeypatch.setattr(pipeline_module, "_prefetch_file", interrupting_prefetch)
 
         pipeline = ProcessingPipeline(config)
+        with pytest.raises(KeyboardInterrupt):
+            pipeline.run()
 
-        with patch.object(FileWorker, "process_file", side_effect=interrupt_process):
-            # Pipeline should propagate KeyboardInterrupt
-            # Or handle gracefully - either is acceptable
-            try:
-                pipeline.run()
-            except KeyboardInterrupt:
-                pass  # Expected behavior
+        assert len(files_started) == 3
+        # The pipeline still records its end time on the way out
+        assert pipeline.stats.get_snapshot().end_time is not None
 
     def test_flush_failure(self, tmp_path):
         """Test handling flush failure."""
@@ -559,7 +499,7 @@ class TestEdgeCaseScenarios:
         files = list(scanner.scan_files())
         assert isinstance(files, list)
 
-    def test_file_name_with_special_characters(self, tmp_path):
+    def test_file_name_with_special_characters(self, make_config, tmp_path):
         """Test handling files with special characters in names."""
         special_names = [
             "test [brackets].log",
@@ -575,13 +515,7 @@ class TestEdgeCaseScenarios:
             except (OSError, ValueError):
                 continue  # Skip if OS doesn't support this filename
 
-        output = tmp_path / "output.log"
-
-        config = ApplicationConfig(
-            search=SearchConfig(expression="ERROR"),
-            files=FileConfig(path=tmp_path),
-            output=OutputConfig(output_file=output, show_progress=False, show_stats=False),
-        )
+        config = make_config()
 
         # Should handle special characters in filenames
         pipeline = ProcessingPipeline(config)
@@ -590,7 +524,7 @@ class TestEdgeCaseScenarios:
         # Should not crash
         assert True
 
-    def test_unicode_file_names(self, tmp_path):
+    def test_unicode_file_names(self, make_config, tmp_path):
         """Test handling Unicode file names."""
         unicode_names = [
             "测试.log",
@@ -606,13 +540,7 @@ class TestEdgeCaseScenarios:
             except (OSError, UnicodeError):
                 continue  # Skip if OS doesn't support this filename
 
-        output = tmp_path / "output.log"
-
-        config = ApplicationConfig(
-            search=SearchConfig(expression="ERROR"),
-            files=FileConfig(path=tmp_path),
-            output=OutputConfig(output_file=output, show_progress=False, show_stats=False),
-        )
+        config = make_config()
 
         # Should handle Unicode filenames
         pipeline = ProcessingPipeline(config)
@@ -1,13 +1,21 @@
 """Pytest configuration and fixtures."""
 
-import sys
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Any, Callable, ContextManager, Iterator, Optional
 
 import pytest
 
-# Add src directory to path so tests can import modules
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
+from log_filter.config.models import (
+    ApplicationConfig,
+    FileConfig,
+    OutputConfig,
+    ProcessingConfig,
+    SearchConfig,
+)
 
 
 @pytest.fixture
@@ -30,3 +38,77 @@ Exception in thread "main" java.lang.RuntimeException: Fatal error
 Caused by: java.io.IOException: Config file not found
     at com.example.Config.load(Config.java:67)
     ... 2 more"""
+
+
+@pytest.fixture
+def make_config(tmp_path: Path) -> Callable[..., ApplicationConfig]:
+    """Fixture providing a factory for quiet pipeline configurations.
+
+    The factory searches ``tmp_path`` (or ``path``) for ``expression`` and
+    writes matches to ``tmp_path / "output.log"`` with progress and
+    statistics output disabled. Extra keyword arguments go to FileConfig.
+    """
+
+    def _make(
+        path: Optional[Path] = None,
+        expression: str = "ERROR",
+        processing: Optional[ProcessingConfig] = None,
+        **file_options: Any,
+    ) -> ApplicationConfig:
+        return ApplicationConfig(
+            search=SearchConfig(expression=expression),
+            files=FileConfig(path=path or tmp_path, **file_options),
+            output=OutputConfig(
+                output_file=tmp_path / "output.log", show_progress=False, show_stats=False
+            ),
+            processing=processing or ProcessingConfig(),
+        )
+
+    return _make
+
+
+@pytest.fixture
+def restrict_permissions() -> Callable[[Path, int], ContextManager[Path]]:
+    """Fixture providing a context manager that chmods a path temporarily.
+
+    The original mode is restored on exit, including when the test fails
+    or is interrupted, so tmp_path cleanup is never blocked.
+    """
+
+    @contextmanager
+    def _restrict(path: Path, mode: int) -> Iterator[Path]:
+        original_mode = stat.S_IMODE(path.stat().st_mode)
+        os.chmod(path, mode)
+        try:
+            yield path
+        finally:
+            os.chmod(path, original_mode)
+
+    return _restrict
+
+
+@pytest.fixture(scope="session")
+def many_small_logs(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Fixture providing a shared directory of 100 single-record log files.
+
+    The files are written concurrently once per session; tests must treat
+    the directory as read-only and write their output elsewhere.
+    """
+    log_dir = tmp_path_factory.mktemp("many_small_logs")
+    payloads = {
+        log_dir / f"app_{i:04d}.log": f"2025-01-08 12:00:00 ERROR Test {i}\n".encode()
+        for i in range(100)
+    }
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(lambda item: item[0].write_bytes(item[1]), payloads.items()))
+    return log_dir
+
+
+@pytest.fixture(scope="session")
+def deep_log_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Fixture providing a shared 10-level directory tree with one log at the bottom."""
+    root = tmp_path_factory.mktemp("deep_log_tree")
+    leaf = root.joinpath(*(f"lvl{i}" for i in range(10)))
+    leaf.mkdir(parents=True)
+    (leaf / "deep.log").write_bytes(b"2025-01-08 ERROR Deep test\n")
+    return root
@@ -139,6 +139,14 @@ class TestQuoteStripping:
         assert not evaluator.evaluate(ast, "''")
         assert not evaluator.evaluate(ast, "")
 
+    def test_strip_quotes_all_nodes_see_stripped_text(self):
+        """Every term in a boolean tree is matched against the stripped line."""
+        evaluator = ExpressionEvaluator(strip_quotes=True)
+        ast = ("AND", ("WORD", "level:ERROR"), ("NOT", ("WORD", 'code:"42"')))
+
+        assert evaluator.evaluate(ast, '{"level":"ERROR","code":"7"}')
+        assert not evaluator.evaluate(ast, '{"level":"ERROR","code":"42"}')
+
 
 class TestCombinedWordBoundaryAndQuoteStripping:
     """Test combined word boundary + quote stripping."""
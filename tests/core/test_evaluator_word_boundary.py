@@ -154,3 +154,23 @@ class TestWordBoundaryMatching:
 
         assert not evaluator.evaluate(ast, "ERRORS")
         assert not evaluator.evaluate(ast, "ERROR_CODE")
+
+    def test_word_boundary_later_occurrence(self):
+        """A later whole-word occurrence matches after a rejected one."""
+        evaluator = ExpressionEvaluator(word_boundary=True)
+        ast = ("WORD", "MOVE")
+
+        assert evaluator.evaluate(ast, "MOVEMENT then MOVE")
+        assert not evaluator.evaluate(ast, "MOVEMENT then REMOVE")
+
+    def test_word_boundary_matches_regex_semantics(self):
+        """Boundaries follow re's \\b for non-word edges and Unicode letters."""
+        evaluator = ExpressionEvaluator(word_boundary=True)
+
+        # \b before a non-word character needs a word character in front of it
+        assert evaluator.evaluate(("WORD", "-v"), "run-v")
+        assert not evaluator.evaluate(("WORD", "-v"), "run -v")
+
+        # Non-ASCII letters are word characters
+        assert not evaluator.evaluate(("WORD", "MOVE"), "éMOVE")
+        assert evaluator.evaluate(("WORD", "café"), "le café noir")
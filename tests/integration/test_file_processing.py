@@ -4,6 +4,7 @@ Integration tests for file processing infrastructure.
 Tests the complete file reading, parsing, and writing pipeline.
 """
 
+import dataclasses
 import gzip
 import sys
 import tempfile
@@ -12,6 +13,7 @@ from pathlib import Path
 
 import pytest
 
+from log_filter.core.exceptions import FileHandlingError, RecordSizeExceededError
 from log_filter.domain.models import FileMetadata, LogRecord
 from log_filter.infrastructure.file_handlers import (
     GzipFileHandler,
@@ -19,7 +21,7 @@ from log_filter.infrastructure.file_handlers import (
 )
 from log_filter.infrastructure.file_scanner import FileScanner
 from log_filter.infrastructure.file_writer import BufferedLogWriter
-from log_filter.processing.record_parser import StreamingRecordParser
+from log_filter.processing.record_parser import StreamingRecordParser, is_ascii_compatible
 
 
 class TestFileHandlers:
@@ -91,6 +93,18 @@ class TestFileHandlers:
         assert "INFO App started" in lines[0]
         assert "ERROR Something failed" in lines[1]
 
+    def test_handlers_read_bytes(self, tmp_path):
+        """Test handlers return raw (decompressed) content in chunks."""
+        content = b"2025-01-01 10:00:00.000+0000 INFO App started\nsecond line\n"
+        log_file = tmp_path / "test.log"
+        log_file.write_bytes(content)
+        gz_file = tmp_path / "test.log.gz"
+        with gzip.open(gz_file, "wb") as f:
+            f.write(content)
+
+        assert b"".join(LogFileHandler(log_file).read_bytes(chunk_size=10)) == content
+        assert b"".join(GzipFileHandler(gz_file).read_bytes()) == content
+
     def test_gzip_handler_validates_file(self, tmp_path):
         """Test GzipFileHandler validation."""
         gz_file = tmp_path / "test.log.gz"
@@ -150,6 +164,277 @@ class TestStreamingRecordParser:
         assert str(records[0].time) == "10:00:00"
         assert records[0].level == "WARN"
 
+    def test_parser_builds_timestamp(self):
+        """Test parser builds timestamps and reuses them within the same second."""
+        lines = [
+            "2025-01-01 10:00:00.000+0000 INFO First",
+            "2025-01-01 10:00:00.500+0000 INFO Second",
+            "2025-01-01 10:00:01.000+0000 INFO Third",
+        ]
+
+        parser = StreamingRecordParser()
+        records = list(parser.parse_lines(iter(lines)))
+
+        assert records[0].timestamp == datetime(2025, 1, 1, 10, 0, 0)
+        assert records[1].timestamp is records[0].timestamp
+        assert records[2].timestamp == datetime(2025, 1, 1, 10, 0, 1)
+
+    def test_parser_reuses_recurring_timestamps(self):
+        """Test timestamps that recur out of order share one datetime."""
+        lines = [
+            "2025-01-01 10:00:00.000+0000 INFO First",
+            "2025-01-01 10:00:05.000+0000 INFO Second",
+            "2025-01-01 10:00:00.500+0000 INFO Third",
+        ]
+
+        parser = StreamingRecordParser()
+        records = list(parser.parse_lines(iter(lines)))
+
+        assert records[2].timestamp is records[0].timestamp
+        assert parser.parse_date("2025-01-01") is parser.parse_date("2025-01-01")
+
+    @pytest.mark.parametrize(
+        "date_str,time_str",
+        [
+            ("2025-01-31", "23:59:59"),
+            ("2025-1-5", "7:05:09"),
+            ("2025-02-30", "24:00:00"),
+            ("2025-01-3x", "10:0a:00"),
+            ("2025-01-01 ", " 10:00:00"),
+            ("", ""),
+        ],
+    )
+    def test_parse_date_and_time_match_strptime(self, date_str, time_str):
+        """Test parse_date/parse_time agree with strptime, including invalid input."""
+
+        def strptime_or_none(value, fmt):
+            try:
+                return datetime.strptime(value, fmt)
+            except ValueError:
+                return None
+
+        parser = StreamingRecordParser()
+        expected_date = strptime_or_none(date_str, "%Y-%m-%d")
+        expected_time = strptime_or_none(time_str, "%H:%M:%S")
+
+        assert parser.parse_date(date_str) == (expected_date and expected_date.date())
+        assert parser.parse_time(time_str) == (expected_time and expected_time.time())
+
+    def test_parser_joins_content_lazily(self):
+        """Test record content is joined from its lines on first access."""
+        lines = [
+            "2025-01-01 10:00:00.000+0000 INFO App started",
+            "  Additional context line 1",
+        ]
+
+        parser = StreamingRecordParser()
+        record = next(parser.parse_lines(iter(lines)))
+
+        with pytest.raises(AttributeError):
+            record._content  # not joined yet
+        assert record.content == "\n".join(lines)
+        assert record.content is record.content
+        assert record.first_line == lines[0]
+        assert record.line_count == 2
+
+    def test_lazy_records_behave_like_log_records(self):
+        """Test lazy records compare, hash and replace like plain LogRecords."""
+        lines = ["2025-01-01 10:00:00.000+0000 INFO App started", "  context"]
+
+        parser = StreamingRecordParser()
+        record = next(parser.parse_lines(iter(lines)))
+        byte_record = next(parser.parse_bytes(iter([b"\n".join(line.encode() for line in lines)])))
+        plain = LogRecord(
+            content=record.content,
+            first_line=record.first_line,
+            source_file=record.source_file,
+            start_line=record.start_line,
+            end_line=record.end_line,
+            timestamp=record.timestamp,
+            level=record.level,
+            size_bytes=record.size_bytes,
+        )
+
+        assert record == plain and plain == record
+        assert byte_record.content == record.content
+        assert hash(record) == hash(plain)
+        replaced = dataclasses.replace(record, level="ERROR")
+        assert replaced.content == record.content
+        assert replaced.level == "ERROR"
+        assert replaced != record
+
+    def test_parser_keeps_source_path(self):
+        """Test parser uses a given Path as the record source without copying."""
+        source = Path("/var/log/app.log")
+        lines = ["2025-01-01 10:00:00.000+0000 INFO App started"]
+
+        parser = StreamingRecordParser()
+
+        assert next(parser.parse_lines(iter(lines), source)).source_file is source
+        assert next(parser.parse_lines(iter(lines), "app.log")).source_file == Path("app.log")
+        assert next(parser.parse_lines(iter(lines))).source_file == Path("unknown")
+
+    def test_parser_invalid_timestamp(self):
+        """Test parser leaves timestamp empty for impossible dates."""
+        lines = ["2025-13-45 10:00:00.000+0000 INFO Bad date"]
+
+        parser = StreamingRecordParser()
+        records = list(parser.parse_lines(iter(lines)))
+
+        assert len(records) == 1
+        assert records[0].timestamp is None
+        assert records[0].level == "INFO"
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "2025-01-01 10:00:00.000+0000 INFO App started",
+            "2025-01-01 10:00:00.000-0500\tE short level",
+            "2025-01-01 10:00:00.000+0000   WARNING spaced",
+            "2025-01-01 10:00:00.000+0000 info lowercase",
+            "2025-01-01 10:00:00.000+0000 ",
+            "2025-01-01 10:00:00,000+0000 INFO comma millis",
+            "2025/01/01 10:00:00.000+0000 INFO slashes",
+            "  Stack trace line",
+            "",
+        ],
+    )
+    def test_fast_record_start_matches_regex(self, line):
+        """Test the fixed-position check agrees with the default regex."""
+        parser = StreamingRecordParser()
+
+        assert parser._fast_is_record_start(line) == parser.extract_record_metadata(line)
+        assert parser._fast_is_record_start_bytes(
+            line.encode("utf-8")
+        ) == parser.extract_record_metadata(line)
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 20])
+    def test_parse_bytes_matches_parse_lines(self, chunk_size):
+        """Test byte-level parsing yields the same records as line parsing."""
+        text = (
+            "2025-01-01 10:00:00.000+0000 INFO App started\r\n"
+            "  caf\u00e9 context line\r\n"
+            "2025-01-01 10:00:01.000+0000 E Something failed\n"
+            "\tat Foo.bar(Foo.java:1)\n"
+            "2025-01-01 10:00:02.000+0000 WARN Last record"
+        )
+        data = text.encode("utf-8")
+        chunks = (data[i : i + chunk_size] for i in range(0, len(data), chunk_size))
+
+        parser = StreamingRecordParser()
+        expected = list(parser.parse_lines(iter(text.replace("\r\n", "\n").split("\n"))))
+        records = list(parser.parse_bytes(chunks))
+
+        assert [r.content for r in records] == [r.content for r in expected]
+        assert [r.first_line for r in records] == [r.first_line for r in expected]
+        assert [r.level for r in records] == ["INFO", "ERROR", "WARN"]
+        assert [r.size_bytes for r in records] == [r.size_bytes for r in expected]
+        assert [(r.start_line, r.end_line) for r in records] == [(1, 2), (3, 4), (5, 5)]
+        assert records[0].timestamp == datetime(2025, 1, 1, 10, 0, 0)
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 64])
+    @pytest.mark.parametrize("newline", ["\n", "\r\n", "\r"])
+    def test_parse_bytes_newlines_match_text_path(self, newline, chunk_size):
+        """Test every newline style splits like the universal-newline text path."""
+        lines = [
+            "2025-01-01 10:00:00.000+0000 INFO first",
+            "  detail",
+            "2025-01-01 10:00:01.000+0000 ERROR second",
+            "",
+            "2025-01-01 10:00:02.000+0000 WARN third",
+        ]
+        data = (newline.join(lines) + newline).encode("utf-8")
+        chunks = (data[i : i + chunk_size] for i in range(0, len(data), chunk_size))
+
+        parser = StreamingRecordParser()
+        handler = LogFileHandler(Path("a.log"), content=data)
+        expected = list(parser.parse_lines(handler.read_lines()))
+        records = list(parser.parse_bytes(chunks))
+
+        assert len(records) == 3
+        assert [r.content for r in records] == [r.content for r in expected]
+        assert [r.size_bytes for r in records] == [r.size_bytes for r in expected]
+        assert [(r.start_line, r.end_line) for r in records] == [
+            (r.start_line, r.end_line) for r in expected
+        ]
+
+    def test_ascii_compatible_encodings(self):
+        """Test only encodings that keep ASCII bytes use the byte path."""
+        assert is_ascii_compatible("utf-8")
+        assert is_ascii_compatible("latin-1")
+        assert not is_ascii_compatible("utf-16")
+        assert not is_ascii_compatible("no-such-codec")
+
+    def test_parse_bytes_line_spanning_many_chunks(self):
+        """Test a line longer than many chunks is reassembled intact."""
+        long_tail = "x" * 100_000
+        data = (
+            f"2025-01-01 10:00:00.000+0000 INFO {long_tail}\r\n"
+            "2025-01-01 10:00:01.000+0000 WARN next"
+        ).encode("utf-8")
+        chunks = (data[i : i + 1000] for i in range(0, len(data), 1000))
+
+        records = list(StreamingRecordParser().parse_bytes(chunks))
+
+        assert [r.level for r in records] == ["INFO", "WARN"]
+        assert records[0].content.endswith(f"INFO {long_tail}")
+        assert records[1].content == "2025-01-01 10:00:01.000+0000 WARN next"
+
+    def test_parse_bytes_oversized_line_fails_while_reading(self):
+        """Test a line over the size limit fails before the rest is read."""
+        consumed = []
+
+        def chunks():
+            yield b"2025-01-01 10:00:00.000+0000 INFO "
+            for i in range(1000):
+                consumed.append(i)
+                yield b"x" * 1024
+
+        parser = StreamingRecordParser(max_record_size_bytes=10 * 1024)
+
+        with pytest.raises(RecordSizeExceededError):
+            list(parser.parse_bytes(chunks()))
+
+        assert len(consumed) < 20
+
+    def test_parse_bytes_skips_long_preamble_lines(self):
+        """Test a long line before the first record is dropped, not over the limit."""
+        data = b"x" * 20_000 + b"\n2025-01-01 10:00:00.000+0000 INFO Start\n"
+        chunks = (data[i : i + 1024] for i in range(0, len(data), 1024))
+
+        parser = StreamingRecordParser(max_record_size_bytes=10 * 1024)
+        expected = list(parser.parse_lines(iter(data.decode().splitlines())))
+        records = list(parser.parse_bytes(chunks))
+
+        assert [r.content for r in records] == [r.content for r in expected]
+        assert [r.start_line for r in records] == [2]
+
+    def test_parse_bytes_respects_size_limit(self):
+        """Test byte-level parsing enforces max record size."""
+        data = b"2025-01-01 10:00:00.000+0000 INFO Start\n" + b"x" * 1000 + b"\n"
+
+        parser = StreamingRecordParser(max_record_size_bytes=500)
+
+        with pytest.raises(Exception) as exc_info:
+            list(parser.parse_bytes(iter([data])))
+
+        assert "size" in str(exc_info.value).lower()
+
+    def test_parser_custom_record_start_pattern(self):
+        """Test a user-supplied record start pattern is used by both parse methods."""
+        import re
+
+        pattern = re.compile(r"^\[(\d{4}-\d{2}-\d{2}) (\d{2}:\d{2}:\d{2})\] (\w+)")
+        text = "[2025-01-01 10:00:00] ERROR first\n  detail\n[2025-01-01 10:00:01] INFO second"
+
+        parser = StreamingRecordParser(record_start_pattern=pattern)
+        from_lines = list(parser.parse_lines(iter(text.split("\n"))))
+        from_bytes = list(parser.parse_bytes(iter([text.encode("utf-8")])))
+
+        for records in (from_lines, from_bytes):
+            assert [r.level for r in records] == ["ERROR", "INFO"]
+            assert records[0].content == "[2025-01-01 10:00:00] ERROR first\n  detail"
+
     def test_parser_respects_size_limit(self):
         """Test parser respects max record size."""
         # Create large record
@@ -232,6 +517,24 @@ class TestFileScanner:
         assert counts["eligible"] == 1
         assert counts["skipped"] == 1
 
+    @pytest.mark.skipif(sys.platform == "win32", reason="Symlinks need privileges on Windows")
+    def test_scanner_does_not_follow_directory_symlinks(self, tmp_path):
+        """Test recursive scan stays inside the root and stops at symlink cycles."""
+        root = tmp_path / "root"
+        nested = root / "a" / "b"
+        nested.mkdir(parents=True)
+        (nested / "app.log").write_text("2025-01-01 10:00:00 INFO test\n")
+        (nested / "back_to_a").symlink_to(root / "a")
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "secret.log").write_text("2025-01-01 10:00:00 INFO secret\n")
+        (root / "link").symlink_to(outside)
+
+        scanner = FileScanner(root)
+        paths = [f.path for f in scanner.scan()]
+
+        assert paths == [nested / "app.log"]
+
 
 class TestBufferedLogWriter:
     """Test buffered log writer."""
@@ -306,6 +609,36 @@ class TestBufferedLogWriter:
         assert "line2" in content
         assert "line3" in content
 
+    def test_writer_encodes_across_flushes(self, tmp_path):
+        """Test output stays decodable when the buffer is flushed several times."""
+        output_file = tmp_path / "output.log"
+
+        with BufferedLogWriter(output_file, buffer_size=1, encoding="utf-16") as writer:
+            writer.write_text("première\n")
+            writer.write_text("zweite ✓\n")
+
+        assert output_file.read_text(encoding="utf-16") == "première\nzweite ✓\n"
+
+    def test_writer_would_block_raises_file_error(self, tmp_path):
+        """Test a raw write that returns None is reported as a file error."""
+
+        class WouldBlock:
+            def write(self, data):
+                return None
+
+            def close(self):
+                pass
+
+        writer = BufferedLogWriter(tmp_path / "output.log")
+        writer.open()
+        writer._file_handle.close()
+        writer._file_handle = WouldBlock()
+        writer.write_text("line\n")
+
+        with pytest.raises(FileHandlingError) as exc_info:
+            writer.flush()
+        assert isinstance(exc_info.value.cause, BlockingIOError)
+
 
 class TestIntegrationPipeline:
     """Test complete file processing pipeline."""
@@ -7,6 +7,7 @@ logging configuration, and summary report generation.
 
 import json
 import logging
+import os
 from datetime import datetime
 from io import StringIO
 from pathlib import Path
@@ -22,6 +23,7 @@ from log_filter.statistics.performance import (
 from log_filter.statistics.reporter import StatisticsReporter
 from log_filter.statistics.summary import ProcessingSummary, SummaryReportGenerator
 from log_filter.utils.logging import (
+    BufferedFileHandler,
     LoggerAdapter,
     configure_component_logging,
     configure_logging,
@@ -64,6 +66,25 @@ class TestStatisticsReporter:
         assert "47.68 MB" in result or "50.00 MB" in result  # megabytes
         assert "too_large" in result
 
+    def test_console_output_written_once(self):
+        """Test the console report reaches the output in a single write."""
+
+        class RecordingOutput:
+            def __init__(self):
+                self.writes = []
+
+            def write(self, text):
+                self.writes.append(text)
+
+        stats = ProcessingStats(files_scanned=2, records_total=10, skip_reasons={"empty": 1})
+        output = RecordingOutput()
+
+        StatisticsReporter().print_console(stats, file=output)
+
+        assert len(output.writes) == 1
+        assert output.writes[0].startswith("=" * 70 + "\n")
+        assert output.writes[0].endswith("=" * 70 + "\n")
+
     def test_json_export(self, tmp_path):
         """Test JSON export functionality."""
         import time
@@ -94,6 +115,37 @@ class TestStatisticsReporter:
         assert data["records"]["matched"] == 500
         assert data["execution"]["duration_seconds"] == 60.0
 
+    @pytest.mark.parametrize("pretty", [True, False])
+    def test_json_export_same_bytes_with_and_without_orjson(self, tmp_path, monkeypatch, pretty):
+        """Test the stdlib fallback writes exactly what the orjson path writes."""
+        from log_filter.statistics import reporter as reporter_module
+
+        orjson = pytest.importorskip("orjson")
+
+        class FixedDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return cls(2025, 1, 1, 12, 0, 0)
+
+        monkeypatch.setattr(reporter_module, "datetime", FixedDatetime)
+        stats = ProcessingStats(
+            files_scanned=3,
+            skip_reasons={"empty": 2, "caf\u00e9 \u2013 size": 1},
+            start_time=1.5,
+            end_time=4.25,
+        )
+        contents = []
+        for available in (True, False):
+            monkeypatch.setattr(reporter_module, "ORJSON_AVAILABLE", available)
+            output_file = tmp_path / f"stats_{available}.json"
+            StatisticsReporter().export_json(stats, output_file, pretty=pretty)
+            contents.append(output_file.read_bytes())
+
+        assert contents[0] == contents[1]
+        data = orjson.loads(contents[1])
+        assert data["files"]["skip_reasons"] == stats.skip_reasons
+        assert data["timestamp"] == "2025-01-01T12:00:00"
+
     def test_csv_export(self, tmp_path):
         """Test CSV export functionality."""
         import time
@@ -142,6 +194,38 @@ class TestStatisticsReporter:
         assert "10.00s" in summary
 
 
+class TestStatisticsCollector:
+    """Test statistics collector batching."""
+
+    def test_apply_batch_adds_counters(self):
+        """Test batched counters are added to existing totals."""
+        collector = StatisticsCollector()
+        collector.increment_records_total(2)
+
+        collector.apply_batch(
+            {
+                "files_processed": 1,
+                "records_total": 10,
+                "records_matched": 3,
+                "total_bytes_processed": 2048,
+            }
+        )
+
+        snapshot = collector.get_snapshot()
+        assert snapshot.files_processed == 1
+        assert snapshot.records_total == 12
+        assert snapshot.records_matched == 3
+        assert snapshot.total_bytes_processed == 2048
+        assert snapshot.records_skipped == 0
+
+    def test_apply_batch_rejects_unknown_counter(self):
+        """Test unknown counter names raise AttributeError."""
+        collector = StatisticsCollector()
+
+        with pytest.raises(AttributeError):
+            collector.apply_batch({"no_such_counter": 1})
+
+
 class TestProgressTracker:
     """Test progress tracking functionality."""
 
@@ -215,6 +299,55 @@ class TestPerformanceTracker:
         assert metrics.total_bytes == 10240
         assert len(metrics.worker_times) == 2  # 2 workers
 
+    def test_metrics_without_file_copy(self):
+        """Test totals are available without copying per-file data."""
+        tracker = PerformanceTracker()
+
+        for i in range(3):
+            with tracker.track_file(Path(f"file{i}.log"), 1000, worker_id="worker-0") as timer:
+                timer.set_records(20, 5)
+
+        metrics = tracker.get_metrics(copy_files=False)
+
+        assert metrics.total_files == 3
+        assert metrics.total_records == 60
+        assert metrics.total_bytes == 3000
+        assert metrics.file_performances == []
+        assert metrics.total_time_seconds == pytest.approx(metrics.worker_times["worker-0"])
+        assert len(tracker.get_metrics().file_performances) == 3
+
+    def test_tracking_from_multiple_threads(self):
+        """Test files recorded by different threads are merged in get_metrics."""
+        import threading
+
+        tracker = PerformanceTracker()
+
+        def track(worker: int) -> None:
+            for i in range(10):
+                with tracker.track_file(
+                    Path(f"w{worker}-{i}.log"), 100, worker_id=f"worker-{worker % 2}"
+                ) as timer:
+                    timer.set_records(3, 1)
+
+        threads = [threading.Thread(target=track, args=(w,)) for w in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        metrics = tracker.get_metrics()
+
+        assert metrics.total_files == 40
+        assert metrics.total_records == 120
+        assert metrics.total_bytes == 4000
+        assert sorted(metrics.worker_times) == ["worker-0", "worker-1"]
+        assert len({p.file_path for p in metrics.file_performances}) == 40
+
+    def test_performance_dataclasses_use_slots(self):
+        """Test per-file and aggregate metrics carry no per-instance __dict__."""
+        assert not hasattr(FilePerformance("a.log", 1, 1, 1, 1.0), "__dict__")
+        assert not hasattr(PerformanceMetrics(), "__dict__")
+
     def test_performance_metrics_properties(self):
         """Test performance metrics calculated properties."""
         metrics = PerformanceMetrics(
@@ -239,6 +372,16 @@ class TestPerformanceTracker:
         assert perf.throughput_records_per_sec == 250.0
         assert abs(perf.throughput_mb_per_sec - 0.477) < 0.01
         assert perf.match_rate == 20.0
+        assert FilePerformance("/var/log/app/test.log", 0, 0, 0, 0.0).file_name == "test.log"
+
+    def test_file_performance_zero_values(self):
+        """Test derived rates are zero when nothing was timed or processed."""
+        perf = FilePerformance("empty.log", 0, 0, 0, 0.0)
+
+        assert perf.throughput_records_per_sec == 0.0
+        assert perf.throughput_mb_per_sec == 0.0
+        assert perf.match_rate == 0.0
+        assert perf == FilePerformance("empty.log", 0, 0, 0, 0.0)
 
     def test_slowest_and_largest_files(self):
         """Test getting slowest and largest files."""
@@ -262,6 +405,20 @@ class TestPerformanceTracker:
         assert len(largest) == 2
         assert largest[0].file_path == "large.log"
 
+    def test_top_files_ties_and_short_lists(self):
+        """Test top-N keeps input order for ties and handles n beyond the list."""
+        metrics = PerformanceMetrics(
+            file_performances=[
+                FilePerformance("a.log", 100, 1, 0, 1.0),
+                FilePerformance("b.log", 300, 1, 0, 2.0),
+                FilePerformance("c.log", 100, 1, 0, 1.0),
+            ]
+        )
+
+        assert [p.file_path for p in metrics.get_slowest_files(10)] == ["b.log", "a.log", "c.log"]
+        assert [p.file_path for p in metrics.get_largest_files(2)] == ["b.log", "a.log"]
+        assert metrics.get_slowest_files(0) == []
+
 
 class TestLoggingConfiguration:
     """Test logging configuration."""
@@ -284,12 +441,114 @@ class TestLoggingConfiguration:
         logger = get_logger("log_filter.test")
         logger.info("Test message")
         logger.debug("Debug message")
+        for handler in logging.getLogger().handlers:
+            handler.flush()
 
         assert log_file.exists()
         content = log_file.read_text()
         assert "Test message" in content
         assert "Debug message" in content
 
+    def test_logger_adapter_context_with_custom_format(self, capsys):
+        """Test adapter context follows the message in a custom format."""
+        configure_logging(level="INFO", format_string="[%(levelname)s] %(message)s")
+        adapter = LoggerAdapter(get_logger("log_filter.test"), {"file": "a.log"})
+
+        adapter.info("Processing")
+        get_logger("log_filter.test").info("Plain")
+
+        assert capsys.readouterr().out.splitlines() == [
+            "[INFO] Processing | file=a.log",
+            "[INFO] Plain",
+        ]
+
+    def test_configure_logging_root_level_follows_handlers(self, tmp_path):
+        """Test the root logger only admits levels some handler will emit."""
+        configure_logging(level="WARNING", log_to_console=True)
+        assert logging.getLogger().level == logging.WARNING
+        assert not logging.getLogger("thirdparty").isEnabledFor(logging.INFO)
+
+        configure_logging(level="WARNING", log_file=tmp_path / "app.log", file_level="DEBUG")
+        assert logging.getLogger().level == logging.DEBUG
+
+    def test_buffered_file_handler_flushes_in_batches(self, tmp_path):
+        """Test the file handler defers flushing until a batch fills or a warning."""
+        log_file = tmp_path / "app.log"
+        handler = BufferedFileHandler(
+            log_file, encoding="utf-8", flush_interval=3, flush_seconds=60
+        )
+        logger = logging.getLogger("log_filter.test.buffered")
+        logger.addHandler(handler)
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        try:
+            logger.info("one")
+            logger.info("two")
+            assert log_file.read_text() == ""
+
+            logger.info("three")
+            assert log_file.read_text() == "one\ntwo\nthree\n"
+
+            logger.info("four")
+            logger.warning("five")
+            assert log_file.read_text().endswith("four\nfive\n")
+
+            logger.info("six")
+            handler.close()
+            assert log_file.read_text().endswith("six\n")
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+
+    def test_buffered_file_handler_flushes_old_batches(self, tmp_path):
+        """Test a record arriving after flush_seconds flushes the batch."""
+        log_file = tmp_path / "app.log"
+        handler = BufferedFileHandler(log_file, encoding="utf-8", flush_seconds=0)
+        logger = logging.getLogger("log_filter.test.buffered_time")
+        logger.addHandler(handler)
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        try:
+            logger.info("one")
+            assert log_file.read_text() == "one\n"
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires os.fork")
+    def test_buffered_file_handler_flushes_around_fork(self, tmp_path):
+        """Test a forked child neither repeats the parent's records nor loses its own."""
+        log_file = tmp_path / "app.log"
+        handler = BufferedFileHandler(log_file, encoding="utf-8", flush_seconds=60)
+        logger = logging.getLogger("log_filter.test.buffered_fork")
+        logger.addHandler(handler)
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        try:
+            logger.info("parent")
+            pid = os.fork()
+            if pid == 0:
+                # Exit like a pool worker, without logging.shutdown
+                logger.info("child")
+                os._exit(0)
+            os.waitpid(pid, 0)
+            handler.flush()
+            assert log_file.read_text() == "parent\nchild\n"
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+
+    @pytest.mark.parametrize("level", ["debug", "DEBUG", "Debug"])
+    def test_configure_component_logging_level_case(self, level):
+        """Test log levels are accepted in any case."""
+        configure_component_logging("log_filter.test", level)
+        assert logging.getLogger("log_filter.test").level == logging.DEBUG
+
+    def test_configure_component_logging_invalid_level(self):
+        """Test unknown log levels are rejected."""
+        with pytest.raises(ValueError, match="Invalid log level: VERBOSE"):
+            configure_component_logging("log_filter.test", "VERBOSE")
+
     def test_configure_component_logging(self):
         """Test component-specific logging configuration."""
         configure_logging(level="INFO")
@@ -311,6 +570,39 @@ class TestLoggingConfiguration:
         assert "file=test.log" in captured.out
         assert "worker=worker-1" in captured.out
 
+    def test_logger_adapter_context_field(self, capsys):
+        """Test adapter context is rendered by the formatter, not into the message."""
+        configure_logging(level="INFO", log_to_console=True)
+        base_logger = get_logger("log_filter.test")
+        adapter = LoggerAdapter(base_logger, {"file": "test.log"})
+
+        adapter.info("Processing %s", "chunk", extra={"worker": "worker-1"})
+        base_logger.info("Plain message")
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0].endswith("| Processing chunk | file=test.log")
+        assert lines[1].endswith("| Plain message")
+
+    def test_logger_adapter_context_on_unconfigured_handler(self):
+        """Test handlers without %(context)s get the context only as a record field."""
+        stream = StringIO()
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        records = []
+        handler.addFilter(lambda record: records.append(record) or True)
+        base_logger = logging.getLogger("log_filter.test.unconfigured")
+        base_logger.addHandler(handler)
+        base_logger.setLevel(logging.INFO)
+        base_logger.propagate = False
+
+        try:
+            LoggerAdapter(base_logger, {"file": "test.log"}).info("Processing %s", "chunk")
+        finally:
+            base_logger.removeHandler(handler)
+
+        assert stream.getvalue() == "Processing chunk\n"
+        assert records[0].context == " | file=test.log"
+
     def test_create_file_logger(self, capsys):
         """Test file logger creation."""
         configure_logging(level="INFO", log_to_console=True)
@@ -378,6 +670,31 @@ class TestSummaryReportGenerator:
         assert "Error processing file X" in result
         assert "Large file detected" in result
 
+    def test_console_report_written_once(self):
+        """Test the summary report reaches the output in a single write."""
+
+        class RecordingOutput:
+            def __init__(self):
+                self.writes = []
+
+            def write(self, text):
+                self.writes.append(text)
+
+        summary = ProcessingSummary(
+            statistics=ProcessingStats(),
+            performance=PerformanceMetrics(),
+            timestamp=datetime.now(),
+            errors=["boom"],
+            warnings=[],
+        )
+        output = RecordingOutput()
+
+        SummaryReportGenerator().generate_console_report(summary, file=output)
+
+        assert len(output.writes) == 1
+        assert "1. boom" in output.writes[0]
+        assert output.writes[0].rstrip().endswith("=" * 70)
+
     def test_markdown_report_generation(self, tmp_path):
         """Test markdown report generation."""
         import time
@@ -515,6 +832,8 @@ class TestIntegratedObservability:
         assert perf_metrics.total_records == 300
 
         # Verify logging
+        for handler in logging.getLogger().handlers:
+            handler.flush()
         assert log_file.exists()
         log_content = log_file.read_text()
         assert "Processing started" in log_content
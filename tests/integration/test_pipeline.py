@@ -17,10 +17,11 @@ from log_filter.config.models import (
     ProcessingConfig,
     SearchConfig,
 )
+from log_filter.core.parser import parse
 from log_filter.domain.filters import DateRangeFilter, TimeRangeFilter
-from log_filter.domain.models import LogRecord
+from log_filter.domain.models import FileMetadata, LogRecord
 from log_filter.infrastructure.file_handler_factory import FileHandlerFactory
-from log_filter.processing.pipeline import ProcessingPipeline
+from log_filter.processing.pipeline import ProcessingPipeline, _build_matcher, _order_and_terms
 from log_filter.processing.record_parser import StreamingRecordParser
 from log_filter.statistics.collector import StatisticsCollector
 
@@ -61,6 +62,7 @@ class TestStatisticsCollector:
         assert collector.stats.files_skipped == 6
         assert collector.stats.skip_reasons["size-limit"] == 3
         assert collector.stats.skip_reasons["name-filter"] == 3
+        assert collector.stats.skip_reasons.most_common(1) == [("size-limit", 3)]
 
     def test_collector_duration(self):
         """Test collector tracks duration."""
@@ -83,6 +85,38 @@ class TestStatisticsCollector:
         assert snapshot1.files_processed == 5
         assert snapshot2.files_processed == 8
 
+    def test_collector_merges_thread_counters(self):
+        """Test counters updated from several threads are summed."""
+        import threading
+
+        collector = StatisticsCollector()
+
+        def work():
+            for _ in range(1000):
+                collector.increment_records_total()
+            collector.increment_files_skipped("error")
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = collector.get_snapshot()
+        assert stats.records_total == 4000
+        assert stats.files_skipped == 4
+        assert stats.skip_reasons == {"error": 4}
+
+    def test_collector_reset(self):
+        """Test reset clears counters from every thread."""
+        collector = StatisticsCollector()
+        collector.increment_records_total(10)
+
+        collector.reset()
+        collector.increment_records_total(2)
+
+        assert collector.stats.records_total == 2
+
 
 class TestFilters:
     """Test record filters."""
@@ -191,6 +225,61 @@ class TestFileHandlerFactory:
         assert factory.supports_file(Path("test.txt")) is False
 
 
+class TestBuildMatcher:
+    """Test matcher specialization for search configuration."""
+
+    def test_matcher_case_sensitive(self):
+        """Test case-sensitive substring matcher."""
+        matcher = _build_matcher(parse("ERROR AND Kafka"), SearchConfig(expression="ERROR"))
+
+        assert matcher("ERROR in Kafka consumer") is True
+        assert matcher("error in kafka consumer") is False
+
+    def test_matcher_ignore_case(self):
+        """Test case-insensitive matcher folds terms once."""
+        matcher = _build_matcher(
+            parse("Error AND NOT Debug"), SearchConfig(expression="Error", ignore_case=True)
+        )
+
+        assert matcher("ERROR in Kafka consumer") is True
+        assert matcher("error with DEBUG details") is False
+
+    def test_matcher_regex(self):
+        """Test regex matcher uses pre-compiled patterns."""
+        matcher = _build_matcher(
+            parse("ERROR\\s+\\d{3}"),
+            SearchConfig(expression="ERROR", use_regex=True, ignore_case=True),
+        )
+
+        assert matcher("error   500 from upstream") is True
+        assert matcher("error code") is False
+
+    def test_matcher_word_boundary_boolean(self):
+        """Test word-boundary matcher with OR and NOT terms."""
+        search = SearchConfig(expression="ERROR", word_boundary=True)
+        matcher = _build_matcher(parse("(ERROR OR WARN) AND NOT timeout"), search)
+
+        assert matcher("WARN disk almost full") is True
+        assert matcher("ERRORS everywhere") is False
+        assert matcher("ERROR timeout on request") is False
+        assert matcher("INFO all good") is False
+
+    def test_order_and_terms_puts_longer_literal_first(self):
+        """Test AND children are reordered without changing the expression."""
+        ast = parse("MOVE AND (eventEntity AND NOT debug)")
+
+        assert _order_and_terms(ast) == (
+            "AND",
+            ("WORD", "MOVE"),
+            ("AND", ("WORD", "eventEntity"), ("NOT", ("WORD", "debug"))),
+        )
+        assert _order_and_terms(parse("MOVE AND eventEntity")) == (
+            "AND",
+            ("WORD", "eventEntity"),
+            ("WORD", "MOVE"),
+        )
+
+
 class TestProcessingPipeline:
     """Test processing pipeline integration."""
 
@@ -223,6 +312,44 @@ class TestProcessingPipeline:
         assert stats.files_processed == 1
         assert stats.records_total == 3
         assert stats.records_matched == 1
+        assert stats.records_skipped == 0
+        assert stats.total_lines_processed == 3
+
+    def test_pipeline_multiprocess_output_follows_file_order(self, tmp_path):
+        """Test worker processes write matches in input file order."""
+        files = []
+        for index, lines in enumerate([400, 1, 200, 1]):
+            log_file = tmp_path / f"app{index}.log"
+            log_file.write_text(
+                "".join(
+                    f"2025-01-01 10:00:00.000+0000 ERROR file{index} line{n}\n"
+                    for n in range(lines)
+                )
+            )
+            files.append(
+                FileMetadata(
+                    path=log_file,
+                    size_bytes=log_file.stat().st_size,
+                    extension=".log",
+                    is_compressed=False,
+                )
+            )
+
+        output_file = tmp_path / "output.log"
+        config = ApplicationConfig(
+            search=SearchConfig(expression="ERROR"),
+            files=FileConfig(path=tmp_path),
+            output=OutputConfig(output_file=output_file, show_progress=False, show_stats=False),
+            processing=ProcessingConfig(worker_count=2),
+        )
+
+        pipeline = ProcessingPipeline(config)
+        pipeline._process_files(files, parse("ERROR"), None)
+
+        file_order = [line.split()[4] for line in output_file.read_text().splitlines()]
+        first_seen = list(dict.fromkeys(file_order))
+        assert first_seen == ["file0", "file1", "file2", "file3"]
+        assert pipeline.stats.get_snapshot().records_matched == 602
 
     def test_pipeline_handles_date_filtering(self, tmp_path):
         """Test pipeline applies date filtering."""
@@ -192,16 +192,25 @@ class TestPatternCaching:
     def test_pattern_caching(self) -> None:
         """Test that patterns are cached."""
         evaluator = ExpressionEvaluator(use_regex=True)
-        ast = parse("ERROR")
+        ast = parse("ERR.R")
 
         # First evaluation compiles pattern
         evaluator.evaluate(ast, "ERROR message")
-        assert "ERROR" in evaluator.compiled_patterns
+        assert "ERR.R" in evaluator.compiled_patterns
 
         # Second evaluation uses cached pattern
         evaluator.evaluate(ast, "Another ERROR")
         assert len(evaluator.compiled_patterns) == 1
 
+    def test_literal_regex_term_skips_compilation(self) -> None:
+        """Test regex terms without metacharacters are matched as plain text."""
+        evaluator = ExpressionEvaluator(use_regex=True)
+        ast = parse("Kafka AND NOT timeout")
+
+        assert evaluator.evaluate(ast, "Kafka broker down") is True
+        assert evaluator.evaluate(ast, "Kafka timeout") is False
+        assert evaluator.compiled_patterns == {}
+
     def test_pre_compiled_patterns(self) -> None:
         """Test using pre-compiled patterns."""
         import re
@@ -304,6 +313,80 @@ class TestErrorHandling:
             evaluator.evaluate(("AND", ("WORD", "test")), "text")  # type: ignore
 
 
+class TestCompiledMatcher:
+    """Tests for ExpressionEvaluator.compile."""
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {},
+            {"ignore_case": True},
+            {"use_regex": True},
+            {"word_boundary": True},
+            {"word_boundary": True, "ignore_case": True},
+            {"strip_quotes": True},
+        ],
+    )
+    def test_compiled_matches_evaluate(self, options: dict) -> None:
+        """Test compiled matcher agrees with evaluate for every mode."""
+        ast = parse('(ERROR OR "warn") AND NOT timeout AND Kafka')
+        evaluator = ExpressionEvaluator(**options)
+        matcher = evaluator.compile(ast)
+        texts = [
+            "ERROR in Kafka consumer",
+            "error in kafka consumer",
+            'WARN: "Kafka" timeout',
+            "warn Kafka_lag",
+            "ERRORS from Kafka",
+            "",
+        ]
+
+        for text in texts:
+            assert matcher(text) is evaluator.evaluate(ast, text)
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"ignore_case": True},
+            {"word_boundary": True},
+            {"word_boundary": True, "ignore_case": True},
+        ],
+    )
+    @pytest.mark.parametrize(
+        "term, text",
+        [
+            ("istanbul", "\u0130stanbul x"),
+            ("stra\u00dfe", "STRASSE"),
+            ("caf\u00e9", "le CAF\u00c9 noir"),
+            ("k", "\u212a x"),
+        ],
+    )
+    def test_compiled_matches_evaluate_non_ascii(self, options: dict, term: str, text: str) -> None:
+        """Test compiled matcher agrees with evaluate when case folding is not 1:1."""
+        evaluator = ExpressionEvaluator(**options)
+        ast = ("WORD", term)
+
+        assert evaluator.compile(ast)(text) is evaluator.evaluate(ast, text)
+
+    def test_compile_is_cached(self) -> None:
+        """Test compiling the same AST twice returns the same matcher."""
+        evaluator = ExpressionEvaluator()
+        ast = parse("ERROR AND Kafka")
+        assert evaluator.compile(ast) is evaluator.compile(parse("ERROR AND Kafka"))
+
+    def test_compile_malformed_ast(self) -> None:
+        """Test malformed AST is rejected when compiling."""
+        evaluator = ExpressionEvaluator()
+        with pytest.raises(EvaluationError, match="Invalid AND node"):
+            evaluator.compile(("AND", ("WORD", "test")))  # type: ignore
+
+    def test_compiled_invalid_regex(self) -> None:
+        """Test invalid regex raises EvaluationError when matching."""
+        matcher = ExpressionEvaluator(use_regex=True).compile(("WORD", "[invalid"))
+        with pytest.raises(EvaluationError, match="Invalid regex"):
+            matcher("text")
+
+
 class TestRealWorldScenarios:
     """Tests with real-world log scenarios."""
 
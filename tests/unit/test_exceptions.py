@@ -252,6 +252,14 @@ class TestFileHandlingError:
         # Should not have extra colon or path separator
         assert error_str.count(":") == 0 or "caused by" not in error_str
 
+    def test_file_handling_error_is_os_error(self):
+        """Test FileHandlingError can be caught as OSError."""
+        with pytest.raises(OSError) as excinfo:
+            raise FileHandlingError("Cannot read file", file_path="/var/log/app.log")
+
+        assert excinfo.value.file_path == "/var/log/app.log"
+        assert str(excinfo.value) == "Cannot read file: /var/log/app.log"
+
 
 class TestRecordSizeExceededError:
     """Test RecordSizeExceededError exception."""
@@ -170,6 +170,19 @@ class TestLogFileHandler:
         assert is_valid is True
         assert error is None
 
+    def test_validate_truncated_header(self, tmp_path):
+        """Test validation rejects a gzip file too short to hold a trailer."""
+        test_file = tmp_path / "truncated.log.gz"
+        with gzip.open(test_file, "wt") as f:
+            f.write("line 1\n")
+        test_file.write_bytes(test_file.read_bytes()[:12])
+
+        handler = GzipFileHandler(test_file)
+        is_valid, error = handler.validate()
+
+        assert is_valid is False
+        assert error == "Unexpected end of file"
+
     def test_validate_with_fallback_encoding(self, tmp_path):
         """Test validation succeeds with fallback encoding."""
         test_file = tmp_path / "latin.log"
@@ -234,6 +247,17 @@ class TestLogFileHandler:
         assert len(lines) == 1
         assert "caf" in lines[0]
 
+    def test_in_memory_content(self):
+        """Test reading content passed in memory without touching the file system."""
+        handler = LogFileHandler(
+            Path("does-not-exist.log"), errors="strict", content=b"caf\xe9\r\nline 2\n"
+        )
+
+        assert handler.validate() == (True, None)
+        assert list(handler.read_lines()) == ["caf\xe9", "line 2"]
+        assert b"".join(handler.read_bytes()) == b"caf\xe9\r\nline 2\n"
+        assert handler.get_size_bytes() == 13
+
 
 class TestGzipFileHandler:
     """Test GzipFileHandler for compressed log files."""
@@ -465,6 +489,22 @@ class TestGzipFileHandler:
         """Test that fallback encodings are defined."""
         assert GzipFileHandler.FALLBACK_ENCODINGS == ["utf-8", "latin-1", "cp1252"]
 
+    def test_in_memory_content(self):
+        """Test decompressing content passed in memory without touching the file system."""
+        content = gzip.compress(b"line 1\nline 2\n")
+        handler = GzipFileHandler(Path("does-not-exist.log.gz"), content=content)
+
+        assert handler.validate() == (True, None)
+        assert list(handler.read_lines()) == ["line 1", "line 2"]
+        assert b"".join(handler.read_bytes()) == b"line 1\nline 2\n"
+        assert handler.get_size_bytes() == len(content)
+
+    def test_in_memory_content_invalid(self):
+        """Test in-memory content that is not gzip fails validation."""
+        handler = GzipFileHandler(Path("does-not-exist.log.gz"), content=b"plain text log")
+
+        assert handler.validate() == (False, "Invalid or corrupted gzip file")
+
 
 class TestAbstractFileHandler:
     """Test AbstractFileHandler base class."""
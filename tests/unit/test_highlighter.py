@@ -2,9 +2,11 @@
 Tests for text highlighting utilities.
 """
 
+import re
+
 import pytest
 
-from log_filter.utils.highlighter import TextHighlighter, highlight_text
+from log_filter.utils.highlighter import TextHighlighter, highlight_text, highlight_text_many
 
 
 class TestTextHighlighter:
@@ -106,6 +108,112 @@ class TestTextHighlighter:
         # Both instances should be highlighted
         assert result.count("<<<Error>>>") == 2
 
+    def test_highlight_prefers_longest_pattern_at_position(self) -> None:
+        """Test a pattern contained in another is not highlighted inside it."""
+        highlighter = TextHighlighter()
+        text = "ErrorCode and Error"
+        result = highlighter.highlight(text, ["Error", "ErrorCode"], ignore_case=False)
+        assert result == "<<<ErrorCode>>> and <<<Error>>>"
+
+    def test_highlight_does_not_match_inserted_markers(self) -> None:
+        """Test patterns overlapping the markers do not re-highlight them."""
+        highlighter = TextHighlighter()
+        text = "a < b"
+        result = highlighter.highlight(text, ["<", "b"], ignore_case=False)
+        assert result == "a <<<<>>> <<<b>>>"
+
+    def test_highlight_multiple_regexes_in_one_pass(self) -> None:
+        """Test regex patterns are combined and earlier patterns take priority."""
+        highlighter = TextHighlighter()
+        text = "retry 3 of 10"
+        result = highlighter.highlight(text, [r"\d+ of \d+", r"\d+", "[invalid"], use_regex=True)
+        assert result == "retry <<<3 of 10>>>"
+
+    def test_highlight_regexes_with_backreferences(self) -> None:
+        """Test numbered backreferences keep working when several regexes are given."""
+        highlighter = TextHighlighter()
+        text = "aa bb c"
+        result = highlighter.highlight(text, [r"(\w)\1", "c"], use_regex=True)
+        assert result == "<<<aa>>> <<<bb>>> <<<c>>>"
+
+    def test_highlight_single_literal_without_regex(self) -> None:
+        """Test a single case-sensitive literal is highlighted without compiling a regex."""
+        highlighter = TextHighlighter()
+        result = highlighter.highlight("a.b a.b axb", ["", "a.b"])
+        assert result == "<<<a.b>>> <<<a.b>>> axb"
+        assert highlighter._compiled == {}
+
+    @pytest.mark.parametrize(
+        "text, patterns, expected",
+        [
+            ("aa < b", [r"(\w)\1", "<"], "<<<aa>>> <<<<>>> b"),
+            ("aab", [r"(\w)\1", r"\w+"], "<<<aa>>><<<b>>>"),
+            ("xyzzy", [r"y", r"(z)\1y"], "x<<<y>>><<<zzy>>>"),
+            ("ERROR", [r"(\w)\1", "x?"], "E<<<RR>>>OR"),
+            ("ERROR disk", [r"(?P<w>disk)", r"(?P<w>ERR)", "z*"], "<<<ERR>>>OR <<<disk>>>"),
+        ],
+    )
+    def test_highlight_separate_regexes_never_rehighlight(
+        self, text: str, patterns: list[str], expected: str
+    ) -> None:
+        """Test regexes that cannot be combined still do not match inserted markers."""
+        highlighter = TextHighlighter()
+        assert highlighter.highlight(text, patterns, use_regex=True) == expected
+
+    def test_highlight_without_match_returns_text_unchanged(self) -> None:
+        """Test texts containing no pattern are returned as the same object."""
+        highlighter = TextHighlighter()
+        text = "INFO: all good"
+        assert highlighter.highlight(text, ["ERROR", "fail"]) is text
+        assert highlighter.highlight(text, ["ERROR", "fail"], ignore_case=True) is text
+
+    def test_highlight_case_insensitive_non_ascii(self) -> None:
+        """Test case-insensitive matches that lower-casing alone would miss."""
+        highlighter = TextHighlighter()
+        text = "Kelvin \u212a and long \u017f"
+        result = highlighter.highlight(text, ["k", "s"], ignore_case=True)
+        assert result == "<<<K>>>elvin <<<\u212a>>> and long <<<\u017f>>>"
+
+    @pytest.mark.parametrize(
+        "text, patterns, expected",
+        [
+            ("ERROR error Error", ["error"], "<<<ERROR>>> <<<error>>> <<<Error>>>"),
+            ("xaab", ["aab", "XA"], "<<<xa>>>ab"),
+            ("aaa", ["aa", "A"], "<<<aa>>><<<a>>>"),
+            ("Timeout; TIME out", ["time", "timeout"], "<<<Timeout>>>; <<<TIME>>> out"),
+        ],
+    )
+    def test_highlight_case_insensitive_ascii_literals(
+        self, text: str, patterns: list[str], expected: str
+    ) -> None:
+        """Test case-insensitive literal matches keep the original text and priority."""
+        highlighter = TextHighlighter()
+        assert highlighter.highlight(text, patterns, ignore_case=True) == expected
+
+    @pytest.mark.parametrize("pattern", [r"\d+ms|ERROR", r"x*", r"(?<=\s)\w"])
+    def test_highlight_with_compiled_pattern_matches_sub(self, pattern: str) -> None:
+        """Test compiled-pattern highlighting agrees with re.sub, empty matches included."""
+        highlighter = TextHighlighter()
+        compiled = re.compile(pattern)
+        text = "ERROR took 45ms, retry in 10ms"
+        expected = compiled.sub(r"<<<\g<0>>>>", text)
+        assert highlighter.highlight_with_compiled_pattern(text, compiled) == expected
+
+    @pytest.mark.parametrize("ignore_case", [False, True])
+    @pytest.mark.parametrize(
+        "patterns, use_regex",
+        [(["Error", "", "fail"], False), ([r"\d+", "[invalid", "Error"], True), ([""], False)],
+    )
+    def test_highlight_many_matches_highlight(
+        self, patterns: list[str], use_regex: bool, ignore_case: bool
+    ) -> None:
+        """Test batch highlighting gives the same result as highlighting each text."""
+        highlighter = TextHighlighter()
+        texts = ["Error 42 here", "", "nothing", "ERROR: failed 7 times"]
+        expected = [highlighter.highlight(t, patterns, ignore_case, use_regex) for t in texts]
+        result = highlighter.highlight_many(iter(texts), patterns, ignore_case, use_regex)
+        assert list(result) == expected
+
     def test_highlight_with_custom_markers(self) -> None:
         """Test highlighting with custom markers."""
         highlighter = TextHighlighter(start_marker="[[", end_marker="]]")
@@ -121,6 +229,30 @@ class TestTextHighlighter:
         # Should return original text if regex is invalid
         assert result == "Error occurred"
 
+    def test_compiled_patterns_are_reused(self) -> None:
+        """Test repeated highlighting compiles each pattern set once."""
+        highlighter = TextHighlighter()
+        highlighter.highlight("Error here", ["Error", "here"])
+        highlighter.highlight("Error there", ["Error", "here"])
+        highlighter.highlight("code 42", [r"\d+", "[invalid"], use_regex=True)
+        highlighter.highlight("code 7", [r"\d+", "[invalid"], use_regex=True)
+
+        assert set(highlighter._compiled) == {
+            (("Error", "here"), False),
+            (r"\d+", False),
+            ("[invalid", False),
+        }
+        assert highlighter._compiled[("[invalid", False)] is None
+        assert set(highlighter._regex_sets) == {((r"\d+", "[invalid"), False)}
+
+    def test_compiled_patterns_shared_between_instances(self) -> None:
+        """Test separate highlighters compile each pattern, valid or not, once."""
+        TextHighlighter._compile.cache_clear()
+        for markers in (("<", ">"), ("[", "]")):
+            TextHighlighter(*markers).highlight("code 42", [r"\d+", "[invalid"], use_regex=True)
+
+        assert TextHighlighter._compile.cache_info().misses == 2
+
 
 class TestHighlightTextFunction:
     """Tests for highlight_text convenience function."""
@@ -155,6 +287,25 @@ class TestHighlightTextFunction:
         result = highlight_text(text, ["Error", "failed"])
         assert result == "<<<Error>>>: connection <<<failed>>>"
 
+    def test_highlight_text_many(self) -> None:
+        """Test highlight_text_many highlights each text with custom markers."""
+        result = highlight_text_many(
+            ["Error here", "no match"],
+            ["error"],
+            ignore_case=True,
+            start_marker="[",
+            end_marker="]",
+        )
+        assert list(result) == ["[Error] here", "no match"]
+
+    def test_highlight_text_reuses_highlighter(self) -> None:
+        """Test highlight_text shares one highlighter per marker pair."""
+        from log_filter.utils.highlighter import _shared_highlighter
+
+        highlight_text("Error", ["Error", "Warn"], start_marker="{", end_marker="}")
+        assert _shared_highlighter("{", "}") is _shared_highlighter("{", "}")
+        assert (("Error", "Warn"), False) in _shared_highlighter("{", "}")._compiled
+
 
 class TestHighlighterIntegration:
     """Integration tests for highlighter."""
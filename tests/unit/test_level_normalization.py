@@ -134,6 +134,24 @@ class TestLevelNormalization:
         assert records[3].level == "WARN"  # W normalized to WARN
         assert records[4].level == "WARN"  # WARNING normalized to WARN
 
+    @pytest.mark.parametrize("normalize_levels", [True, False])
+    def test_parsed_levels_share_one_string(self, normalize_levels):
+        """Test records with the same level reference a single string object."""
+        parser = StreamingRecordParser(normalize_levels=normalize_levels)
+
+        lines = [
+            "2025-01-08 10:00:00.000+0000 ERROR First",
+            "2025-01-08 10:00:01.000+0000 ERROR Second",
+            "2025-01-08 10:00:02.000+0000 CUSTOM Third",
+            "2025-01-08 10:00:03.000+0000 CUSTOM Fourth",
+        ]
+
+        records = list(parser.parse_bytes([("\n".join(lines)).encode()]))
+        records += list(parser.parse_lines(iter(lines)))
+
+        assert all(r.level is records[0].level for r in records[0::4] + records[1::4])
+        assert all(r.level is records[2].level for r in records[2::4] + records[3::4])
+
     def test_parse_with_normalization_disabled(self):
         """Test parsing preserves raw levels when normalization is disabled."""
         parser = StreamingRecordParser(normalize_levels=False)
@@ -88,6 +88,12 @@ class TestExpressionParser:
         ast = parse('"ERROR message" AND WARN')
         assert ast == ("AND", ("WORD", "ERROR message"), ("WORD", "WARN"))
 
+    def test_repeated_expression_is_cached(self) -> None:
+        """Test parsing the same expression twice reuses the cached AST."""
+        first = parse("ERROR AND Kafka")
+        assert parse("ERROR AND Kafka") is first
+        assert parse("ERROR OR Kafka") is not first
+
     def test_empty_expression(self) -> None:
         """Test parsing empty expression raises error."""
         with pytest.raises(TokenizationError, match="Empty expression"):
@@ -10,7 +10,7 @@ Tests ProgressTracker and ProgressCounter classes:
 
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 
 import pytest
 
@@ -27,6 +27,8 @@ class TestProgressTracker:
 
         assert tracker.enable is True
         assert tracker.desc_width == 25
+        assert tracker.record_mininterval == 0.25
+        assert tracker.record_miniters == 10000
 
     def test_initialization_disabled(self):
         """Test tracker initialization disabled."""
@@ -113,6 +115,7 @@ class TestProgressTracker:
 
             call_kwargs = mock_tqdm.call_args[1]
             assert "Scanning" in call_kwargs["desc"]
+            assert len(call_kwargs["desc"]) == tracker.desc_width
 
     def test_track_records_disabled(self):
         """Test track_records with progress disabled."""
@@ -154,16 +157,36 @@ class TestProgressTracker:
         ]
 
         with patch("log_filter.utils.progress.tqdm") as mock_tqdm:
-            mock_tqdm.return_value.__enter__.return_value = iter(records)
+            mock_pbar = Mock()
+            mock_tqdm.return_value.__enter__.return_value = mock_pbar
             mock_tqdm.return_value.__exit__.return_value = None
 
             result = list(tracker.track_records(iter(records), total=5))
 
-            assert len(result) == 5
+            assert result == records
             mock_tqdm.assert_called_once()
+            mock_pbar.update.assert_called_once_with(5)
             call_kwargs = mock_tqdm.call_args[1]
+            assert "iterable" not in call_kwargs
             assert call_kwargs["unit"] == "rec"
             assert call_kwargs["unit_scale"] is True
+            assert call_kwargs["mininterval"] == tracker.record_mininterval
+            assert call_kwargs["miniters"] == tracker.record_miniters
+
+    def test_track_records_updates_in_batches(self):
+        """Test the record bar is advanced in batches that add up to the total."""
+        tracker = ProgressTracker(enable=True)
+
+        with patch("log_filter.utils.progress.tqdm") as mock_tqdm:
+            mock_pbar = Mock()
+            mock_tqdm.return_value.__enter__.return_value = mock_pbar
+            mock_tqdm.return_value.__exit__.return_value = None
+
+            consumed = sum(1 for _ in tracker.track_records(iter(range(40000))))
+
+            updates = [c.args[0] for c in mock_pbar.update.call_args_list]
+            assert consumed == 40000
+            assert updates == [16384, 16384, 40000 - 2 * 16384]
 
     def test_track_generic_disabled(self):
         """Test track_generic with progress disabled."""
@@ -318,6 +341,26 @@ class TestProgressCounter:
 
             assert mock_pbar.set_description.called
 
+    def test_unchanged_status_is_not_resent(self):
+        """Test repeated descriptions and postfixes only reach the bar once."""
+        counter = ProgressCounter(enable=True, total=100, desc="Test....", unit="item")
+
+        with patch("log_filter.utils.progress.tqdm") as mock_tqdm:
+            mock_pbar = Mock()
+            mock_tqdm.return_value = mock_pbar
+
+            with counter:
+                for _ in range(3):
+                    counter.set_description("Step")
+                    counter.set_postfix_str("file.log")
+                counter.set_description("Done")
+
+            assert mock_pbar.set_description.call_args_list == [
+                call("Step    ", refresh=False),
+                call("Done    ", refresh=False),
+            ]
+            mock_pbar.set_postfix_str.assert_called_once_with("file.log", refresh=False)
+
     def test_set_description_disabled(self):
         """Test set_description with progress disabled."""
         counter = ProgressCounter(enable=False, total=100, desc="Test", unit="item")
@@ -384,7 +427,7 @@ class TestProgressTrackerIntegration:
             list(tracker.track_files(iter(files), total=1))
 
             # Should truncate to 30 chars
-            assert mock_pbar.set_postfix_str.called
+            mock_pbar.set_postfix_str.assert_called_once_with("a" * 30, refresh=False)
 
     def test_empty_iterator(self):
         """Test tracking empty iterator."""
@@ -220,9 +220,11 @@ class TestRecordProcessing:
         file_worker.process_file(sample_file_meta, ast, mock_writer, sample_config)
 
         # Verify all records counted
-        assert file_worker.stats_collector.increment_records_total.call_count == 3
-        assert file_worker.stats_collector.add_bytes_processed.call_count == 3
-        assert file_worker.stats_collector.add_lines_processed.call_count == 3
+        file_worker.stats_collector.apply_batch.assert_called_once()
+        batch = file_worker.stats_collector.apply_batch.call_args.args[0]
+        assert batch["records_total"] == 3
+        assert batch["total_bytes_processed"] == 3 * 35
+        assert batch["total_lines_processed"] == 3
 
     def test_process_file_respects_filter(
         self,
@@ -253,7 +255,9 @@ class TestRecordProcessing:
 
         # Verify record was filtered out
         assert matches == 0
-        file_worker.stats_collector.increment_records_skipped.assert_called_once()
+        batch = file_worker.stats_collector.apply_batch.call_args.args[0]
+        assert batch["records_skipped"] == 1
+        assert batch["records_matched"] == 0
         mock_writer.write_result.assert_not_called()
 
     def test_process_file_with_matching_record(
@@ -281,7 +285,8 @@ class TestRecordProcessing:
 
         # Verify record was matched and written
         assert matches == 1
-        file_worker.stats_collector.increment_records_matched.assert_called_once()
+        batch = file_worker.stats_collector.apply_batch.call_args.args[0]
+        assert batch["records_matched"] == 1
         file_worker.stats_collector.increment_files_processed.assert_called_once()
         mock_writer.write_result.assert_called_once()
 
@@ -499,7 +504,9 @@ class TestErrorHandling:
 
         # Verify partial match was returned
         assert matches == 1
-        file_worker.stats_collector.increment_records_matched.assert_called_once()
+        file_worker.stats_collector.apply_batch.assert_called_once()
+        batch = file_worker.stats_collector.apply_batch.call_args.args[0]
+        assert batch["records_matched"] == 1
 
 
 class TestRegexMode:
@@ -566,6 +573,65 @@ class TestRegexMode:
         assert matches == 1
 
 
+class TestEvaluatorReuse:
+    """Test evaluator setup is shared across files."""
+
+    def test_evaluator_reused_for_same_search(
+        self,
+        file_worker,
+        sample_file_meta,
+        sample_config,
+        mock_writer,
+        mock_handler_factory,
+        mock_record_parser,
+        sample_record,
+    ):
+        """Test worker builds the evaluator once for repeated files."""
+        mock_handler = Mock()
+        mock_handler.validate.return_value = (True, None)
+        mock_handler.read_lines.return_value = iter(["line1"])
+        mock_handler_factory.create_handler.return_value = mock_handler
+
+        ast = ("WORD", "ERROR")
+        mock_record_parser.parse_lines.return_value = iter([sample_record])
+        file_worker.process_file(sample_file_meta, ast, mock_writer, sample_config)
+        first_evaluator = file_worker._evaluator
+
+        mock_record_parser.parse_lines.return_value = iter([sample_record])
+        matches = file_worker.process_file(sample_file_meta, ast, mock_writer, sample_config)
+
+        assert matches == 1
+        assert file_worker._evaluator is first_evaluator
+
+    def test_evaluator_rebuilt_when_search_changes(
+        self,
+        file_worker,
+        sample_file_meta,
+        sample_config,
+        mock_writer,
+        mock_handler_factory,
+        mock_record_parser,
+        sample_record,
+    ):
+        """Test worker rebuilds the evaluator for a different search."""
+        mock_handler = Mock()
+        mock_handler.validate.return_value = (True, None)
+        mock_handler.read_lines.return_value = iter(["line1"])
+        mock_handler_factory.create_handler.return_value = mock_handler
+
+        mock_record_parser.parse_lines.return_value = iter([sample_record])
+        file_worker.process_file(sample_file_meta, ("WORD", "ERROR"), mock_writer, sample_config)
+        first_evaluator = file_worker._evaluator
+
+        mock_record_parser.parse_lines.return_value = iter([sample_record])
+        matches = file_worker.process_file(
+            sample_file_meta, ("WORD", "missing"), mock_writer, sample_config
+        )
+
+        assert matches == 0
+        assert file_worker._evaluator is not first_evaluator
+
+
 class TestMultipleRecords:
     """Test processing multiple records."""
 
@@ -607,7 +673,8 @@ class TestMultipleRecords:
 
         # Verify all matches
         assert matches == 5
-        assert file_worker.stats_collector.increment_records_matched.call_count == 5
+        batch = file_worker.stats_collector.apply_batch.call_args.args[0]
+        assert batch["records_matched"] == 5
         assert mock_writer.write_result.call_count == 5
 
     def test_process_file_with_mixed_records(
@@ -667,6 +734,7 @@ class TestMultipleRecords:
 
         # Verify only matching records
         assert matches == 2
-        assert file_worker.stats_collector.increment_records_total.call_count == 3
-        assert file_worker.stats_collector.increment_records_matched.call_count == 2
+        batch = file_worker.stats_collector.apply_batch.call_args.args[0]
+        assert batch["records_total"] == 3
+        assert batch["records_matched"] == 2
         assert mock_writer.write_result.call_count == 2